@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: storage and index size of INTEGER vs BIGINT identifiers
+
+Loads the same synthetic rows into the measurement table of the standard
+schema and of the bigint.bigint_metadata() variant and reports table and index
+sizes. Use PostgreSQL (--url postgresql+psycopg://...) for numbers that
+matter: SQLite stores integers with a variable-length encoding, and only an
+INTEGER primary key becomes its rowid, so its sizes are not representative.
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+from typing import Iterator
+
+from sqlalchemy import Connection, MetaData, create_engine, text
+
+from sqlalchemy_omopcdm import ddl
+from sqlalchemy_omopcdm.bigint import bigint_metadata, widened_columns
+from sqlalchemy_omopcdm.bulk import bulk_load
+from sqlalchemy_omopcdm.omopcdm54 import OMOPCDMModelBase
+
+TABLE = "measurement"
+COLUMNS = (
+    "measurement_id",
+    "person_id",
+    "measurement_concept_id",
+    "measurement_date",
+    "measurement_type_concept_id",
+    "visit_occurrence_id",
+    "value_as_number",
+)
+
+
+def synthetic_rows(count: int) -> Iterator[tuple[object, ...]]:
+    """measurement rows spread over count // 100 persons"""
+    start = datetime.date(2000, 1, 1)
+    for i in range(1, count + 1):
+        yield (
+            i,
+            i // 100 + 1,
+            3_000_000 + i % 5_000,
+            start + datetime.timedelta(days=i % 8_000),
+            32_817,
+            i // 5 + 1,
+            i % 200,
+        )
+
+
+def load(connection: Connection, metadata: MetaData, rows: int) -> None:
+    """create the bare table, load it, then add the primary key and indexes"""
+    ddl.create_tables(connection, [TABLE], metadata=metadata)
+    bulk_load(connection, metadata.tables[TABLE], synthetic_rows(rows), columns=COLUMNS)
+    ddl.create_primary_keys(connection, [TABLE], metadata=metadata)
+    ddl.create_indexes(connection, [TABLE], metadata=metadata)
+
+
+def postgres_sizes(url: str, variants: dict[str, MetaData], rows: int) -> None:
+    """load each variant into its own schema and report relation sizes"""
+    engine = create_engine(url)
+    for name, metadata in variants.items():
+        schema = f"bench_{name}"
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+            connection = connection.execution_options(
+                schema_translate_map={None: schema}
+            )
+            load(connection, metadata, rows)
+            connection.execute(text(f"ANALYZE {schema}.{TABLE}"))
+            table_bytes, index_bytes = connection.execute(
+                text(
+                    "SELECT pg_table_size(CAST(:t AS regclass)), "
+                    "pg_indexes_size(CAST(:t AS regclass))"
+                ),
+                {"t": f"{schema}.{TABLE}"},
+            ).one()
+        print(f"{name:>8}: table {table_bytes:>14,} B  indexes {index_bytes:>14,} B")
+
+
+def sqlite_sizes(variants: dict[str, MetaData], rows: int) -> None:
+    """load each variant into its own database file and report file sizes"""
+    with tempfile.TemporaryDirectory() as directory:
+        for name, metadata in variants.items():
+            path = os.path.join(directory, f"{name}.db")
+            with create_engine(f"sqlite:///{path}").begin() as connection:
+                load(connection, metadata, rows)
+            print(f"{name:>8}: database file {os.path.getsize(path):>14,} B")
+
+
+def main() -> None:
+    """entrypoint"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="PostgreSQL URL (default: SQLite files)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    variants = {"integer": OMOPCDMModelBase.metadata, "bigint": bigint_metadata()}
+    widened = [
+        column.name
+        for column in widened_columns(variants["bigint"])
+        if column.table.name == TABLE
+    ]
+    print(f"{TABLE}: {len(widened)} widened columns, +{4 * len(widened)} B/row max")
+    if args.url:
+        postgres_sizes(args.url, variants, args.rows)
+    else:
+        sqlite_sizes(variants, args.rows)
+
+
+if __name__ == "__main__":
+    main()
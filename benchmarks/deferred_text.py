@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fetching Note rows with and without the large_text group deferred
+
+Loads --rows synthetic notes with --text-size characters of note_text each
+and lists them with select(Note), once with all columns and once with
+deferred.defer_groups() applied. Reports the query time and the payload of
+the loaded column values (a close estimate of the result bytes sent by the
+database server).
+
+The notes go into a temporary SQLite file, or with --url into a
+bench_deferred_text schema, which is dropped afterwards.
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+from typing import Any, Iterator
+
+from sqlalchemy import Engine, create_engine, inspect, select, text
+from sqlalchemy.orm import Session, configure_mappers, sessionmaker
+
+from sqlalchemy_omopcdm import ddl
+from sqlalchemy_omopcdm.bulk import bulk_load
+from sqlalchemy_omopcdm.deferred import defer_groups
+from sqlalchemy_omopcdm.omopcdm54 import Note
+
+SCHEMA = "bench_deferred_text"
+
+COLUMNS = (
+    "note_id",
+    "person_id",
+    "note_date",
+    "note_type_concept_id",
+    "note_class_concept_id",
+    "note_title",
+    "note_text",
+    "encoding_concept_id",
+    "language_concept_id",
+)
+
+
+def synthetic_rows(count: int, text_size: int) -> Iterator[tuple[object, ...]]:
+    """note rows with note_text of text_size characters"""
+    start = datetime.date(2000, 1, 1)
+    body = ("lorem ipsum dolor sit amet " * (text_size // 27 + 1))[:text_size]
+    for i in range(1, count + 1):
+        yield (
+            i,
+            i // 10 + 1,
+            start + datetime.timedelta(days=i % 8_000),
+            32_831,
+            44_814_637,
+            f"note {i}",
+            body,
+            32_678,
+            4_180_186,
+        )
+
+
+def payload_bytes(note: Note) -> int:
+    """the size of the loaded column values of note"""
+    values: dict[str, Any] = inspect(note).dict
+    return sum(len(str(value).encode()) for value in values.values())
+
+
+def measure(factory: "sessionmaker[Session]") -> tuple[float, int]:
+    """list all notes; returns the elapsed seconds and the payload bytes"""
+    with factory() as session:
+        started = time.perf_counter()
+        notes = session.scalars(select(Note)).all()
+        elapsed = time.perf_counter() - started
+        return elapsed, sum(payload_bytes(note) for note in notes)
+
+
+def run(engine: Engine, rows: int, text_size: int) -> None:
+    """load the notes and print the timings of both variants"""
+    with engine.begin() as connection:
+        ddl.create_tables(connection, [Note])
+        bulk_load(connection, Note, synthetic_rows(rows, text_size), columns=COLUMNS)
+
+    full = sessionmaker(engine)
+    deferred = sessionmaker(engine)
+    defer_groups(deferred)
+    # configure the mappers and warm the statement caches outside the timings
+    configure_mappers()
+    for factory in (full, deferred):
+        with factory() as session:
+            session.scalars(select(Note).limit(1)).all()
+    results = {
+        "all columns": measure(full),
+        "deferred": measure(deferred),
+    }
+    for name, (elapsed, size) in results.items():
+        print(f"{name:>12}: {elapsed * 1000:8.1f} ms {size:>16,} B")
+
+
+def main() -> None:
+    """entrypoint"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="PostgreSQL URL (default: a SQLite file)")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--text-size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    if args.url is None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "notes.db")
+            run(create_engine(f"sqlite:///{path}"), args.rows, args.text_size)
+        return
+    engine = create_engine(args.url)
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    try:
+        run(
+            engine.execution_options(schema_translate_map={None: SCHEMA}),
+            args.rows,
+            args.text_size,
+        )
+    finally:
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
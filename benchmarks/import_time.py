@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: import time and first-query time
+
+Each run is a fresh interpreter (the median of --repeat runs is shown):
+
+- package: import sqlalchemy_omopcdm (the models are loaded lazily)
+- core tables: import sqlalchemy_omopcdm.omopcdm54_tables (no ORM)
+- model: from sqlalchemy_omopcdm import Concept (defines all models)
+- first query: configure the mappers and run select(Concept) on SQLite
+
+and, in interpreters of their own:
+
+- vocabulary model: from sqlalchemy_omopcdm.vocabulary import Concept (defines
+  the vocabulary models only)
+- vocabulary query: configure those mappers and run select(Concept) on SQLite
+"""
+
+import argparse
+import json
+import statistics
+import subprocess  # nosec B404
+import sys
+
+SNIPPET = """
+import json, time
+started = time.perf_counter()
+import sqlalchemy
+sqlalchemy_loaded = time.perf_counter()
+import sqlalchemy_omopcdm
+package_loaded = time.perf_counter()
+import sqlalchemy_omopcdm.omopcdm54_tables
+tables_loaded = time.perf_counter()
+from sqlalchemy_omopcdm import Concept
+model_loaded = time.perf_counter()
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+engine = create_engine("sqlite://")
+Concept.__table__.create(engine)
+with Session(engine) as session:
+    session.scalars(select(Concept).limit(1)).all()
+queried = time.perf_counter()
+print(json.dumps({
+    "sqlalchemy": sqlalchemy_loaded - started,
+    "package": package_loaded - sqlalchemy_loaded,
+    "core tables": tables_loaded - package_loaded,
+    "model": model_loaded - tables_loaded,
+    "first query": queried - model_loaded,
+}))
+"""
+
+VOCABULARY_SNIPPET = """
+import json, time
+import sqlalchemy
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+import sqlalchemy_omopcdm
+started = time.perf_counter()
+from sqlalchemy_omopcdm.vocabulary import Concept
+model_loaded = time.perf_counter()
+engine = create_engine("sqlite://")
+Concept.__table__.create(engine)
+with Session(engine) as session:
+    session.scalars(select(Concept).limit(1)).all()
+queried = time.perf_counter()
+print(json.dumps({
+    "vocabulary model": model_loaded - started,
+    "vocabulary query": queried - model_loaded,
+}))
+"""
+
+
+def measure(snippet: str) -> dict[str, float]:
+    """run a snippet in a fresh interpreter and return its step timings"""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", snippet], check=True, capture_output=True, text=True
+    )
+    timings: dict[str, float] = json.loads(result.stdout)
+    return timings
+
+
+def main() -> None:
+    """entrypoint"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for snippet in (SNIPPET, VOCABULARY_SNIPPET):
+        runs = [measure(snippet) for _ in range(args.repeat)]
+        for step in runs[0]:
+            median = statistics.median(run[step] for run in runs)
+            print(f"{step:>16}: {median * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: insert speed with all declared indexes vs the lean DDL profile
+
+Creates the concept and concept_ancestor tables with their primary keys and
+indexes, once with every declared index and once with create_indexes(
+lean=True), which skips the indexes duplicating the primary key
+(idx_concept_concept_id, idx_concept_ancestor_id_1), then times loading the
+same synthetic rows into the indexed tables.
+"""
+
+# pylint: disable=duplicate-code
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+from typing import Iterator
+
+from sqlalchemy import Connection, create_engine, text
+
+from sqlalchemy_omopcdm import ddl
+from sqlalchemy_omopcdm.bulk import bulk_load
+from sqlalchemy_omopcdm.omopcdm54 import Concept, ConceptAncestor
+
+TABLES = ("concept", "concept_ancestor")
+CONCEPT_COLUMNS = (
+    "concept_id",
+    "concept_name",
+    "domain_id",
+    "vocabulary_id",
+    "concept_class_id",
+    "concept_code",
+    "valid_start_date",
+    "valid_end_date",
+)
+
+
+def concept_rows(count: int) -> Iterator[tuple[object, ...]]:
+    """synthetic concept rows"""
+    start, end = datetime.date(1970, 1, 1), datetime.date(2099, 12, 31)
+    for i in range(1, count + 1):
+        yield (i, f"concept {i}", "Drug", "RxNorm", "Ingredient", str(i), start, end)
+
+
+def ancestor_rows(count: int) -> Iterator[tuple[object, ...]]:
+    """synthetic concept_ancestor rows, ten ancestors per descendant"""
+    for i in range(count):
+        descendant, level = i // 10 + 1, i % 10
+        yield (descendant + level * 7_919, descendant, level, level)
+
+
+def load(connection: Connection, rows: int, lean: bool) -> float:
+    """create the indexed tables and return the seconds taken to load them"""
+    ddl.create_tables(connection, TABLES)
+    ddl.create_primary_keys(connection, TABLES)
+    ddl.create_indexes(connection, TABLES, lean=lean)
+    started = time.perf_counter()
+    bulk_load(connection, Concept, concept_rows(rows), columns=CONCEPT_COLUMNS)
+    bulk_load(connection, ConceptAncestor, ancestor_rows(rows))
+    return time.perf_counter() - started
+
+
+def postgres_timings(url: str, rows: int) -> dict[str, float]:
+    """load each variant into its own schema"""
+    engine = create_engine(url)
+    timings = {}
+    for name, lean in (("all", False), ("lean", True)):
+        schema = f"bench_{name}_indexes"
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+            connection.execute(text(f"CREATE SCHEMA {schema}"))
+            connection = connection.execution_options(
+                schema_translate_map={None: schema}
+            )
+            timings[name] = load(connection, rows, lean)
+    return timings
+
+
+def sqlite_timings(rows: int) -> dict[str, float]:
+    """load each variant into its own database file"""
+    timings = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, lean in (("all", False), ("lean", True)):
+            path = os.path.join(directory, f"{name}.db")
+            with create_engine(f"sqlite:///{path}").begin() as connection:
+                timings[name] = load(connection, rows, lean)
+    return timings
+
+
+def main() -> None:
+    """entrypoint"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="PostgreSQL URL (default: SQLite files)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for redundant in ddl.find_redundant_indexes(TABLES):
+        print(f"skipped by lean: {redundant.index.name} ({redundant.covered_by})")
+    if args.url:
+        timings = postgres_timings(args.url, args.rows)
+    else:
+        timings = sqlite_timings(args.rows)
+    for name, seconds in timings.items():
+        print(f"{name:>5}: {seconds:8.2f} s {2 * args.rows / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,55 @@
 """ OMOP CDM v5.4 SQLAlchemy Declarative Mapping Models """
 
-from .omopcdm54 import (
-    CareSite,
-    CDMSource,
-    Cohort,
-    CohortDefinition,
-    Concept,
-    ConceptAncestor,
-    ConceptClass,
-    ConceptRelationship,
-    ConceptSynonym,
-    ConditionEra,
-    ConditionOccurrence,
-    Cost,
-    Death,
-    DeviceExposure,
-    Domain,
-    DoseEra,
-    DrugEra,
-    DrugExposure,
-    DrugStrength,
-    Episode,
-    EpisodeEvent,
-    FactRelationship,
-    Location,
-    Measurement,
-    Metadata,
-    Note,
-    NoteNlp,
-    Observation,
-    ObservationPeriod,
-    OMOPCDMModelBase,
-    PayerPlanPeriod,
-    Person,
-    ProcedureOccurrence,
-    Provider,
-    Relationship,
-    SourceToConceptMap,
-    Specimen,
-    VisitDetail,
-    VisitOccurrence,
-    Vocabulary,
-)
+# The models are imported on first access (PEP 562) so that importing the
+# bare package does not pay for defining all of the declarative classes.
+# Submodules (e.g. sqlalchemy_omopcdm.omopcdm54) resolve as attributes too,
+# as they did when the package imported the models eagerly.
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .omopcdm54 import (
+        CareSite,
+        CDMSource,
+        Cohort,
+        CohortDefinition,
+        Concept,
+        ConceptAncestor,
+        ConceptClass,
+        ConceptRelationship,
+        ConceptSynonym,
+        ConditionEra,
+        ConditionOccurrence,
+        Cost,
+        Death,
+        DeviceExposure,
+        Domain,
+        DoseEra,
+        DrugEra,
+        DrugExposure,
+        DrugStrength,
+        Episode,
+        EpisodeEvent,
+        FactRelationship,
+        Location,
+        Measurement,
+        Metadata,
+        Note,
+        NoteNlp,
+        Observation,
+        ObservationPeriod,
+        OMOPCDMModelBase,
+        PayerPlanPeriod,
+        Person,
+        ProcedureOccurrence,
+        Provider,
+        Relationship,
+        SourceToConceptMap,
+        Specimen,
+        VisitDetail,
+        VisitOccurrence,
+        Vocabulary,
+    )
 
 __all__ = (
     "CareSite",
@@ -85,3 +93,24 @@ __all__ = (
     "VisitOccurrence",
     "Vocabulary",
 )
+
+
+def __getattr__(name: str) -> Any:
+    """import the models and submodules lazily, on first access"""
+    if name in __all__:
+        from . import omopcdm54  # pylint: disable=import-outside-toplevel
+
+        value = getattr(omopcdm54, name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """list the lazily imported models along with the module's globals"""
+    return sorted(set(globals()) | set(__all__))
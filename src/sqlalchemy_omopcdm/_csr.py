@@ -0,0 +1,78 @@
+"""Compressed sparse row (CSR) adjacency over concept ids
+
+Shared by the in-memory vocabulary graphs. The distinct source ids are kept
+sorted in one array, and the targets of each source are a contiguous run of a
+second array, with optional per-edge value arrays alongside; a source's run
+is found by bisection. Edges are added in source order, so a graph can be
+built while streaming an ORDER BY query without holding the rows.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Sequence
+
+
+class CSR:
+    """adjacency lists of int targets (plus per-edge values) by int source"""
+
+    __slots__ = ("nodes", "offsets", "targets", "values")
+
+    def __init__(self, value_typecodes: Sequence[str] = ()) -> None:
+        self.nodes = array("i")
+        self.offsets = array("Q", [0])
+        self.targets = array("i")
+        self.values = [array(typecode) for typecode in value_typecodes]
+
+    @classmethod
+    def from_sorted(
+        cls,
+        edges: Iterable[Sequence[int]],
+        value_typecodes: Sequence[str] = (),
+    ) -> "CSR":
+        """build from (source, target, *values) edges sorted by source"""
+        csr = cls(value_typecodes)
+        nodes, offsets, targets = csr.nodes, csr.offsets, csr.targets
+        for source, target, *values in edges:
+            if not nodes or source != nodes[-1]:
+                if nodes and source < nodes[-1]:
+                    raise ValueError("edges are not sorted by source")
+                if nodes:
+                    offsets.append(len(targets))
+                nodes.append(source)
+            targets.append(target)
+            for column, value in zip(csr.values, values):
+                column.append(value)
+        if nodes:
+            offsets.append(len(targets))
+        return csr
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Sequence[int]],
+        value_typecodes: Sequence[str] = (),
+    ) -> "CSR":
+        """build from (source, target, *values) edges in any order"""
+        return cls.from_sorted(sorted(map(tuple, edges)), value_typecodes)
+
+    def span(self, source: int) -> range:
+        """the positions of the edges of source in targets and values"""
+        position = bisect_left(self.nodes, source)
+        if position == len(self.nodes) or self.nodes[position] != source:
+            return range(0)
+        return range(self.offsets[position], self.offsets[position + 1])
+
+    def __contains__(self, source: int) -> bool:
+        return bool(self.span(source))
+
+    def __len__(self) -> int:
+        """the number of edges"""
+        return len(self.targets)
+
+    @property
+    def nbytes(self) -> int:
+        """the memory used by the arrays"""
+        return sum(
+            len(column) * column.itemsize
+            for column in (self.nodes, self.offsets, self.targets, *self.values)
+        )
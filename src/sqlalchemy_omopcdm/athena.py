@@ -0,0 +1,164 @@
+"""Loading of Athena vocabulary release files into the vocabulary tables
+
+Athena (https://athena.ohdsi.org/) ships the standardized vocabularies as
+tab-delimited files with a header row, unquoted values and YYYYMMDD dates.
+"""
+
+import csv
+import datetime
+import functools
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import Connection, Date, Table
+
+from .bulk import DEFAULT_CHUNK_SIZE, bulk_load, supports_copy, table_for, value_parser
+from .omopcdm54 import (
+    Concept,
+    ConceptAncestor,
+    ConceptClass,
+    ConceptRelationship,
+    ConceptSynonym,
+    Domain,
+    DrugStrength,
+    OMOPCDMModelBase,
+    Relationship,
+    Vocabulary,
+)
+
+logger = logging.getLogger(__name__)
+
+# Load order: the first four tables reference each other (e.g. concept.domain_id
+# -> domain and domain.domain_concept_id -> concept) so no order satisfies their
+# foreign keys; create those foreign keys after loading. Every later table only
+# references tables loaded before it.
+ATHENA_FILES: tuple[tuple[str, type[OMOPCDMModelBase]], ...] = (
+    ("CONCEPT.csv", Concept),
+    ("VOCABULARY.csv", Vocabulary),
+    ("DOMAIN.csv", Domain),
+    ("CONCEPT_CLASS.csv", ConceptClass),
+    ("RELATIONSHIP.csv", Relationship),
+    ("CONCEPT_RELATIONSHIP.csv", ConceptRelationship),
+    ("CONCEPT_SYNONYM.csv", ConceptSynonym),
+    ("CONCEPT_ANCESTOR.csv", ConceptAncestor),
+    ("DRUG_STRENGTH.csv", DrugStrength),
+)
+
+
+@dataclass(frozen=True)
+class FileLoadStats:
+    """the outcome of loading one Athena file"""
+
+    filename: str
+    table: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """load throughput for the file"""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+@functools.cache
+def parse_date(value: str) -> datetime.date:
+    """
+    parse an Athena YYYYMMDD date; vocabulary files repeat a small set of dates
+    (e.g. 19700101, 20991231) across millions of rows, so results are memoized
+    """
+    return datetime.date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+def _parsers(table: Table, names: list[str]) -> list[Callable[[str], Any]]:
+    """value parsers for the given columns, using parse_date for dates"""
+    parsers: list[Callable[[str], Any]] = []
+    for name in names:
+        type_ = table.columns[name].type
+        if isinstance(type_, Date):
+            parsers.append(parse_date)
+        else:
+            parsers.append(value_parser(type_))
+    return parsers
+
+
+def read_athena_file(
+    file: Iterable[str],
+    table: Table,
+    names: list[str],
+) -> Iterator[tuple[Any, ...]]:
+    """parse the (headerless) lines of an Athena file into typed tuples"""
+    parsers = _parsers(table, names)
+    for record in csv.reader(file, delimiter="\t", quoting=csv.QUOTE_NONE):
+        yield tuple(
+            parse(value) if value else None for parse, value in zip(parsers, record)
+        )
+
+
+def load_athena_file(
+    connection: Connection,
+    path: str,
+    model: type[OMOPCDMModelBase],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> FileLoadStats:
+    """
+    stream one Athena file into the table of the given model; the column order
+    is taken from the file's header row
+    """
+    table = table_for(model)
+    started = time.perf_counter()
+    with open(path, encoding="utf-8", newline="") as file:
+        names = file.readline().rstrip("\r\n").lower().split("\t")
+        if supports_copy(connection):
+            rows = bulk_load(connection, table, file, columns=names)
+        else:
+            rows = bulk_load(
+                connection,
+                table,
+                read_athena_file(file, table, names),
+                columns=names,
+                chunk_size=chunk_size,
+            )
+    stats = FileLoadStats(
+        filename=os.path.basename(path),
+        table=table.name,
+        rows=rows,
+        seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "loaded %s rows from %s into %s in %.1fs (%.0f rows/sec)",
+        stats.rows,
+        stats.filename,
+        stats.table,
+        stats.seconds,
+        stats.rows_per_second,
+    )
+    return stats
+
+
+def load_athena_release(
+    connection: Connection,
+    directory: str,
+    *,
+    tables: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[FileLoadStats]:
+    """
+    load the files of an unpacked Athena release in ATHENA_FILES order,
+    optionally limited to the given table names; files missing from the release
+    are skipped. Returns the per-file load statistics.
+    """
+    wanted = None if tables is None else set(tables)
+    results = []
+    for filename, model in ATHENA_FILES:
+        if wanted is not None and model.__tablename__ not in wanted:
+            continue
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            logger.warning("skipping %s: not found in %s", filename, directory)
+            continue
+        results.append(load_athena_file(connection, path, model, chunk_size=chunk_size))
+    return results
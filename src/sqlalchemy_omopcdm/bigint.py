@@ -0,0 +1,95 @@
+"""64-bit identifier variant of the OMOP CDM schema
+
+The generated models declare every *_id column as INTEGER, which caps the
+clinical event tables at 2^31 - 1 rows. bigint_metadata() returns a copy of the
+model metadata in which the event tables' primary keys, every column with a
+foreign key to one of them, and the untyped event references (e.g.
+measurement_event_id, fact_id_1) are BIGINT. Concept ids stay INTEGER.
+
+The copy keeps all constraints and indexes and can be passed to the ddl
+functions or used with create_all(); the ORM models work unchanged against a
+database created from it, since both types map to python int.
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import BigInteger, Column, MetaData
+
+from .ddl import copy_metadata
+
+# tables whose primary key identifies a person or a clinical event
+EVENT_TABLES = (
+    "condition_era",
+    "condition_occurrence",
+    "cost",
+    "device_exposure",
+    "dose_era",
+    "drug_era",
+    "drug_exposure",
+    "episode",
+    "measurement",
+    "note",
+    "note_nlp",
+    "observation",
+    "observation_period",
+    "payer_plan_period",
+    "person",
+    "procedure_occurrence",
+    "specimen",
+    "visit_detail",
+    "visit_occurrence",
+)
+
+# columns which hold person or event ids without a declared foreign key
+EVENT_REFERENCE_COLUMNS = (
+    ("cohort", "subject_id"),
+    ("cost", "cost_event_id"),
+    ("cost", "payer_plan_period_id"),
+    ("episode", "episode_parent_id"),
+    ("episode_event", "event_id"),
+    ("fact_relationship", "fact_id_1"),
+    ("fact_relationship", "fact_id_2"),
+    ("measurement", "measurement_event_id"),
+    ("note", "note_event_id"),
+    ("note_nlp", "note_id"),
+    ("observation", "observation_event_id"),
+)
+
+
+def widened_columns(
+    metadata: MetaData,
+    tables: Iterable[str] = EVENT_TABLES,
+) -> list[Column[int]]:
+    """the columns of metadata which the BIGINT variant widens"""
+    event_tables = set(tables)
+    widened: dict[tuple[str, str], Column[int]] = {}
+    for table in metadata.tables.values():
+        if table.name in event_tables:
+            for column in table.primary_key.columns:
+                widened[(table.name, column.name)] = column
+    for table in metadata.tables.values():
+        for constraint in table.foreign_key_constraints:
+            for element in constraint.elements:
+                referred = element.column
+                if (referred.table.name, referred.name) in widened:
+                    widened[(table.name, element.parent.name)] = element.parent
+    for table_name, column_name in EVENT_REFERENCE_COLUMNS:
+        if table_name in metadata.tables:
+            widened[(table_name, column_name)] = metadata.tables[table_name].c[
+                column_name
+            ]
+    return list(widened.values())
+
+
+def bigint_metadata(
+    metadata: Optional[MetaData] = None,
+    tables: Iterable[str] = EVENT_TABLES,
+) -> MetaData:
+    """
+    return a copy of metadata (default: the model metadata) with BIGINT
+    identifiers for the given event tables and everything referencing them
+    """
+    copy = copy_metadata(metadata)
+    for column in widened_columns(copy, tables):
+        column.type = BigInteger()
+    return copy
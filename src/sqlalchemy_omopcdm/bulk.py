@@ -0,0 +1,276 @@
+"""Bulk loading of rows into OMOP CDM tables
+
+Rows are streamed through PostgreSQL's ``COPY ... FROM STDIN`` when the
+connection uses psycopg (3) or psycopg2, and through chunked ``insert()``
+executemany (which SQLAlchemy turns into "insertmanyvalues" batches where the
+dialect supports it) everywhere else, e.g. on SQLite. Both honour the
+connection's schema_translate_map.
+"""
+
+# pylint: disable=too-many-arguments
+import csv
+import datetime
+import decimal
+import io
+import itertools
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional, Union
+
+from sqlalchemy import Connection, Date, DateTime, Integer, Numeric, Table, insert
+from sqlalchemy.types import TypeEngine
+
+from .omopcdm54 import OMOPCDMModelBase
+
+DEFAULT_CHUNK_SIZE = 10_000
+COPY_DRIVERS = ("psycopg", "psycopg2")
+
+ModelOrTable = Union[type[OMOPCDMModelBase], Table]
+Row = Union[tuple[Any, ...], list[Any], Mapping[str, Any]]
+Rows = Union[Iterable[Row], IO[str]]
+
+
+def table_for(model: ModelOrTable) -> Table:
+    """return the Table behind the given model class (or the Table itself)"""
+    if isinstance(model, Table):
+        return model
+    table = model.__table__
+    if not isinstance(table, Table):
+        raise TypeError(f"{model!r} is not mapped to a Table")
+    return table
+
+
+def translated_schema(connection: Connection, table: Table) -> Optional[str]:
+    """
+    the schema the table is in on the given connection, after its
+    schema_translate_map execution option
+    """
+    translate = connection.get_execution_options().get("schema_translate_map")
+    if translate and table.schema in translate:
+        return translate[table.schema]
+    return table.schema
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """yield lists of at most size items from the given iterable"""
+    if size < 1:
+        raise ValueError(f"chunk size must be positive, got {size}")
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def value_parser(type_: TypeEngine[Any]) -> Callable[[str], Any]:
+    """return a function which converts delimited-text values to python values"""
+    if isinstance(type_, DateTime):
+        return datetime.datetime.fromisoformat
+    if isinstance(type_, Date):
+        return datetime.date.fromisoformat
+    if isinstance(type_, Integer):
+        return int
+    if isinstance(type_, Numeric):
+        return decimal.Decimal
+    return str
+
+
+def resolve_columns(table: Table, columns: Optional[Iterable[str]]) -> list[str]:
+    """validate the requested column names, defaulting to all table columns"""
+    if columns is None:
+        return [column.name for column in table.columns]
+    names = list(columns)
+    unknown = [name for name in names if name not in table.columns]
+    if unknown:
+        raise ValueError(f"unknown columns for table {table.name}: {unknown}")
+    return names
+
+
+def as_row_tuple(row: Row, names: list[str]) -> tuple[Any, ...]:
+    """return the given row as a tuple in column order"""
+    if isinstance(row, Mapping):
+        return tuple(row.get(name) for name in names)
+    if len(row) != len(names):
+        raise ValueError(f"expected {len(names)} values per row, got {len(row)}")
+    return tuple(row)
+
+
+def _parse_file(
+    file: IO[str],
+    table: Table,
+    names: list[str],
+    delimiter: str,
+    null: str,
+    header: bool,
+) -> Iterator[tuple[Any, ...]]:
+    """parse delimited text into typed tuples (used by the non-COPY path)"""
+    parsers = [value_parser(table.columns[name].type) for name in names]
+    reader = csv.reader(file, delimiter=delimiter, quoting=csv.QUOTE_NONE)
+    if header:
+        next(reader, None)
+    for record in reader:
+        yield tuple(
+            None if value == null else parse(value)
+            for parse, value in zip(parsers, record)
+        )
+
+
+def _copy_text(value: Any) -> str:
+    """format a python value for COPY's text format"""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_statement(
+    connection: Connection,
+    table: Table,
+    names: list[str],
+    options: str,
+) -> str:
+    """return the COPY ... FROM STDIN statement for the given columns"""
+    preparer = connection.dialect.identifier_preparer
+    schema = translated_schema(connection, table)
+    target = preparer.quote(table.name)
+    if schema is not None:
+        target = f"{preparer.quote_schema(schema)}.{target}"
+    column_list = ", ".join(preparer.quote(name) for name in names)
+    return f"COPY {target} ({column_list}) FROM STDIN {options}"
+
+
+def _file_copy_options(delimiter: str, null: str, header: bool) -> str:
+    """COPY options for delimited text files, with quoting disabled"""
+    delimiter_literal = delimiter.replace("'", "''")
+    null_literal = null.replace("'", "''")
+    return (
+        f"WITH (FORMAT csv, DELIMITER '{delimiter_literal}', NULL '{null_literal}', "
+        f"QUOTE E'\\b', HEADER {'true' if header else 'false'})"
+    )
+
+
+def _copy_rows(
+    connection: Connection,
+    table: Table,
+    names: list[str],
+    rows: Iterable[Row],
+    chunk_size: int,
+) -> int:
+    """stream row tuples through COPY in chunks of chunk_size rows"""
+    statement = _copy_statement(connection, table, names, "")
+    cursor = connection.connection.cursor()
+    count = 0
+    try:
+        if hasattr(cursor, "copy"):  # psycopg (3)
+            with cursor.copy(statement) as copy:
+                for chunk in chunked(rows, chunk_size):
+                    for row in chunk:
+                        copy.write_row(as_row_tuple(row, names))
+                    count += len(chunk)
+        else:  # psycopg2
+            for chunk in chunked(rows, chunk_size):
+                buffer = io.StringIO()
+                for row in chunk:
+                    buffer.write("\t".join(map(_copy_text, as_row_tuple(row, names))))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(statement, buffer)
+                count += len(chunk)
+    finally:
+        cursor.close()
+    return count
+
+
+def _copy_file(
+    connection: Connection,
+    table: Table,
+    names: list[str],
+    file: IO[str],
+    delimiter: str,
+    null: str,
+    header: bool,
+    block_size: int = 1 << 20,
+) -> int:
+    """stream a delimited text file through COPY without parsing it in python"""
+    options = _file_copy_options(delimiter, null, header)
+    statement = _copy_statement(connection, table, names, options)
+    cursor = connection.connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):  # psycopg (3)
+            with cursor.copy(statement) as copy:
+                while block := file.read(block_size):
+                    copy.write(block)
+        else:  # psycopg2
+            cursor.copy_expert(statement, file, size=block_size)
+        return int(cursor.rowcount)
+    finally:
+        cursor.close()
+
+
+def supports_copy(connection: Connection) -> bool:
+    """true if rows can be streamed through COPY on the given connection"""
+    return (
+        connection.dialect.name == "postgresql"
+        and connection.dialect.driver in COPY_DRIVERS
+    )
+
+
+def insert_rows(
+    connection: Connection,
+    model: ModelOrTable,
+    rows: Iterable[Row],
+    *,
+    columns: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    insert rows with chunked executemany; this is the fallback used by bulk_load
+    for dialects/drivers without COPY support
+    """
+    table = table_for(model)
+    names = resolve_columns(table, columns)
+    statement = insert(table)
+    count = 0
+    for chunk in chunked(rows, chunk_size):
+        connection.execute(
+            statement, [dict(zip(names, as_row_tuple(row, names))) for row in chunk]
+        )
+        count += len(chunk)
+    return count
+
+
+def bulk_load(
+    connection: Connection,
+    model: ModelOrTable,
+    rows: Rows,
+    *,
+    columns: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    delimiter: str = "\t",
+    null: str = "",
+    header: bool = False,
+) -> int:
+    """
+    load rows into the table of the given model (e.g. Measurement), returning
+    the number of rows loaded
+
+    rows may be an iterable of tuples (in column order) or dicts (keyed by
+    column name), or a text file object containing delimited data; columns
+    defaults to every column of the model's table, in declaration order.
+    delimiter, null and header only apply to file objects.
+
+    On PostgreSQL with psycopg/psycopg2 the data is streamed through COPY;
+    otherwise it is inserted in executemany batches of chunk_size rows. The
+    caller owns the transaction.
+    """
+    table = table_for(model)
+    names = resolve_columns(table, columns)
+    if hasattr(rows, "read"):
+        file: IO[str] = rows  # type: ignore[assignment]
+        if supports_copy(connection):
+            return _copy_file(connection, table, names, file, delimiter, null, header)
+        rows = _parse_file(file, table, names, delimiter, null, header)
+    if supports_copy(connection):
+        return _copy_rows(connection, table, names, rows, chunk_size)
+    return insert_rows(connection, table, rows, columns=names, chunk_size=chunk_size)
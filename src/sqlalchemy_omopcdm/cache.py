@@ -0,0 +1,183 @@
+"""In-process cache of vocabulary rows with bulk prefetch and LRU eviction
+
+VocabularyCache keeps Concept, Domain, Vocabulary, ConceptClass and
+Relationship rows by primary key. Rows are cached as immutable Core Row
+objects (with the columns of the table), so they can be shared between
+sessions and threads. get_many() fetches all misses with one IN query per
+chunk, and ids which do not exist are cached too:
+
+    cache = VocabularyCache(maxsize=200_000)
+    concepts = cache.get_many(session, Concept, [m.unit_concept_id for m in rows])
+    concepts[8_876].concept_name
+
+The cache is keyed on the vocabulary version (the vocabulary_version of the
+'None' row of the vocabulary table, else of cdm_source). The version is
+re-read at most every version_check_interval seconds, and a change, e.g.
+after loading a new Athena release, empties the cache.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, Optional, Union
+
+from sqlalchemy import Connection, Table, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from .bulk import ModelOrTable, chunked, table_for
+from .omopcdm54 import (
+    CDMSource,
+    Concept,
+    ConceptClass,
+    Domain,
+    Relationship,
+    Vocabulary,
+)
+
+Bind = Union[Connection, Session]
+
+CACHED_MODELS = (Concept, ConceptClass, Domain, Relationship, Vocabulary)
+
+# keys per IN query when fetching misses
+FETCH_BATCH = 10_000
+
+# cached for keys which are not in the database
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """counters of a VocabularyCache"""
+
+    hits: int
+    misses: int
+    size: int
+    version: Optional[str]
+
+    @property
+    def hit_rate(self) -> float:
+        """hits / lookups, 0.0 before the first lookup"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def vocabulary_version(bind: Bind) -> Optional[str]:
+    """
+    the loaded vocabulary version: the vocabulary_version of the 'None'
+    vocabulary row, else that of the (first) cdm_source row
+    """
+    version = bind.execute(
+        select(Vocabulary.vocabulary_version).where(Vocabulary.vocabulary_id == "None")
+    ).scalar()
+    if version is None:
+        version = bind.execute(select(CDMSource.vocabulary_version).limit(1)).scalar()
+    return version
+
+
+class VocabularyCache:  # pylint: disable=too-many-instance-attributes
+    """
+    a bounded, thread-safe LRU cache of vocabulary table rows by primary key,
+    emptied when the vocabulary version changes; with version_check_interval
+    None the version is only re-read by check_version(bind, force=True)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 100_000,
+        *,
+        version_check_interval: Optional[float] = 60.0,
+    ) -> None:
+        self.maxsize = maxsize
+        self.version_check_interval = version_check_interval
+        self.version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self._rows: OrderedDict[tuple[str, Hashable], Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version_checked: Optional[float] = None
+
+    @staticmethod
+    def _table(model: ModelOrTable) -> Table:
+        """the table of a cached model, with its single column primary key"""
+        table = table_for(model)
+        if table not in [table_for(cached) for cached in CACHED_MODELS]:
+            raise ValueError(f"not a cached vocabulary table: {table.name}")
+        return table
+
+    def clear(self) -> None:
+        """empty the cache and reset the counters"""
+        with self._lock:
+            self._rows.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def check_version(self, bind: Bind, *, force: bool = False) -> None:
+        """
+        re-read the vocabulary version if version_check_interval has passed
+        (or force), and empty the cache if it changed
+        """
+        now = time.monotonic()
+        if not force and self._version_checked is not None:
+            if self.version_check_interval is None or (
+                now - self._version_checked < self.version_check_interval
+            ):
+                return
+        version = vocabulary_version(bind)
+        with self._lock:
+            self._version_checked = now
+            if version != self.version:
+                self._rows.clear()
+                self.version = version
+
+    def get(self, bind: Bind, model: ModelOrTable, key: Hashable) -> Optional[Row[Any]]:
+        """the row with the given primary key, or None"""
+        return self.get_many(bind, model, [key]).get(key)
+
+    def get_many(
+        self,
+        bind: Bind,
+        model: ModelOrTable,
+        keys: Iterable[Hashable],
+    ) -> dict[Hashable, Row[Any]]:
+        """
+        the rows with the given primary keys, fetching the ones not cached
+        with one IN query per FETCH_BATCH keys; missing keys are left out
+        """
+        table = self._table(model)
+        self.check_version(bind)
+        found: dict[Hashable, Row[Any]] = {}
+        missed = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                cache_key = (table.name, key)
+                if cache_key in self._rows:
+                    self._rows.move_to_end(cache_key)
+                    self.hits += 1
+                    if self._rows[cache_key] is not _MISSING:
+                        found[key] = self._rows[cache_key]
+                else:
+                    self.misses += 1
+                    missed.append(key)
+
+        (column,) = table.primary_key.columns
+        position = list(table.columns).index(column)
+        for batch in chunked(missed, FETCH_BATCH):
+            fetched = {
+                row[position]: row
+                for row in bind.execute(select(table).where(column.in_(batch)))
+            }
+            found.update(fetched)
+            with self._lock:
+                for key in batch:
+                    self._rows[(table.name, key)] = fetched.get(key, _MISSING)
+                while len(self._rows) > self.maxsize:
+                    self._rows.popitem(last=False)
+        return found
+
+    @property
+    def stats(self) -> CacheStats:
+        """the current counters"""
+        with self._lock:
+            return CacheStats(self.hits, self.misses, len(self._rows), self.version)
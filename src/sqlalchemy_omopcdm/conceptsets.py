@@ -0,0 +1,292 @@
+"""Compiler for ATLAS concept set expressions
+
+An ATLAS concept set expression is a list of concepts, each with the flags
+isExcluded, includeDescendants and includeMapped. It resolves, like the
+OHDSI circe-be SQL, to
+
+    (included - excluded) | (mapped(included) - mapped(excluded))
+
+where included and excluded are the concepts of the non-excluded and
+excluded items plus the valid descendants (via concept_ancestor) of those
+with includeDescendants, and mapped() of the items with includeMapped are
+the source concepts which "Maps to" them (via concept_relationship).
+
+concept_set_select() compiles an expression to one SELECT built from UNION
+and EXCEPT of set queries, with one IN list per set rather than one subquery
+per item. ConceptSetCompiler evaluates expressions with that query or in
+memory, from an ancestry.ConceptAncestorGraph and a mapsto.MapsToResolver
+loaded with the "Mapped from" relationship, and memoizes the results by
+backend, a hash of the expression and the vocabulary version:
+
+    compiler = ConceptSetCompiler()
+    expression = ConceptSetExpression.from_json(atlas_json)
+    concept_ids = compiler.resolve(connection, expression)
+
+In memory, the item concepts themselves are taken as given, while the query
+only returns concepts present in the concept table, and descendants are
+not checked for invalid_reason (concept_ancestor only holds valid standard
+concepts in the Athena releases).
+"""
+
+# pylint: disable=too-many-arguments
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from sqlalchemy import Select, except_, false, select, union
+
+from .ancestry import ConceptAncestorGraph
+from .cache import Bind, vocabulary_version
+from .mapsto import MAPPED_FROM, MAPS_TO, MapsToResolver
+from .omopcdm54 import Concept, ConceptAncestor, ConceptRelationship
+
+
+@dataclass(frozen=True)
+class ConceptSetItem:
+    """one concept of a concept set expression and its flags"""
+
+    concept_id: int
+    is_excluded: bool = False
+    include_descendants: bool = False
+    include_mapped: bool = False
+
+
+@dataclass(frozen=True)
+class ConceptSetExpression:
+    """the items of an ATLAS concept set expression"""
+
+    items: tuple[ConceptSetItem, ...]
+
+    @classmethod
+    def from_json(
+        cls, expression: Union[str, Mapping[str, Any]]
+    ) -> "ConceptSetExpression":
+        """
+        parse an ATLAS concept set expression ({"items": [{"concept":
+        {"CONCEPT_ID": ...}, "isExcluded": ..., ...}]}), as JSON or decoded
+        """
+        decoded: Mapping[str, Any] = (
+            json.loads(expression) if isinstance(expression, str) else expression
+        )
+        return cls(
+            tuple(
+                ConceptSetItem(
+                    int(item["concept"]["CONCEPT_ID"]),
+                    bool(item.get("isExcluded", False)),
+                    bool(item.get("includeDescendants", False)),
+                    bool(item.get("includeMapped", False)),
+                )
+                for item in decoded["items"]
+            )
+        )
+
+    def fingerprint(self) -> str:
+        """a hash of the items, independent of their order and duplicates"""
+        items = sorted({tuple(asdict(item).values()) for item in self.items})
+        return hashlib.sha256(json.dumps(items).encode()).hexdigest()
+
+
+# (backend, expression fingerprint, vocabulary version)
+CacheKey = tuple[str, str, Optional[str]]
+
+
+def _select_concept_ids(statement: Any) -> Select[tuple[int]]:
+    """a compound select wrapped as a plain SELECT of its concept ids"""
+    subquery = statement.subquery()
+    return select(subquery.c[0])
+
+
+def _set_select(items: Sequence[ConceptSetItem]) -> Optional[Select[tuple[int]]]:
+    """the concepts of the items plus the valid descendants, or None"""
+    if not items:
+        return None
+    concepts = select(Concept.concept_id).where(
+        Concept.concept_id.in_(sorted({item.concept_id for item in items}))
+    )
+    ancestors = sorted({item.concept_id for item in items if item.include_descendants})
+    if not ancestors:
+        return concepts
+    descendants = (
+        select(ConceptAncestor.descendant_concept_id)
+        .join(Concept, Concept.concept_id == ConceptAncestor.descendant_concept_id)
+        .where(
+            ConceptAncestor.ancestor_concept_id.in_(ancestors),
+            Concept.invalid_reason.is_(None),
+        )
+    )
+    return _select_concept_ids(union(concepts, descendants))
+
+
+def _mapped_select(items: Sequence[ConceptSetItem]) -> Optional[Select[tuple[int]]]:
+    """the source concepts mapped to the set of the items, or None"""
+    targets = _set_select(items)
+    if targets is None:
+        return None
+    return select(ConceptRelationship.concept_id_1).where(
+        ConceptRelationship.concept_id_2.in_(targets),
+        ConceptRelationship.relationship_id == MAPS_TO,
+        ConceptRelationship.invalid_reason.is_(None),
+    )
+
+
+def _difference(
+    included: Optional[Select[tuple[int]]],
+    excluded: Optional[Select[tuple[int]]],
+) -> Optional[Select[tuple[int]]]:
+    """included EXCEPT excluded"""
+    if included is None or excluded is None:
+        return included
+    return _select_concept_ids(except_(included, excluded))
+
+
+def concept_set_select(expression: ConceptSetExpression) -> Select[tuple[int]]:
+    """one SELECT of the concept_ids the expression resolves to"""
+    included = [item for item in expression.items if not item.is_excluded]
+    excluded = [item for item in expression.items if item.is_excluded]
+    parts = [
+        part
+        for part in (
+            _difference(_set_select(included), _set_select(excluded)),
+            _difference(
+                _mapped_select([item for item in included if item.include_mapped]),
+                _mapped_select([item for item in excluded if item.include_mapped]),
+            ),
+        )
+        if part is not None
+    ]
+    if not parts:
+        return select(Concept.concept_id).where(false())
+    if len(parts) == 1:
+        return parts[0]
+    return _select_concept_ids(union(*parts))
+
+
+def _evaluate_set(
+    items: Sequence[ConceptSetItem], graph: ConceptAncestorGraph
+) -> set[int]:
+    """the concepts of the items plus their descendants, in memory"""
+    concepts = {item.concept_id for item in items}
+    concepts |= graph.descendants(
+        item.concept_id for item in items if item.include_descendants
+    )
+    return concepts
+
+
+def _evaluate_mapped(
+    items: Sequence[ConceptSetItem],
+    graph: ConceptAncestorGraph,
+    mapped_from: MapsToResolver,
+) -> set[int]:
+    """the source concepts mapped to the set of the items, in memory"""
+    return {
+        source
+        for target in _evaluate_set(items, graph)
+        for source in mapped_from.targets(target, MAPPED_FROM)
+    }
+
+
+class ConceptSetCompiler:  # pylint: disable=too-many-instance-attributes
+    """
+    resolves concept set expressions, in the database or in memory, keeping
+    the last maxsize results by backend, expression and vocabulary version;
+    the database version is re-read at most every version_check_interval
+    seconds (as for cache.VocabularyCache)
+    """
+
+    def __init__(
+        self,
+        graph: Optional[ConceptAncestorGraph] = None,
+        mapped_from: Optional[MapsToResolver] = None,
+        *,
+        version: Optional[str] = None,
+        maxsize: int = 1_024,
+        version_check_interval: Optional[float] = 60.0,
+    ) -> None:
+        self.graph = graph
+        self.mapped_from = mapped_from
+        self.version = version
+        self.maxsize = maxsize
+        self.version_check_interval = version_check_interval
+        self.database_version: Optional[str] = None
+        self._version_checked: Optional[float] = None
+        self._results: OrderedDict[CacheKey, frozenset[int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cached(self, key: CacheKey) -> Optional[frozenset[int]]:
+        """a memoized result, or None"""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def _store(self, key: CacheKey, result: frozenset[int]) -> frozenset[int]:
+        """memoize a result"""
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def check_version(self, bind: Bind, *, force: bool = False) -> Optional[str]:
+        """
+        the database vocabulary version, re-read if version_check_interval
+        has passed (or force)
+        """
+        now = time.monotonic()
+        if (
+            force
+            or self._version_checked is None
+            or (
+                self.version_check_interval is not None
+                and now - self._version_checked >= self.version_check_interval
+            )
+        ):
+            version = vocabulary_version(bind)
+            with self._lock:
+                self.database_version = version
+                self._version_checked = now
+        return self.database_version
+
+    def resolve(self, bind: Bind, expression: ConceptSetExpression) -> frozenset[int]:
+        """the concept ids of the expression, using concept_set_select()"""
+        key = ("database", expression.fingerprint(), self.check_version(bind))
+        result = self._cached(key)
+        if result is None:
+            result = self._store(
+                key, frozenset(bind.execute(concept_set_select(expression)).scalars())
+            )
+        return result
+
+    def evaluate(self, expression: ConceptSetExpression) -> frozenset[int]:
+        """
+        the concept ids of the expression, in memory; the results are keyed
+        on the version given for the graph and resolver
+        """
+        if self.graph is None:
+            raise ValueError("evaluate needs a ConceptAncestorGraph")
+        key = ("memory", expression.fingerprint(), self.version)
+        result = self._cached(key)
+        if result is not None:
+            return result
+        included = [item for item in expression.items if not item.is_excluded]
+        excluded = [item for item in expression.items if item.is_excluded]
+        concepts = _evaluate_set(included, self.graph) - _evaluate_set(
+            excluded, self.graph
+        )
+        mapped_included = [item for item in included if item.include_mapped]
+        if mapped_included:
+            if self.mapped_from is None:
+                raise ValueError("includeMapped needs a Mapped from resolver")
+            concepts |= _evaluate_mapped(
+                mapped_included, self.graph, self.mapped_from
+            ) - _evaluate_mapped(
+                [item for item in excluded if item.include_mapped],
+                self.graph,
+                self.mapped_from,
+            )
+        return self._store(key, frozenset(concepts))
@@ -0,0 +1,97 @@
+"""Portable day arithmetic on DATE columns
+
+SQL dialects disagree on adding days to a date and on the number of days
+between two dates. date_add() and date_diff() compile to the native form of
+PostgreSQL (the default), SQLite, SQL Server and MySQL:
+
+    select(date_add(DrugExposure.drug_exposure_start_date, DrugExposure.days_supply))
+"""
+
+from typing import Any, Union
+
+from sqlalchemy import Date, Integer, literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
+
+# pylint: disable=abstract-method,too-many-ancestors,too-few-public-methods
+# pylint: disable=useless-parent-delegation
+
+
+class date_add(FunctionElement[Any]):  # pylint: disable=invalid-name
+    """date + days, for a DATE and an integer number of days"""
+
+    type = Date()
+    name = "date_add"
+    inherit_cache = True
+
+    def __init__(self, date: Any, days: Union[int, Any]) -> None:
+        if isinstance(days, int):
+            days = literal(days, Integer())
+        super().__init__(date, days)
+
+
+class date_diff(FunctionElement[Any]):  # pylint: disable=invalid-name
+    """the number of days from start to end, for two DATEs"""
+
+    type = Integer()
+    name = "date_diff"
+    inherit_cache = True
+
+    def __init__(self, end: Any, start: Any) -> None:
+        super().__init__(end, start)
+
+
+def _arguments(
+    element: FunctionElement[Any], compiler: SQLCompiler, **kw: Any
+) -> list[str]:
+    """the compiled arguments of a function element"""
+    return [compiler.process(clause, **kw) for clause in element.clauses]
+
+
+@compiles(date_add)
+def _date_add(element: date_add, compiler: SQLCompiler, **kw: Any) -> str:
+    date, days = _arguments(element, compiler, **kw)
+    return f"({date} + {days})"
+
+
+@compiles(date_add, "sqlite")
+def _date_add_sqlite(element: date_add, compiler: SQLCompiler, **kw: Any) -> str:
+    date, days = _arguments(element, compiler, **kw)
+    return f"date({date}, ({days}) || ' days')"
+
+
+@compiles(date_add, "mssql")
+def _date_add_mssql(element: date_add, compiler: SQLCompiler, **kw: Any) -> str:
+    date, days = _arguments(element, compiler, **kw)
+    return f"DATEADD(day, {days}, {date})"
+
+
+@compiles(date_add, "mysql")
+def _date_add_mysql(element: date_add, compiler: SQLCompiler, **kw: Any) -> str:
+    date, days = _arguments(element, compiler, **kw)
+    return f"DATE_ADD({date}, INTERVAL ({days}) DAY)"
+
+
+@compiles(date_diff)
+def _date_diff(element: date_diff, compiler: SQLCompiler, **kw: Any) -> str:
+    end, start = _arguments(element, compiler, **kw)
+    return f"({end} - {start})"
+
+
+@compiles(date_diff, "sqlite")
+def _date_diff_sqlite(element: date_diff, compiler: SQLCompiler, **kw: Any) -> str:
+    end, start = _arguments(element, compiler, **kw)
+    return f"CAST(julianday({end}) - julianday({start}) AS INTEGER)"
+
+
+@compiles(date_diff, "mssql")
+def _date_diff_mssql(element: date_diff, compiler: SQLCompiler, **kw: Any) -> str:
+    end, start = _arguments(element, compiler, **kw)
+    return f"DATEDIFF(day, {start}, {end})"
+
+
+@compiles(date_diff, "mysql")
+def _date_diff_mysql(element: date_diff, compiler: SQLCompiler, **kw: Any) -> str:
+    end, start = _arguments(element, compiler, **kw)
+    return f"DATEDIFF({end}, {start})"
@@ -0,0 +1,287 @@
+"""Phase-split DDL for the OMOP CDM tables
+
+``MetaData.create_all()`` creates every table with its primary key, foreign
+keys and indexes in place, so an initial load pays for index maintenance and
+constraint checks on every row. The functions in this module split the DDL
+into phases which can run around a bulk load:
+
+1. create_tables: the bare tables (columns and NOT NULL only)
+2. create_primary_keys
+3. create_indexes
+4. create_foreign_keys
+
+Each phase works on the whole metadata or on a subset of tables. Dialects
+which cannot add constraints with ALTER TABLE (SQLite) get their primary and
+foreign keys inline during the first phase, and the constraint phases are
+no-ops there. The constraints are added without marking them as created
+separately, so create_all() on the same metadata still creates them inline.
+
+Where create_all() makes a single integer primary key generate its values,
+the bare table keeps that: on PostgreSQL the column is created as GENERATED
+BY DEFAULT AS IDENTITY (create_all() emits SERIAL; both fill in omitted ids
+from a sequence and accept explicit ones), on SQL Server as IDENTITY, as
+with create_all(). MySQL cannot declare AUTO_INCREMENT without a key, so its
+phased tables need explicit ids.
+
+find_redundant_indexes() reports the declared indexes whose columns are a
+leading prefix of the primary key or of another index (e.g.
+idx_concept_concept_id duplicates xpk_concept): they cost write throughput
+and disk but serve no lookup the longer key can't. create_indexes(lean=True)
+and lean_metadata() skip them.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional, Sequence, Union
+
+from sqlalchemy import Column, Connection, Identity, Index, MetaData, Table, inspect
+from sqlalchemy.schema import AddConstraint, CreateIndex, CreateTable
+
+from .bulk import ModelOrTable, table_for, translated_schema
+from .omopcdm54 import OMOPCDMModelBase
+
+TableSpec = Union[ModelOrTable, str]
+
+# dialects whose create_all() makes single integer primary keys generate ids
+# (SERIAL, IDENTITY), and which create the bare tables with IDENTITY instead
+IDENTITY_DIALECTS = ("mssql", "postgresql")
+
+
+def resolve_tables(
+    tables: Optional[Iterable[TableSpec]] = None,
+    metadata: Optional[MetaData] = None,
+) -> list[Table]:
+    """
+    return the Tables for the given models, Tables or table names, defaulting
+    to every table in the metadata
+    """
+    metadata = OMOPCDMModelBase.metadata if metadata is None else metadata
+    if tables is None:
+        return list(metadata.tables.values())
+    resolved = []
+    for table in tables:
+        if isinstance(table, str):
+            if table not in metadata.tables:
+                raise KeyError(f"unknown table: {table}")
+            resolved.append(metadata.tables[table])
+        else:
+            resolved.append(table_for(table))
+    return resolved
+
+
+def copy_metadata(metadata: Optional[MetaData] = None) -> MetaData:
+    """return a copy of metadata (default: the model metadata) and its tables"""
+    source = OMOPCDMModelBase.metadata if metadata is None else metadata
+    copy = MetaData(schema=source.schema, naming_convention=source.naming_convention)
+    for table in source.tables.values():
+        table.to_metadata(copy)
+    return copy
+
+
+def bare_table(table: Table, *, identity: bool = False) -> Table:
+    """
+    return a copy of the table without keys, constraints or indexes (dialect
+    options such as postgresql_partition_by are kept); with identity, the
+    column create_all() would make autoincrementing (e.g. person.person_id)
+    becomes an IDENTITY column
+    """
+    autoincrement = table.autoincrement_column if identity else None
+    return Table(
+        table.name,
+        MetaData(),
+        *(
+            Column(
+                column.name,
+                column.type,
+                *([Identity()] if column is autoincrement else []),
+                nullable=column.nullable,
+            )
+            for column in table.columns
+        ),
+        schema=table.schema,
+        **table.dialect_kwargs,
+    )
+
+
+@dataclass(frozen=True)
+class RedundantIndex:
+    """an index made redundant by the primary key or index named covered_by"""
+
+    index: Index
+    covered_by: str
+
+
+def _column_names(index: Index) -> Optional[tuple[str, ...]]:
+    """
+    the column names of a plain index, or None for indexes which are not
+    comparable by their columns (unique, partial or expression indexes)
+    """
+    if index.unique or len(index.expressions) != len(index.columns):
+        return None
+    if any(key.endswith("_where") for key in index.dialect_kwargs):
+        return None
+    return tuple(column.name for column in index.columns)
+
+
+def _is_prefix(columns: Sequence[str], of: Sequence[str]) -> bool:
+    """true if columns are the leading columns of of"""
+    return len(columns) <= len(of) and tuple(of[: len(columns)]) == tuple(columns)
+
+
+def _covering_key(
+    columns: tuple[str, ...],
+    primary_key: tuple[str, ...],
+    others: Sequence[tuple[str, tuple[str, ...], bool]],
+) -> Optional[str]:
+    """
+    the name of the key making an index on columns redundant, given the
+    primary key columns and the (name, columns, declared earlier) of the
+    other indexes; of two identical indexes only the later one is redundant
+    """
+    if _is_prefix(columns, primary_key):
+        return "primary key"
+    for name, other, earlier in sorted(others, key=lambda other: -len(other[1])):
+        if _is_prefix(columns, other) and (len(other) > len(columns) or earlier):
+            return name
+    return None
+
+
+def _redundant_in_table(table: Table) -> list[RedundantIndex]:
+    """the redundant indexes of one table"""
+    comparable = [
+        (index, columns)
+        for index in sorted(table.indexes, key=lambda index: str(index.name))
+        if (columns := _column_names(index)) is not None
+    ]
+    primary_key = tuple(table.primary_key.columns.keys())
+    redundant = []
+    for position, (index, columns) in enumerate(comparable):
+        others = [
+            (str(other.name), other_columns, other_position < position)
+            for other_position, (other, other_columns) in enumerate(comparable)
+            if other_position != position
+        ]
+        covered_by = _covering_key(columns, primary_key, others)
+        if covered_by == "primary key":
+            covered_by = str(table.primary_key.name or covered_by)
+        if covered_by is not None:
+            redundant.append(RedundantIndex(index, covered_by))
+    return redundant
+
+
+def find_redundant_indexes(
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> list[RedundantIndex]:
+    """
+    return the indexes of the given tables (default: all) whose columns are a
+    leading prefix of the table's primary key or of another of its indexes
+    """
+    return [
+        redundant
+        for table in resolve_tables(tables, metadata)
+        for redundant in _redundant_in_table(table)
+    ]
+
+
+def lean_metadata(metadata: Optional[MetaData] = None) -> MetaData:
+    """
+    return a copy of metadata (default: the model metadata) without the
+    redundant indexes, e.g. for create_all()
+    """
+    copy = copy_metadata(metadata)
+    for redundant in find_redundant_indexes(metadata=copy):
+        redundant.index.table.indexes.discard(redundant.index)  # type: ignore
+    return copy
+
+
+def _supports_alter(connection: Connection) -> bool:
+    """true if the dialect can add constraints to existing tables"""
+    return bool(connection.dialect.supports_alter)
+
+
+def create_tables(
+    connection: Connection,
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+    checkfirst: bool = True,
+) -> None:
+    """
+    phase 1: create the tables without primary keys, indexes or foreign keys;
+    like create_all(), this runs the tables' after_create DDL listeners
+    """
+    inspector = inspect(connection)
+    for table in resolve_tables(tables, metadata):
+        schema = translated_schema(connection, table)
+        if checkfirst and inspector.has_table(table.name, schema=schema):
+            continue
+        if _supports_alter(connection):
+            identity = connection.dialect.name in IDENTITY_DIALECTS
+            connection.execute(CreateTable(bare_table(table, identity=identity)))
+        else:
+            connection.execute(CreateTable(table))
+        table.dispatch.after_create(
+            table,
+            connection,
+            checkfirst=False,
+            _ddl_runner=None,
+            _is_metadata_operation=False,
+        )
+
+
+def create_primary_keys(
+    connection: Connection,
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> None:
+    """phase 2: add the declared primary keys (xpk_* / eh_composite_pk_*)"""
+    if not _supports_alter(connection):
+        return
+    for table in resolve_tables(tables, metadata):
+        if table.primary_key.columns:
+            connection.execute(
+                AddConstraint(table.primary_key, isolate_from_table=False)
+            )
+
+
+def create_indexes(
+    connection: Connection,
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+    checkfirst: bool = True,
+    lean: bool = False,
+) -> None:
+    """
+    phase 3: create the declared idx_* indexes; with lean, skip the ones
+    reported by find_redundant_indexes
+    """
+    resolved = resolve_tables(tables, metadata)
+    skipped = (
+        {id(redundant.index) for redundant in find_redundant_indexes(resolved)}
+        if lean
+        else set()
+    )
+    for table in resolved:
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            if id(index) in skipped:
+                continue
+            connection.execute(CreateIndex(index, if_not_exists=checkfirst))
+
+
+def create_foreign_keys(
+    connection: Connection,
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> None:
+    """phase 4: add the declared foreign keys (fpk_*)"""
+    if not _supports_alter(connection):
+        return
+    for table in resolve_tables(tables, metadata):
+        for constraint in sorted(
+            table.foreign_key_constraints, key=lambda constraint: str(constraint.name)
+        ):
+            connection.execute(AddConstraint(constraint, isolate_from_table=False))
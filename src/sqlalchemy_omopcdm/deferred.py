@@ -0,0 +1,82 @@
+"""Deferred loading of the large Text columns, as named groups
+
+Columns such as Note.note_text can hold megabytes per row, but listing notes
+(e.g. for an NLP queue) rarely needs them. defer_groups() defers the columns
+of the given groups for every ORM SELECT run by a Session (or sessionmaker),
+via the do_orm_execute event, so neither the generated models nor individual
+queries need to change. A deferred column is loaded on first access:
+
+    from sqlalchemy_omopcdm.deferred import defer_groups
+
+    defer_groups(Session)  # defers the "large_text" group
+    notes = session.scalars(select(Note).limit(10_000)).all()  # no note_text
+
+A statement loads the columns of a group up front with the undefer_groups
+execution option (don't combine defer_groups with undefer() options on the
+same columns, SQLAlchemy rejects conflicting loader options):
+
+    select(Note).execution_options(undefer_groups=["large_text"])
+"""
+
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.orm import InstrumentedAttribute, Load, ORMExecuteState
+
+from .loading import root_entity_mappers
+from .omopcdm54 import CDMSource, CohortDefinition, DrugExposure, Note
+
+LARGE_TEXT = "large_text"
+
+DEFERRED_GROUPS: dict[str, tuple[InstrumentedAttribute[Any], ...]] = {
+    LARGE_TEXT: (
+        CDMSource.source_description,
+        CohortDefinition.cohort_definition_description,
+        CohortDefinition.cohort_definition_syntax,
+        DrugExposure.sig,
+        Note.note_text,
+    ),
+}
+
+
+def defer_groups(
+    target: Any,
+    groups: Sequence[str] = (LARGE_TEXT,),
+    *,
+    raiseload: bool = False,
+) -> Callable[[ORMExecuteState], None]:
+    """
+    defer the columns of the given DEFERRED_GROUPS in the ORM SELECTs run by
+    target, a Session class, sessionmaker or Session instance; with raiseload
+    accessing an unloaded column raises instead of emitting a query. Returns
+    the event listener, which can be passed to remove_deferred_groups
+    """
+    for group in groups:
+        if group not in DEFERRED_GROUPS:
+            raise ValueError(f"unknown deferred group: {group}")
+
+    def add_defer_options(state: ORMExecuteState) -> None:
+        if not state.is_select or state.is_column_load or state.is_relationship_load:
+            return
+        undeferred = state.execution_options.get("undefer_groups", ())
+        options = [
+            Load(mapper).defer(column, raiseload=raiseload)
+            for group in groups
+            if group not in undeferred
+            for column in DEFERRED_GROUPS[group]
+            for mapper in root_entity_mappers(state)
+            if column.class_ is mapper.class_
+        ]
+        if options:
+            state.statement = state.statement.options(*options)
+
+    event.listen(target, "do_orm_execute", add_defer_options)
+    return add_defer_options
+
+
+def remove_deferred_groups(
+    target: Any,
+    listener: Callable[[ORMExecuteState], None],
+) -> None:
+    """remove a listener returned by defer_groups"""
+    event.remove(target, "do_orm_execute", listener)
@@ -0,0 +1,195 @@
+"""dose_era builder, with daily doses normalized through drug_strength
+
+Each drug_exposure is joined to the drug_strength rows of its drug_concept_id
+valid on the exposure start date, giving one daily dose per ingredient:
+
+- amount_value (e.g. 500 mg per tablet): amount_value * quantity / days,
+  in amount_unit_concept_id
+- numerator_value (e.g. 10 mg per 5 mL): numerator_value / denominator_value
+  (1 if missing) * quantity / days, in numerator_unit_concept_id
+
+where days is days_supply, or the days from start to end (at least 1).
+Exposures without a quantity or a strength have no dose and are skipped.
+
+Consecutive exposures of the same person, ingredient, unit and daily dose
+are one dose era while each starts at most gap_days (30 by default) after
+the previous one ended; a change of dose starts a new era. The exposures are
+read and collapsed in batches of PERSON_BATCH persons, and each batch of eras
+is written with bulk.bulk_load() (COPY on PostgreSQL):
+
+    with engine.begin() as connection:
+        build_dose_eras(connection)
+
+As with eras.build_drug_eras(), person_ids rebuilds only the eras of the
+given persons, and new eras are numbered from the maximum dose_era_id + 1.
+"""
+
+import datetime
+import decimal
+from typing import Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import Connection, Select, and_, delete, func, select
+
+from .bulk import bulk_load, chunked, table_for
+from .eras import DEFAULT_GAP_DAYS
+from .omopcdm54 import DoseEra, DrugExposure, DrugStrength
+
+# persons per read, collapse and write
+PERSON_BATCH = 1_000
+
+# (person_id, ingredient_concept_id, drug_exposure_start_date,
+# drug_exposure_end_date, days_supply, quantity, amount_value,
+# amount_unit_concept_id, numerator_value, numerator_unit_concept_id,
+# denominator_value)
+ExposureStrengthRow = tuple[
+    int,
+    int,
+    datetime.date,
+    datetime.date,
+    Optional[int],
+    Optional[decimal.Decimal],
+    Optional[decimal.Decimal],
+    Optional[int],
+    Optional[decimal.Decimal],
+    Optional[int],
+    Optional[decimal.Decimal],
+]
+
+# (person_id, ingredient_concept_id, unit_concept_id, dose_value, start_date,
+# end_date)
+DoseSpan = tuple[int, int, int, decimal.Decimal, datetime.date, datetime.date]
+
+
+def exposure_strength_select(
+    person_ids: Optional[Sequence[int]] = None,
+) -> Select[ExposureStrengthRow]:
+    """
+    the drug_exposure rows joined to their valid drug_strength rows, ordered
+    by person, ingredient and start
+    """
+    exposure, strength = DrugExposure, DrugStrength
+    statement = (
+        select(
+            exposure.person_id,
+            strength.ingredient_concept_id,
+            exposure.drug_exposure_start_date,
+            exposure.drug_exposure_end_date,
+            exposure.days_supply,
+            exposure.quantity,
+            strength.amount_value,
+            strength.amount_unit_concept_id,
+            strength.numerator_value,
+            strength.numerator_unit_concept_id,
+            strength.denominator_value,
+        )
+        .join(
+            strength,
+            and_(
+                strength.drug_concept_id == exposure.drug_concept_id,
+                strength.valid_start_date <= exposure.drug_exposure_start_date,
+                strength.valid_end_date >= exposure.drug_exposure_start_date,
+            ),
+        )
+        .order_by(
+            exposure.person_id,
+            strength.ingredient_concept_id,
+            exposure.drug_exposure_start_date,
+        )
+    )
+    if person_ids is not None:
+        statement = statement.where(exposure.person_id.in_(person_ids))
+    return statement
+
+
+def daily_doses(rows: Iterable[ExposureStrengthRow]) -> Iterator[DoseSpan]:
+    """the daily dose of each exposure with a quantity and a usable strength"""
+    for (
+        person_id,
+        ingredient_id,
+        start,
+        end,
+        days_supply,
+        quantity,
+        amount,
+        amount_unit,
+        numerator,
+        numerator_unit,
+        denominator,
+    ) in rows:
+        if not quantity:
+            continue
+        if amount is not None and amount_unit is not None:
+            unit_id, per_unit = amount_unit, amount
+        elif numerator is not None and numerator_unit is not None:
+            unit_id, per_unit = numerator_unit, numerator / (denominator or 1)
+        else:
+            continue
+        end = end or start + datetime.timedelta(days=days_supply or 1)
+        days = days_supply or max((end - start).days, 1)
+        yield person_id, ingredient_id, unit_id, per_unit * quantity / days, start, end
+
+
+def collapse_doses(spans: Iterable[DoseSpan], gap_days: int) -> Iterator[DoseSpan]:
+    """
+    merge the dose spans (sorted by person, ingredient and start) of the same
+    person, ingredient and unit while the dose stays the same and each starts
+    at most gap_days after the previous one ended
+    """
+    gap = datetime.timedelta(days=gap_days)
+    current: Optional[tuple[int, int]] = None
+    open_eras: dict[int, DoseSpan] = {}
+    for span in spans:
+        person_id, ingredient_id, unit_id, dose, start, end = span
+        if (person_id, ingredient_id) != current:
+            yield from sorted(open_eras.values(), key=lambda era: era[4])
+            current, open_eras = (person_id, ingredient_id), {}
+        era = open_eras.get(unit_id)
+        if era is not None and era[3] == dose and start <= era[5] + gap:
+            open_eras[unit_id] = (*era[:5], max(era[5], end))
+            continue
+        if era is not None:
+            yield era
+        open_eras[unit_id] = span
+    yield from sorted(open_eras.values(), key=lambda era: era[4])
+
+
+def build_dose_eras(
+    connection: Connection,
+    *,
+    gap_days: int = DEFAULT_GAP_DAYS,
+    person_ids: Optional[Iterable[int]] = None,
+    batch_size: int = PERSON_BATCH,
+) -> int:
+    """
+    rebuild dose_era, for all persons or the given ones; returns the number
+    of eras inserted
+    """
+    table = table_for(DoseEra)
+    if person_ids is None:
+        connection.execute(delete(table))
+        persons: Iterable[int] = (
+            connection.execute(
+                select(DrugExposure.person_id)
+                .distinct()
+                .order_by(DrugExposure.person_id)
+            )
+            .scalars()
+            .all()
+        )
+    else:
+        persons = sorted(set(person_ids))
+    inserted = 0
+    for batch in chunked(persons, batch_size):
+        if person_ids is not None:
+            connection.execute(delete(table).where(DoseEra.person_id.in_(batch)))
+        rows = connection.execute(exposure_strength_select(batch)).tuples().all()
+        eras = list(collapse_doses(daily_doses(rows), gap_days))
+        first_id = connection.execute(
+            select(func.coalesce(func.max(DoseEra.dose_era_id), 0))
+        ).scalar_one()
+        inserted += bulk_load(
+            connection,
+            DoseEra,
+            ((first_id + number, *era) for number, era in enumerate(eras, start=1)),
+        )
+    return inserted
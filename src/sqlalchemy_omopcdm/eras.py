@@ -0,0 +1,275 @@
+"""Set-based condition_era and drug_era builder
+
+Builds the eras the way the OHDSI reference SQL defines them, with window
+functions instead of the self-joins of the reference scripts:
+
+- condition_era: the condition_occurrence rows of each person and concept,
+  where a missing condition_end_date is condition_start_date + 1 day
+- drug_era: the drug_exposure rows rolled up to their RxNorm ingredients via
+  concept_ancestor, where a missing drug_exposure_end_date is the start plus
+  days_supply (or 1 day). Overlapping exposures are merged first, and
+  gap_days is the era length minus the days covered by exposures.
+
+Events of the same person and concept are one era while each starts at most
+gap_days (the persistence window, 30 by default) after every earlier event
+ended. An event starts a new era when it starts after the running maximum of
+the preceding events' end + gap_days, and a running sum of those starts
+numbers the eras, so each era build is one INSERT ... SELECT.
+
+build_condition_eras() and build_drug_eras() replace all eras, or with
+person_ids only those of the given persons (e.g. those whose events the last
+ETL run changed), in batches of PERSON_BATCH persons:
+
+    with engine.begin() as connection:
+        build_drug_eras(connection, person_ids=changed_person_ids)
+
+New eras are numbered from the current maximum era id + 1.
+"""
+
+import functools
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from sqlalchemy import (
+    Connection,
+    Select,
+    Subquery,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+)
+
+from .bulk import chunked, table_for
+from .dates import date_add, date_diff
+from .omopcdm54 import (
+    Concept,
+    ConceptAncestor,
+    ConditionEra,
+    ConditionOccurrence,
+    DrugEra,
+    DrugExposure,
+)
+
+# the OHDSI default persistence window
+DEFAULT_GAP_DAYS = 30
+
+# persons per DELETE and INSERT ... SELECT in incremental builds
+PERSON_BATCH = 10_000
+
+
+def collapse(events: Subquery, gap_days: int, sums: Sequence[str] = ()) -> Subquery:
+    """
+    merge events (person_id, concept_id, start_date, end_date, event_count,
+    *sums) into eras of the same person and concept, with the event counts
+    and the sums columns added up per era
+    """
+    partition = (events.c.person_id, events.c.concept_id)
+    order = (events.c.start_date, events.c.end_date)
+    previous_end = func.max(date_add(events.c.end_date, gap_days)).over(
+        partition_by=partition, order_by=order, rows=(None, -1)
+    )
+    flagged = select(
+        events,
+        case(
+            (previous_end.is_(None), 1),
+            (events.c.start_date > previous_end, 1),
+            else_=0,
+        ).label("starts_era"),
+    ).subquery()
+    numbered = select(
+        flagged,
+        func.sum(flagged.c.starts_era)
+        .over(
+            partition_by=(flagged.c.person_id, flagged.c.concept_id),
+            order_by=(flagged.c.start_date, flagged.c.end_date),
+            rows=(None, 0),
+        )
+        .label("era_number"),
+    ).subquery()
+    return (
+        select(
+            numbered.c.person_id,
+            numbered.c.concept_id,
+            func.min(numbered.c.start_date).label("start_date"),
+            func.max(numbered.c.end_date).label("end_date"),
+            func.sum(numbered.c.event_count).label("event_count"),
+            *(func.sum(numbered.c[name]).label(name) for name in sums),
+        )
+        .group_by(numbered.c.person_id, numbered.c.concept_id, numbered.c.era_number)
+        .subquery()
+    )
+
+
+def condition_events(person_ids: Optional[Sequence[int]] = None) -> Subquery:
+    """the condition_occurrence rows as era events"""
+    occurrence = ConditionOccurrence
+    statement = select(
+        occurrence.person_id.label("person_id"),
+        occurrence.condition_concept_id.label("concept_id"),
+        occurrence.condition_start_date.label("start_date"),
+        func.coalesce(
+            occurrence.condition_end_date,
+            date_add(occurrence.condition_start_date, 1),
+        ).label("end_date"),
+        literal(1).label("event_count"),
+    ).where(occurrence.condition_concept_id != 0)
+    if person_ids is not None:
+        statement = statement.where(occurrence.person_id.in_(person_ids))
+    return statement.subquery()
+
+
+def drug_events(person_ids: Optional[Sequence[int]] = None) -> Subquery:
+    """the drug_exposure rows, rolled up to their ingredients, as era events"""
+    exposure = DrugExposure
+    statement = (
+        select(
+            exposure.person_id.label("person_id"),
+            ConceptAncestor.ancestor_concept_id.label("concept_id"),
+            exposure.drug_exposure_start_date.label("start_date"),
+            func.coalesce(
+                exposure.drug_exposure_end_date,
+                date_add(exposure.drug_exposure_start_date, exposure.days_supply),
+                date_add(exposure.drug_exposure_start_date, 1),
+            ).label("end_date"),
+            literal(1).label("event_count"),
+        )
+        .join(
+            ConceptAncestor,
+            ConceptAncestor.descendant_concept_id == exposure.drug_concept_id,
+        )
+        .join(Concept, Concept.concept_id == ConceptAncestor.ancestor_concept_id)
+        .where(
+            exposure.drug_concept_id != 0,
+            Concept.vocabulary_id == "RxNorm",
+            Concept.concept_class_id == "Ingredient",
+        )
+    )
+    if person_ids is not None:
+        statement = statement.where(exposure.person_id.in_(person_ids))
+    return statement.subquery()
+
+
+def _numbered(eras: Subquery, first_id: int) -> Any:
+    """era ids from first_id, in person, concept and start order"""
+    return literal(first_id - 1) + func.row_number().over(
+        order_by=(eras.c.person_id, eras.c.concept_id, eras.c.start_date)
+    )
+
+
+def condition_era_select(
+    *,
+    gap_days: int = DEFAULT_GAP_DAYS,
+    person_ids: Optional[Sequence[int]] = None,
+    first_id: int = 1,
+) -> Select[Any]:
+    """the condition_era rows, in the order of the condition_era columns"""
+    eras = collapse(condition_events(person_ids), gap_days)
+    return select(
+        _numbered(eras, first_id),
+        eras.c.person_id,
+        eras.c.concept_id,
+        eras.c.start_date,
+        eras.c.end_date,
+        eras.c.event_count,
+    )
+
+
+def drug_era_select(
+    *,
+    gap_days: int = DEFAULT_GAP_DAYS,
+    person_ids: Optional[Sequence[int]] = None,
+    first_id: int = 1,
+) -> Select[Any]:
+    """the drug_era rows, in the order of the drug_era columns"""
+    exposures = collapse(drug_events(person_ids), 0)
+    exposed = select(
+        exposures,
+        date_diff(exposures.c.end_date, exposures.c.start_date).label("exposed_days"),
+    ).subquery()
+    eras = collapse(exposed, gap_days, sums=["exposed_days"])
+    return select(
+        _numbered(eras, first_id),
+        eras.c.person_id,
+        eras.c.concept_id,
+        eras.c.start_date,
+        eras.c.end_date,
+        eras.c.event_count,
+        date_diff(eras.c.end_date, eras.c.start_date) - eras.c.exposed_days,
+    )
+
+
+EraSelect = Callable[..., Select[Any]]
+
+
+def _rebuild(
+    connection: Connection,
+    table: Table,
+    era_select: EraSelect,
+    person_ids: Optional[Iterable[int]],
+    batch_size: int,
+) -> int:
+    """replace the eras of all persons, or of the given ones, in batches"""
+    (key,) = table.primary_key.columns
+    batches: Iterable[Optional[Sequence[int]]] = (
+        [None] if person_ids is None else chunked(sorted(set(person_ids)), batch_size)
+    )
+    inserted = 0
+    for batch in batches:
+        removal = delete(table)
+        if batch is not None:
+            removal = removal.where(table.c.person_id.in_(batch))
+        connection.execute(removal)
+        first_id = connection.execute(
+            select(func.coalesce(func.max(key), 0))
+        ).scalar_one()
+        result = connection.execute(
+            insert(table).from_select(
+                list(table.columns),
+                era_select(person_ids=batch, first_id=first_id + 1),
+            )
+        )
+        inserted += result.rowcount
+    return inserted
+
+
+def build_condition_eras(
+    connection: Connection,
+    *,
+    gap_days: int = DEFAULT_GAP_DAYS,
+    person_ids: Optional[Iterable[int]] = None,
+    batch_size: int = PERSON_BATCH,
+) -> int:
+    """
+    rebuild condition_era, for all persons or the given ones; returns the
+    number of eras inserted
+    """
+    return _rebuild(
+        connection,
+        table_for(ConditionEra),
+        functools.partial(condition_era_select, gap_days=gap_days),
+        person_ids,
+        batch_size,
+    )
+
+
+def build_drug_eras(
+    connection: Connection,
+    *,
+    gap_days: int = DEFAULT_GAP_DAYS,
+    person_ids: Optional[Iterable[int]] = None,
+    batch_size: int = PERSON_BATCH,
+) -> int:
+    """
+    rebuild drug_era, for all persons or the given ones; returns the number
+    of eras inserted
+    """
+    return _rebuild(
+        connection,
+        table_for(DrugEra),
+        functools.partial(drug_era_select, gap_days=gap_days),
+        person_ids,
+        batch_size,
+    )
@@ -0,0 +1,77 @@
+"""The OMOP CDM v5.4 tables grouped by the sections of the specification
+
+These are plain table names, so they can be used (e.g. with the ddl functions
+or parallel.load_parallel) without importing the models. The vocabulary
+tables are also mapped on their own in the vocabulary module.
+https://ohdsi.github.io/CommonDataModel/cdm54.html
+"""
+
+CLINICAL_TABLES = (
+    "person",
+    "observation_period",
+    "visit_occurrence",
+    "visit_detail",
+    "condition_occurrence",
+    "drug_exposure",
+    "procedure_occurrence",
+    "device_exposure",
+    "measurement",
+    "observation",
+    "death",
+    "note",
+    "note_nlp",
+    "specimen",
+    "fact_relationship",
+)
+
+HEALTH_SYSTEM_TABLES = (
+    "location",
+    "care_site",
+    "provider",
+)
+
+HEALTH_ECONOMICS_TABLES = (
+    "payer_plan_period",
+    "cost",
+)
+
+DERIVED_TABLES = (
+    "drug_era",
+    "dose_era",
+    "condition_era",
+    "episode",
+    "episode_event",
+)
+
+METADATA_TABLES = (
+    "metadata",
+    "cdm_source",
+)
+
+VOCABULARY_TABLES = (
+    "concept",
+    "vocabulary",
+    "domain",
+    "concept_class",
+    "concept_relationship",
+    "relationship",
+    "concept_synonym",
+    "concept_ancestor",
+    "source_to_concept_map",
+    "drug_strength",
+)
+
+RESULTS_TABLES = (
+    "cohort",
+    "cohort_definition",
+)
+
+TABLE_GROUPS = {
+    "clinical": CLINICAL_TABLES,
+    "health_system": HEALTH_SYSTEM_TABLES,
+    "health_economics": HEALTH_ECONOMICS_TABLES,
+    "derived": DERIVED_TABLES,
+    "metadata": METADATA_TABLES,
+    "vocabulary": VOCABULARY_TABLES,
+    "results": RESULTS_TABLES,
+}
@@ -0,0 +1,109 @@
+"""Opt-in analytics index pack for the event tables
+
+The generated indexes are single-column, while typical cohort queries filter
+on a concept and a date range and group by person. The pack adds two
+composite indexes to each table in ANALYTICS_COLUMNS:
+
+- idx_<table>_person_concept_date: (person_id, <concept>, <date>), for
+  per-person lookups of a concept (e.g. "first occurrence of X")
+- idx_<table>_concept_date: (<concept>, <date>), covering person_id with
+  INCLUDE on PostgreSQL, for concept + date range scans returning persons
+
+analytics_metadata() returns a copy of the model metadata with the pack
+added, for new databases (create_all() or the ddl phases, which run in a
+transaction and so always build the indexes non-concurrently).
+create_analytics_indexes() adds only the pack to an existing database. With
+concurrently=True PostgreSQL builds the indexes with CREATE INDEX
+CONCURRENTLY, without blocking writes; this cannot run inside a transaction,
+so pass a connection with isolation_level="AUTOCOMMIT":
+
+    with engine.connect() as connection:
+        create_analytics_indexes(
+            connection.execution_options(isolation_level="AUTOCOMMIT"),
+            concurrently=True,
+        )
+"""
+
+from typing import Iterable, Optional
+
+from sqlalchemy import Connection, Index, MetaData, Table
+from sqlalchemy.schema import CreateIndex
+
+from .ddl import copy_metadata
+
+# the event tables and their (concept column, date column)
+ANALYTICS_COLUMNS = {
+    "condition_era": ("condition_concept_id", "condition_era_start_date"),
+    "condition_occurrence": ("condition_concept_id", "condition_start_date"),
+    "device_exposure": ("device_concept_id", "device_exposure_start_date"),
+    "dose_era": ("drug_concept_id", "dose_era_start_date"),
+    "drug_era": ("drug_concept_id", "drug_era_start_date"),
+    "drug_exposure": ("drug_concept_id", "drug_exposure_start_date"),
+    "episode": ("episode_concept_id", "episode_start_date"),
+    "measurement": ("measurement_concept_id", "measurement_date"),
+    "observation": ("observation_concept_id", "observation_date"),
+    "procedure_occurrence": ("procedure_concept_id", "procedure_date"),
+    "specimen": ("specimen_concept_id", "specimen_date"),
+    "visit_detail": ("visit_detail_concept_id", "visit_detail_start_date"),
+    "visit_occurrence": ("visit_concept_id", "visit_start_date"),
+}
+
+
+def add_analytics_indexes(table: Table, *, concurrently: bool = False) -> list[Index]:
+    """
+    add the pack's indexes to the given table, in place, and return them; only
+    use this on a copy of the model metadata
+    """
+    concept, date = (table.columns[name] for name in ANALYTICS_COLUMNS[table.name])
+    person = table.columns["person_id"]
+    return [
+        Index(
+            f"idx_{table.name}_person_concept_date",
+            person,
+            concept,
+            date,
+            postgresql_concurrently=concurrently,
+        ),
+        Index(
+            f"idx_{table.name}_concept_date",
+            concept,
+            date,
+            postgresql_include=[person.name],
+            postgresql_concurrently=concurrently,
+        ),
+    ]
+
+
+def analytics_metadata(
+    tables: Optional[Iterable[str]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> MetaData:
+    """
+    return a copy of metadata (default: the model metadata) with the pack added
+    to the given tables (default: all ANALYTICS_COLUMNS tables)
+    """
+    copy = copy_metadata(metadata)
+    for name in ANALYTICS_COLUMNS if tables is None else tables:
+        add_analytics_indexes(copy.tables[name])
+    return copy
+
+
+def create_analytics_indexes(
+    connection: Connection,
+    tables: Optional[Iterable[str]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+    concurrently: bool = False,
+    checkfirst: bool = True,
+) -> None:
+    """
+    create the pack's indexes (and no others) on the given tables (default:
+    all ANALYTICS_COLUMNS tables) of an existing database
+    """
+    copy = copy_metadata(metadata)
+    for name in ANALYTICS_COLUMNS if tables is None else tables:
+        for index in add_analytics_indexes(
+            copy.tables[name], concurrently=concurrently
+        ):
+            connection.execute(CreateIndex(index, if_not_exists=checkfirst))
@@ -0,0 +1,158 @@
+"""Relationship loading profiles applied to every ORM query at once
+
+All generated relationships use the default lazy="select" strategy, so
+touching e.g. measurement.unit_concept in a loop issues one query per row. A
+loading profile adds loader options for every entity selected by every ORM
+SELECT run by a Session (or sessionmaker), via the do_orm_execute event, so
+neither the generated models nor individual queries need to change:
+
+    from sqlalchemy_omopcdm.loading import apply_loading_profile
+
+    apply_loading_profile(Session, "raise")  # all sessions
+    apply_loading_profile(reporting_sessionmaker, "selectin_concepts")
+
+Profiles can be combined (e.g. ["raise", "selectin_concepts"]: the specific
+selectin options win over the raise wildcard). A single statement opts out
+with .execution_options(loading_profile=False).
+"""
+
+from typing import Any, Callable, Sequence, Union
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import (
+    Load,
+    Mapper,
+    ORMExecuteState,
+    RelationshipDirection,
+    RelationshipProperty,
+)
+from sqlalchemy.orm.interfaces import ORMOption
+
+from .omopcdm54 import (
+    CareSite,
+    Concept,
+    ConceptClass,
+    Domain,
+    Location,
+    Provider,
+    Relationship,
+    Vocabulary,
+)
+
+ProfileFactory = Callable[[Mapper[Any]], list[ORMOption]]
+Profile = Union[str, ProfileFactory, Sequence[Union[str, ProfileFactory]]]
+
+# small, rarely changing tables which are cheap to join to
+REFERENCE_MODELS = (
+    CareSite,
+    Concept,
+    ConceptClass,
+    Domain,
+    Location,
+    Provider,
+    Relationship,
+    Vocabulary,
+)
+
+
+def _many_to_one(mapper: Mapper[Any]) -> list[RelationshipProperty[Any]]:
+    """the many-to-one relationships of the given mapper"""
+    return [
+        relationship
+        for relationship in mapper.relationships
+        if relationship.direction is RelationshipDirection.MANYTOONE
+    ]
+
+
+def raise_on_lazy_load(mapper: Mapper[Any]) -> list[ORMOption]:
+    """raise instead of emitting a lazy load, for any relationship"""
+    return [Load(mapper).raiseload("*")]
+
+
+def selectin_concepts(mapper: Mapper[Any]) -> list[ORMOption]:
+    """load every relationship to Concept with one SELECT ... IN per query"""
+    return [
+        Load(mapper).selectinload(relationship.class_attribute)
+        for relationship in _many_to_one(mapper)
+        if relationship.mapper.class_ is Concept
+    ]
+
+
+def joined_reference(mapper: Mapper[Any]) -> list[ORMOption]:
+    """join the many-to-one relationships to the REFERENCE_MODELS tables"""
+    return [
+        Load(mapper).joinedload(relationship.class_attribute)
+        for relationship in _many_to_one(mapper)
+        if relationship.mapper.class_ in REFERENCE_MODELS
+    ]
+
+
+PROFILES: dict[str, ProfileFactory] = {
+    "raise": raise_on_lazy_load,
+    "selectin_concepts": selectin_concepts,
+    "joined_reference": joined_reference,
+}
+
+
+def root_entity_mappers(state: ORMExecuteState) -> list[Mapper[Any]]:
+    """
+    the mappers of the full entities selected by the statement (select(Note),
+    not select(Note.note_id)); loader options only apply to those
+    """
+    return [
+        inspect(description["expr"])
+        for description in getattr(state.statement, "column_descriptions", ())
+        if isinstance(description["expr"], type)
+        and description["expr"] is description.get("entity")
+    ]
+
+
+def _factories(profile: Profile) -> list[ProfileFactory]:
+    """resolve profile names to option factories"""
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise ValueError(f"unknown loading profile: {profile}")
+        return [PROFILES[profile]]
+    if callable(profile):
+        return [profile]
+    return [factory for item in profile for factory in _factories(item)]
+
+
+def apply_loading_profile(
+    target: Any,
+    profile: Profile,
+) -> Callable[[ORMExecuteState], None]:
+    """
+    apply the given profile(s) to the ORM SELECTs run by target, a Session
+    class, sessionmaker or Session instance; returns the event listener, which
+    can be passed to remove_loading_profile
+    """
+    factories = _factories(profile)
+
+    def add_loader_options(state: ORMExecuteState) -> None:
+        if (
+            not state.is_select
+            or state.is_column_load
+            or state.is_relationship_load
+            or state.execution_options.get("loading_profile", True) is False
+        ):
+            return
+        options = [
+            option
+            for mapper in root_entity_mappers(state)
+            for factory in factories
+            for option in factory(mapper)
+        ]
+        if options:
+            state.statement = state.statement.options(*options)
+
+    event.listen(target, "do_orm_execute", add_loader_options)
+    return add_loader_options
+
+
+def remove_loading_profile(
+    target: Any,
+    listener: Callable[[ORMExecuteState], None],
+) -> None:
+    """remove a listener returned by apply_loading_profile"""
+    event.remove(target, "do_orm_execute", listener)
@@ -0,0 +1,142 @@
+"""Batch "Maps to" / "Maps to value" resolution over ConceptRelationship
+
+Converting source concepts to standard concepts row by row makes an ETL
+latency-bound. MapsToResolver preloads the valid (invalid_reason IS NULL)
+mapping edges of concept_relationship into compressed sparse row arrays, one
+per relationship, and maps whole columns of source concept_ids in memory:
+
+    resolver = MapsToResolver.from_database(connection)
+    standard_ids = resolver.map_first(source_concept_ids)  # 0 where unmapped
+    rows, targets = resolver.map_all(source_concept_ids)  # one-to-many
+    rows, values = resolver.map_all(source_concept_ids, "Maps to value")
+
+map_all() returns the mappings as two parallel arrays, the position in the
+input and the target concept, like the rows of a join.
+"""
+
+from array import array
+from typing import Iterable, Sequence
+
+from sqlalchemy import select
+
+from ._csr import CSR
+from .cache import Bind
+from .omopcdm54 import ConceptRelationship
+
+MAPS_TO = "Maps to"
+MAPS_TO_VALUE = "Maps to value"
+# the reverse of Maps to, from standard to source concepts
+MAPPED_FROM = "Mapped from"
+
+# concept_relationship rows per fetch while streaming
+FETCH_SIZE = 100_000
+
+
+class MapsToResolver:
+    """the valid mapping edges of some relationships, by source concept"""
+
+    def __init__(self, edges: dict[str, CSR]) -> None:
+        self.edges = edges
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[int, int, str]]) -> "MapsToResolver":
+        """build from (concept_id_1, concept_id_2, relationship_id) rows"""
+        by_relationship: dict[str, list[tuple[int, int]]] = {}
+        for source, target, relationship_id in rows:
+            by_relationship.setdefault(relationship_id, []).append((source, target))
+        return cls(
+            {
+                relationship_id: CSR.from_edges(pairs)
+                for relationship_id, pairs in by_relationship.items()
+            }
+        )
+
+    @classmethod
+    def from_database(
+        cls,
+        bind: Bind,
+        relationship_ids: Sequence[str] = (MAPS_TO, MAPS_TO_VALUE),
+        *,
+        fetch_size: int = FETCH_SIZE,
+    ) -> "MapsToResolver":
+        """
+        build from the valid concept_relationship rows of the given
+        relationships, streaming the table once per relationship
+        """
+        edges = {}
+        for relationship_id in relationship_ids:
+            edges[relationship_id] = CSR.from_sorted(
+                bind.execute(
+                    select(
+                        ConceptRelationship.concept_id_1,
+                        ConceptRelationship.concept_id_2,
+                    )
+                    .where(
+                        ConceptRelationship.relationship_id == relationship_id,
+                        ConceptRelationship.invalid_reason.is_(None),
+                    )
+                    .order_by(
+                        ConceptRelationship.concept_id_1,
+                        ConceptRelationship.concept_id_2,
+                    )
+                    .execution_options(yield_per=fetch_size)
+                )
+            )
+        return cls(edges)
+
+    def _csr(self, relationship_id: str) -> CSR:
+        """the edges of a loaded relationship"""
+        if relationship_id not in self.edges:
+            raise KeyError(f"relationship not loaded: {relationship_id}")
+        return self.edges[relationship_id]
+
+    def targets(self, concept_id: int, relationship_id: str = MAPS_TO) -> "array[int]":
+        """the concepts the given concept maps to"""
+        csr = self._csr(relationship_id)
+        span = csr.span(concept_id)
+        return csr.targets[span.start : span.stop]
+
+    def map_first(
+        self,
+        concept_ids: Iterable[int],
+        relationship_id: str = MAPS_TO,
+        *,
+        default: int = 0,
+    ) -> "array[int]":
+        """
+        the first (lowest) target of each concept, default where unmapped;
+        use map_all for one-to-many mappings
+        """
+        csr = self._csr(relationship_id)
+        targets = csr.targets
+        mapped = array("i")
+        for concept_id in concept_ids:
+            span = csr.span(concept_id)
+            mapped.append(targets[span.start] if span else default)
+        return mapped
+
+    def map_all(
+        self,
+        concept_ids: Iterable[int],
+        relationship_id: str = MAPS_TO,
+        *,
+        unmapped: bool = True,
+        default: int = 0,
+    ) -> tuple["array[int]", "array[int]"]:
+        """
+        every mapping of each concept, as parallel arrays of input positions
+        and target concepts; unmapped concepts get one default row, or none
+        without unmapped
+        """
+        csr = self._csr(relationship_id)
+        targets = csr.targets
+        positions, mapped = array("Q"), array("i")
+        for position, concept_id in enumerate(concept_ids):
+            span = csr.span(concept_id)
+            if span:
+                positions.extend([position] * len(span))
+                mapped.extend(targets[span.start : span.stop])
+            elif unmapped:
+                positions.append(position)
+                mapped.append(default)
+        return positions, mapped
@@ -0,0 +1,201 @@
+"""observation_period derivation from the event tables
+
+An observation period spans the first to the last event date of a person
+across visit_occurrence, condition_occurrence, drug_exposure,
+procedure_occurrence, device_exposure, measurement and observation (missing
+end dates count as the start date). observation_period_select() computes
+them in one statement: a UNION ALL of the per-person date bounds of each
+table, reduced to one period per person. With gap_days, the UNION ALL is of
+the event spans instead, and a period ends where no event starts within
+gap_days of every earlier one ending (as for eras.collapse()).
+
+build_observation_periods() replaces the observation_period table. Persons
+are split into person_id ranges of range_size, which workers compute in
+parallel on their own connections, while the periods are numbered in
+person order and written with bulk.bulk_load() in one transaction:
+
+    build_observation_periods(engine, gap_days=365, max_workers=4)
+"""
+
+import concurrent.futures
+import datetime
+import os
+from typing import Any, Iterator, Optional, Sequence
+
+from sqlalchemy import Engine, Select, delete, func, literal, select, union_all
+
+from .bulk import bulk_load, table_for
+from .eras import collapse
+from .omopcdm54 import (
+    ConditionOccurrence,
+    DeviceExposure,
+    DrugExposure,
+    Measurement,
+    Observation,
+    ObservationPeriod,
+    Person,
+    ProcedureOccurrence,
+    VisitOccurrence,
+)
+
+# the "EHR" type concept
+EHR = 32817
+
+# person_ids per parallel unit of work
+PERSON_RANGE = 100_000
+
+# the start date and end date (or None) columns of each event table
+EVENT_DATES: Sequence[tuple[Any, Any, Optional[Any]]] = (
+    (
+        VisitOccurrence,
+        VisitOccurrence.visit_start_date,
+        VisitOccurrence.visit_end_date,
+    ),
+    (
+        ConditionOccurrence,
+        ConditionOccurrence.condition_start_date,
+        ConditionOccurrence.condition_end_date,
+    ),
+    (
+        DrugExposure,
+        DrugExposure.drug_exposure_start_date,
+        DrugExposure.drug_exposure_end_date,
+    ),
+    (
+        ProcedureOccurrence,
+        ProcedureOccurrence.procedure_date,
+        ProcedureOccurrence.procedure_end_date,
+    ),
+    (
+        DeviceExposure,
+        DeviceExposure.device_exposure_start_date,
+        DeviceExposure.device_exposure_end_date,
+    ),
+    (Measurement, Measurement.measurement_date, None),
+    (Observation, Observation.observation_date, None),
+)
+
+# (person_id, observation_period_start_date, observation_period_end_date)
+PeriodRow = tuple[int, datetime.date, datetime.date]
+
+
+def _event_selects(
+    person_range: Optional[tuple[int, int]], bounds: bool
+) -> list[Select[Any]]:
+    """
+    per event table, the (person_id, start_date, end_date) of each event, or
+    with bounds of each person
+    """
+    selects = []
+    for model, start, end in EVENT_DATES:
+        end = start if end is None else func.coalesce(end, start)
+        statement = (
+            select(
+                model.person_id.label("person_id"),
+                func.min(start).label("start_date"),
+                func.max(end).label("end_date"),
+            ).group_by(model.person_id)
+            if bounds
+            else select(
+                model.person_id.label("person_id"),
+                start.label("start_date"),
+                end.label("end_date"),
+            )
+        )
+        if person_range is not None:
+            low, high = person_range
+            statement = statement.where(model.person_id >= low, model.person_id < high)
+        selects.append(statement)
+    return selects
+
+
+def observation_period_select(
+    *,
+    gap_days: Optional[int] = None,
+    person_range: Optional[tuple[int, int]] = None,
+) -> Select[PeriodRow]:
+    """
+    the observation periods of all persons, or of person_ids in the
+    [low, high) range, ordered by person and start
+    """
+    if gap_days is None:
+        bounds = union_all(*_event_selects(person_range, bounds=True)).subquery()
+        return (
+            select(
+                bounds.c.person_id,
+                func.min(bounds.c.start_date),
+                func.max(bounds.c.end_date),
+            )
+            .group_by(bounds.c.person_id)
+            .order_by(bounds.c.person_id)
+        )
+    spans = union_all(*_event_selects(person_range, bounds=False)).subquery()
+    events = select(
+        spans.c.person_id,
+        literal(0).label("concept_id"),
+        spans.c.start_date,
+        spans.c.end_date,
+        literal(1).label("event_count"),
+    ).subquery()
+    periods = collapse(events, gap_days)
+    return select(
+        periods.c.person_id, periods.c.start_date, periods.c.end_date
+    ).order_by(periods.c.person_id, periods.c.start_date)
+
+
+def person_ranges(engine: Engine, range_size: int) -> Iterator[tuple[int, int]]:
+    """[low, high) person_id ranges of range_size covering the person table"""
+    with engine.connect() as connection:
+        low, high = connection.execute(
+            select(func.min(Person.person_id), func.max(Person.person_id))
+        ).one()
+    if low is None:
+        return
+    for start in range(low, high + 1, range_size):
+        yield start, start + range_size
+
+
+def _periods(
+    engine: Engine, gap_days: Optional[int], person_range: tuple[int, int]
+) -> list[PeriodRow]:
+    """the periods of one person_id range, on a connection of its own"""
+    statement = observation_period_select(gap_days=gap_days, person_range=person_range)
+    with engine.connect() as connection:
+        return list(connection.execute(statement).tuples())
+
+
+def build_observation_periods(
+    engine: Engine,
+    *,
+    gap_days: Optional[int] = None,
+    period_type_concept_id: int = EHR,
+    range_size: int = PERSON_RANGE,
+    max_workers: Optional[int] = None,
+) -> int:
+    """
+    replace observation_period with the periods derived from the event
+    tables, returning the number of periods written
+
+    Workers check connections out of the engine's pool, so size the pool for
+    max_workers (default: the CPU count) plus the writing connection.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    written = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda person_range: _periods(engine, gap_days, person_range),
+            person_ranges(engine, range_size),
+        )
+        with engine.begin() as connection:
+            connection.execute(delete(table_for(ObservationPeriod)))
+            for periods in results:
+                first_id = written + 1
+                written += bulk_load(
+                    connection,
+                    ObservationPeriod,
+                    (
+                        (number, *period, period_type_concept_id)
+                        for number, period in enumerate(periods, start=first_id)
+                    ),
+                )
+    return written
@@ -0,0 +1,1627 @@
+"""OMOP Common Data Model v5.4 SQLAlchemy Core Tables"""
+
+# pylint: disable=duplicate-code
+# pylint: disable=too-many-lines
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    MetaData,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    Table,
+    Text,
+)
+
+metadata = MetaData()
+
+
+t_cohort = Table(
+    "cohort",
+    metadata,
+    Column("cohort_definition_id", Integer, primary_key=True),
+    Column("subject_id", Integer, primary_key=True),
+    Column("cohort_start_date", Date, primary_key=True),
+    Column("cohort_end_date", Date, primary_key=True),
+    PrimaryKeyConstraint(
+        "cohort_definition_id",
+        "subject_id",
+        "cohort_start_date",
+        "cohort_end_date",
+        name="eh_composite_pk_cohort",
+    ),
+)
+
+t_concept = Table(
+    "concept",
+    metadata,
+    Column("concept_id", Integer, primary_key=True),
+    Column("concept_name", String(255), nullable=False),
+    Column("domain_id", String(20), nullable=False),
+    Column("vocabulary_id", String(20), nullable=False),
+    Column("concept_class_id", String(20), nullable=False),
+    Column("concept_code", String(50), nullable=False),
+    Column("valid_start_date", Date, nullable=False),
+    Column("valid_end_date", Date, nullable=False),
+    Column("standard_concept", String(1)),
+    Column("invalid_reason", String(1)),
+    ForeignKeyConstraint(
+        ["concept_class_id"],
+        ["concept_class.concept_class_id"],
+        name="fpk_concept_concept_class_id",
+    ),
+    ForeignKeyConstraint(
+        ["domain_id"], ["domain.domain_id"], name="fpk_concept_domain_id"
+    ),
+    ForeignKeyConstraint(
+        ["vocabulary_id"],
+        ["vocabulary.vocabulary_id"],
+        name="fpk_concept_vocabulary_id",
+    ),
+    PrimaryKeyConstraint("concept_id", name="xpk_concept"),
+    Index("idx_concept_class_id", "concept_class_id"),
+    Index("idx_concept_code", "concept_code"),
+    Index("idx_concept_concept_id", "concept_id"),
+    Index("idx_concept_domain_id", "domain_id"),
+    Index("idx_concept_vocabluary_id", "vocabulary_id"),
+)
+
+t_concept_class = Table(
+    "concept_class",
+    metadata,
+    Column("concept_class_id", String(20), primary_key=True),
+    Column("concept_class_name", String(255), nullable=False),
+    Column("concept_class_concept_id", Integer, nullable=False),
+    ForeignKeyConstraint(
+        ["concept_class_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_concept_class_concept_class_concept_id",
+    ),
+    PrimaryKeyConstraint("concept_class_id", name="xpk_concept_class"),
+    Index("idx_concept_class_class_id", "concept_class_id"),
+)
+
+t_domain = Table(
+    "domain",
+    metadata,
+    Column("domain_id", String(20), primary_key=True),
+    Column("domain_name", String(255), nullable=False),
+    Column("domain_concept_id", Integer, nullable=False),
+    ForeignKeyConstraint(
+        ["domain_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_domain_domain_concept_id",
+    ),
+    PrimaryKeyConstraint("domain_id", name="xpk_domain"),
+    Index("idx_domain_domain_id", "domain_id"),
+)
+
+t_vocabulary = Table(
+    "vocabulary",
+    metadata,
+    Column("vocabulary_id", String(20), primary_key=True),
+    Column("vocabulary_name", String(255), nullable=False),
+    Column("vocabulary_concept_id", Integer, nullable=False),
+    Column("vocabulary_reference", String(255)),
+    Column("vocabulary_version", String(255)),
+    ForeignKeyConstraint(
+        ["vocabulary_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_vocabulary_vocabulary_concept_id",
+    ),
+    PrimaryKeyConstraint("vocabulary_id", name="xpk_vocabulary"),
+    Index("idx_vocabulary_vocabulary_id", "vocabulary_id"),
+)
+
+t_cdm_source = Table(
+    "cdm_source",
+    metadata,
+    Column("cdm_source_name", String(255), primary_key=True),
+    Column("cdm_source_abbreviation", String(25), primary_key=True),
+    Column("cdm_holder", String(255), primary_key=True),
+    Column("source_release_date", Date, primary_key=True),
+    Column("cdm_release_date", Date, primary_key=True),
+    Column("cdm_version_concept_id", Integer, primary_key=True),
+    Column("vocabulary_version", String(20), primary_key=True),
+    Column("source_description", Text),
+    Column("source_documentation_reference", String(255)),
+    Column("cdm_etl_reference", String(255)),
+    Column("cdm_version", String(10)),
+    ForeignKeyConstraint(
+        ["cdm_version_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cdm_source_cdm_version_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "cdm_source_name",
+        "cdm_source_abbreviation",
+        "cdm_holder",
+        "source_release_date",
+        "cdm_release_date",
+        "cdm_version_concept_id",
+        "vocabulary_version",
+        name="eh_composite_pk_cdm_source",
+    ),
+)
+
+t_cohort_definition = Table(
+    "cohort_definition",
+    metadata,
+    Column("cohort_definition_id", Integer, primary_key=True),
+    Column("cohort_definition_name", String(255), primary_key=True),
+    Column("definition_type_concept_id", Integer, primary_key=True),
+    Column("subject_concept_id", Integer, primary_key=True),
+    Column("cohort_definition_description", Text),
+    Column("cohort_definition_syntax", Text),
+    Column("cohort_initiation_date", Date),
+    ForeignKeyConstraint(
+        ["definition_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cohort_definition_definition_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["subject_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cohort_definition_subject_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "cohort_definition_id",
+        "cohort_definition_name",
+        "definition_type_concept_id",
+        "subject_concept_id",
+        name="eh_composite_pk_cohort_definition",
+    ),
+)
+
+t_concept_ancestor = Table(
+    "concept_ancestor",
+    metadata,
+    Column("ancestor_concept_id", Integer, primary_key=True),
+    Column("descendant_concept_id", Integer, primary_key=True),
+    Column("min_levels_of_separation", Integer, primary_key=True),
+    Column("max_levels_of_separation", Integer, primary_key=True),
+    ForeignKeyConstraint(
+        ["ancestor_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_concept_ancestor_ancestor_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["descendant_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_concept_ancestor_descendant_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "ancestor_concept_id",
+        "descendant_concept_id",
+        "min_levels_of_separation",
+        "max_levels_of_separation",
+        name="eh_composite_pk_concept_ancestor",
+    ),
+    Index("idx_concept_ancestor_id_1", "ancestor_concept_id"),
+    Index("idx_concept_ancestor_id_2", "descendant_concept_id"),
+)
+
+t_concept_synonym = Table(
+    "concept_synonym",
+    metadata,
+    Column("concept_id", Integer, primary_key=True),
+    Column("concept_synonym_name", String(1000), primary_key=True),
+    Column("language_concept_id", Integer, primary_key=True),
+    ForeignKeyConstraint(
+        ["concept_id"], ["concept.concept_id"], name="fpk_concept_synonym_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["language_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_concept_synonym_language_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "concept_id",
+        "concept_synonym_name",
+        "language_concept_id",
+        name="eh_composite_pk_concept_synonym",
+    ),
+    Index("idx_concept_synonym_id", "concept_id"),
+)
+
+t_cost = Table(
+    "cost",
+    metadata,
+    Column("cost_id", Integer, primary_key=True),
+    Column("cost_event_id", Integer, nullable=False),
+    Column("cost_domain_id", String(20), nullable=False),
+    Column("cost_type_concept_id", Integer, nullable=False),
+    Column("currency_concept_id", Integer),
+    Column("total_charge", Numeric),
+    Column("total_cost", Numeric),
+    Column("total_paid", Numeric),
+    Column("paid_by_payer", Numeric),
+    Column("paid_by_patient", Numeric),
+    Column("paid_patient_copay", Numeric),
+    Column("paid_patient_coinsurance", Numeric),
+    Column("paid_patient_deductible", Numeric),
+    Column("paid_by_primary", Numeric),
+    Column("paid_ingredient_cost", Numeric),
+    Column("paid_dispensing_fee", Numeric),
+    Column("payer_plan_period_id", Integer),
+    Column("amount_allowed", Numeric),
+    Column("revenue_code_concept_id", Integer),
+    Column("revenue_code_source_value", String(50)),
+    Column("drg_concept_id", Integer),
+    Column("drg_source_value", String(3)),
+    ForeignKeyConstraint(
+        ["cost_domain_id"], ["domain.domain_id"], name="fpk_cost_cost_domain_id"
+    ),
+    ForeignKeyConstraint(
+        ["cost_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cost_cost_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["currency_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cost_currency_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["drg_concept_id"], ["concept.concept_id"], name="fpk_cost_drg_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["revenue_code_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_cost_revenue_code_concept_id",
+    ),
+    PrimaryKeyConstraint("cost_id", name="xpk_cost"),
+    Index("idx_cost_event_id", "cost_event_id"),
+)
+
+t_drug_strength = Table(
+    "drug_strength",
+    metadata,
+    Column("drug_concept_id", Integer, primary_key=True),
+    Column("ingredient_concept_id", Integer, primary_key=True),
+    Column("valid_start_date", Date, primary_key=True),
+    Column("valid_end_date", Date, primary_key=True),
+    Column("amount_value", Numeric),
+    Column("amount_unit_concept_id", Integer),
+    Column("numerator_value", Numeric),
+    Column("numerator_unit_concept_id", Integer),
+    Column("denominator_value", Numeric),
+    Column("denominator_unit_concept_id", Integer),
+    Column("box_size", Integer),
+    Column("invalid_reason", String(1)),
+    ForeignKeyConstraint(
+        ["amount_unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_strength_amount_unit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["denominator_unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_strength_denominator_unit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["drug_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_strength_drug_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["ingredient_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_strength_ingredient_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["numerator_unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_strength_numerator_unit_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "drug_concept_id",
+        "ingredient_concept_id",
+        "valid_start_date",
+        "valid_end_date",
+        name="eh_composite_pk_drug_strength",
+    ),
+    Index("idx_drug_strength_id_1", "drug_concept_id"),
+    Index("idx_drug_strength_id_2", "ingredient_concept_id"),
+)
+
+t_fact_relationship = Table(
+    "fact_relationship",
+    metadata,
+    Column("domain_concept_id_1", Integer, primary_key=True),
+    Column("fact_id_1", Integer, primary_key=True),
+    Column("domain_concept_id_2", Integer, primary_key=True),
+    Column("fact_id_2", Integer, primary_key=True),
+    Column("relationship_concept_id", Integer, primary_key=True),
+    ForeignKeyConstraint(
+        ["domain_concept_id_1"],
+        ["concept.concept_id"],
+        name="fpk_fact_relationship_domain_concept_id_1",
+    ),
+    ForeignKeyConstraint(
+        ["domain_concept_id_2"],
+        ["concept.concept_id"],
+        name="fpk_fact_relationship_domain_concept_id_2",
+    ),
+    ForeignKeyConstraint(
+        ["relationship_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_fact_relationship_relationship_concept_id",
+    ),
+    PrimaryKeyConstraint(
+        "domain_concept_id_1",
+        "fact_id_1",
+        "domain_concept_id_2",
+        "fact_id_2",
+        "relationship_concept_id",
+        name="eh_composite_pk_fact_relationship",
+    ),
+    Index("idx_fact_relationship_id1", "domain_concept_id_1"),
+    Index("idx_fact_relationship_id2", "domain_concept_id_2"),
+    Index("idx_fact_relationship_id3", "relationship_concept_id"),
+)
+
+t_location = Table(
+    "location",
+    metadata,
+    Column("location_id", Integer, primary_key=True),
+    Column("address_1", String(50)),
+    Column("address_2", String(50)),
+    Column("city", String(50)),
+    Column("state", String(2)),
+    Column("zip", String(9)),
+    Column("county", String(20)),
+    Column("location_source_value", String(50)),
+    Column("country_concept_id", Integer),
+    Column("country_source_value", String(80)),
+    Column("latitude", Numeric),
+    Column("longitude", Numeric),
+    ForeignKeyConstraint(
+        ["country_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_location_country_concept_id",
+    ),
+    PrimaryKeyConstraint("location_id", name="xpk_location"),
+    Index("idx_location_id_1", "location_id"),
+)
+
+t_metadata = Table(
+    "metadata",
+    metadata,
+    Column("metadata_id", Integer, primary_key=True),
+    Column("metadata_concept_id", Integer, nullable=False),
+    Column("metadata_type_concept_id", Integer, nullable=False),
+    Column("name", String(250), nullable=False),
+    Column("value_as_string", String(250)),
+    Column("value_as_concept_id", Integer),
+    Column("value_as_number", Numeric),
+    Column("metadata_date", Date),
+    Column("metadata_datetime", DateTime),
+    ForeignKeyConstraint(
+        ["metadata_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_metadata_metadata_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["metadata_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_metadata_metadata_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["value_as_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_metadata_value_as_concept_id",
+    ),
+    PrimaryKeyConstraint("metadata_id", name="xpk_metadata"),
+    Index("idx_metadata_concept_id_1", "metadata_concept_id"),
+)
+
+t_note_nlp = Table(
+    "note_nlp",
+    metadata,
+    Column("note_nlp_id", Integer, primary_key=True),
+    Column("note_id", Integer, nullable=False),
+    Column("lexical_variant", String(250), nullable=False),
+    Column("nlp_date", Date, nullable=False),
+    Column("section_concept_id", Integer),
+    Column("snippet", String(250)),
+    Column("offset", String(50)),
+    Column("note_nlp_concept_id", Integer),
+    Column("note_nlp_source_concept_id", Integer),
+    Column("nlp_system", String(250)),
+    Column("nlp_datetime", DateTime),
+    Column("term_exists", String(1)),
+    Column("term_temporal", String(50)),
+    Column("term_modifiers", String(2000)),
+    ForeignKeyConstraint(
+        ["note_nlp_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_nlp_note_nlp_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["note_nlp_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_nlp_note_nlp_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["section_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_nlp_section_concept_id",
+    ),
+    PrimaryKeyConstraint("note_nlp_id", name="xpk_note_nlp"),
+    Index("idx_note_nlp_concept_id_1", "note_nlp_concept_id"),
+    Index("idx_note_nlp_note_id_1", "note_id"),
+)
+
+t_relationship = Table(
+    "relationship",
+    metadata,
+    Column("relationship_id", String(20), primary_key=True),
+    Column("relationship_name", String(255), nullable=False),
+    Column("is_hierarchical", String(1), nullable=False),
+    Column("defines_ancestry", String(1), nullable=False),
+    Column("reverse_relationship_id", String(20), nullable=False),
+    Column("relationship_concept_id", Integer, nullable=False),
+    ForeignKeyConstraint(
+        ["relationship_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_relationship_relationship_concept_id",
+    ),
+    PrimaryKeyConstraint("relationship_id", name="xpk_relationship"),
+    Index("idx_relationship_rel_id", "relationship_id"),
+)
+
+t_source_to_concept_map = Table(
+    "source_to_concept_map",
+    metadata,
+    Column("source_code", String(50), primary_key=True),
+    Column("source_concept_id", Integer, primary_key=True),
+    Column("source_vocabulary_id", String(20), primary_key=True),
+    Column("target_concept_id", Integer, primary_key=True),
+    Column("target_vocabulary_id", String(20), primary_key=True),
+    Column("valid_start_date", Date, primary_key=True),
+    Column("valid_end_date", Date, primary_key=True),
+    Column("source_code_description", String(255)),
+    Column("invalid_reason", String(1)),
+    ForeignKeyConstraint(
+        ["source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_source_to_concept_map_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["target_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_source_to_concept_map_target_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["target_vocabulary_id"],
+        ["vocabulary.vocabulary_id"],
+        name="fpk_source_to_concept_map_target_vocabulary_id",
+    ),
+    PrimaryKeyConstraint(
+        "source_code",
+        "source_concept_id",
+        "source_vocabulary_id",
+        "target_concept_id",
+        "target_vocabulary_id",
+        "valid_start_date",
+        "valid_end_date",
+        name="eh_composite_pk_source_to_concept_map",
+    ),
+    Index("idx_source_to_concept_map_1", "source_vocabulary_id"),
+    Index("idx_source_to_concept_map_2", "target_vocabulary_id"),
+    Index("idx_source_to_concept_map_3", "target_concept_id"),
+    Index("idx_source_to_concept_map_c", "source_code"),
+)
+
+t_care_site = Table(
+    "care_site",
+    metadata,
+    Column("care_site_id", Integer, primary_key=True),
+    Column("care_site_name", String(255)),
+    Column("place_of_service_concept_id", Integer),
+    Column("location_id", Integer),
+    Column("care_site_source_value", String(50)),
+    Column("place_of_service_source_value", String(50)),
+    ForeignKeyConstraint(
+        ["location_id"], ["location.location_id"], name="fpk_care_site_location_id"
+    ),
+    ForeignKeyConstraint(
+        ["place_of_service_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_care_site_place_of_service_concept_id",
+    ),
+    PrimaryKeyConstraint("care_site_id", name="xpk_care_site"),
+    Index("idx_care_site_id_1", "care_site_id"),
+)
+
+t_concept_relationship = Table(
+    "concept_relationship",
+    metadata,
+    Column("concept_id_1", Integer, primary_key=True),
+    Column("concept_id_2", Integer, primary_key=True),
+    Column("relationship_id", String(20), primary_key=True),
+    Column("valid_start_date", Date, primary_key=True),
+    Column("valid_end_date", Date, primary_key=True),
+    Column("invalid_reason", String(1)),
+    ForeignKeyConstraint(
+        ["concept_id_1"],
+        ["concept.concept_id"],
+        name="fpk_concept_relationship_concept_id_1",
+    ),
+    ForeignKeyConstraint(
+        ["concept_id_2"],
+        ["concept.concept_id"],
+        name="fpk_concept_relationship_concept_id_2",
+    ),
+    ForeignKeyConstraint(
+        ["relationship_id"],
+        ["relationship.relationship_id"],
+        name="fpk_concept_relationship_relationship_id",
+    ),
+    PrimaryKeyConstraint(
+        "concept_id_1",
+        "concept_id_2",
+        "relationship_id",
+        "valid_start_date",
+        "valid_end_date",
+        name="eh_composite_pk_concept_relationship",
+    ),
+    Index("idx_concept_relationship_id_1", "concept_id_1"),
+    Index("idx_concept_relationship_id_2", "concept_id_2"),
+    Index("idx_concept_relationship_id_3", "relationship_id"),
+)
+
+t_provider = Table(
+    "provider",
+    metadata,
+    Column("provider_id", Integer, primary_key=True),
+    Column("provider_name", String(255)),
+    Column("npi", String(20)),
+    Column("dea", String(20)),
+    Column("specialty_concept_id", Integer),
+    Column("care_site_id", Integer),
+    Column("year_of_birth", Integer),
+    Column("gender_concept_id", Integer),
+    Column("provider_source_value", String(50)),
+    Column("specialty_source_value", String(50)),
+    Column("specialty_source_concept_id", Integer),
+    Column("gender_source_value", String(50)),
+    Column("gender_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["care_site_id"], ["care_site.care_site_id"], name="fpk_provider_care_site_id"
+    ),
+    ForeignKeyConstraint(
+        ["gender_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_provider_gender_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["gender_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_provider_gender_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["specialty_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_provider_specialty_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["specialty_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_provider_specialty_source_concept_id",
+    ),
+    PrimaryKeyConstraint("provider_id", name="xpk_provider"),
+    Index("idx_provider_id_1", "provider_id"),
+)
+
+t_person = Table(
+    "person",
+    metadata,
+    Column("person_id", Integer, primary_key=True),
+    Column("gender_concept_id", Integer, nullable=False),
+    Column("year_of_birth", Integer, nullable=False),
+    Column("race_concept_id", Integer, nullable=False),
+    Column("ethnicity_concept_id", Integer, nullable=False),
+    Column("month_of_birth", Integer),
+    Column("day_of_birth", Integer),
+    Column("birth_datetime", DateTime),
+    Column("location_id", Integer),
+    Column("provider_id", Integer),
+    Column("care_site_id", Integer),
+    Column("person_source_value", String(50)),
+    Column("gender_source_value", String(50)),
+    Column("gender_source_concept_id", Integer),
+    Column("race_source_value", String(50)),
+    Column("race_source_concept_id", Integer),
+    Column("ethnicity_source_value", String(50)),
+    Column("ethnicity_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["care_site_id"], ["care_site.care_site_id"], name="fpk_person_care_site_id"
+    ),
+    ForeignKeyConstraint(
+        ["ethnicity_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_person_ethnicity_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["ethnicity_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_person_ethnicity_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["gender_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_person_gender_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["gender_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_person_gender_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["location_id"], ["location.location_id"], name="fpk_person_location_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_person_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["race_concept_id"], ["concept.concept_id"], name="fpk_person_race_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["race_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_person_race_source_concept_id",
+    ),
+    PrimaryKeyConstraint("person_id", name="xpk_person"),
+    Index("idx_gender", "gender_concept_id"),
+    Index("idx_person_id", "person_id"),
+)
+
+t_condition_era = Table(
+    "condition_era",
+    metadata,
+    Column("condition_era_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("condition_concept_id", Integer, nullable=False),
+    Column("condition_era_start_date", Date, nullable=False),
+    Column("condition_era_end_date", Date, nullable=False),
+    Column("condition_occurrence_count", Integer),
+    ForeignKeyConstraint(
+        ["condition_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_condition_era_condition_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_condition_era_person_id"
+    ),
+    PrimaryKeyConstraint("condition_era_id", name="xpk_condition_era"),
+    Index("idx_condition_era_concept_id_1", "condition_concept_id"),
+    Index("idx_condition_era_person_id_1", "person_id"),
+)
+
+t_death = Table(
+    "death",
+    metadata,
+    Column("person_id", Integer, primary_key=True),
+    Column("death_date", Date, primary_key=True),
+    Column("death_datetime", DateTime),
+    Column("death_type_concept_id", Integer),
+    Column("cause_concept_id", Integer),
+    Column("cause_source_value", String(50)),
+    Column("cause_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["cause_concept_id"], ["concept.concept_id"], name="fpk_death_cause_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["cause_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_death_cause_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["death_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_death_death_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_death_person_id"
+    ),
+    PrimaryKeyConstraint("person_id", "death_date", name="eh_composite_pk_death"),
+    Index("idx_death_person_id_1", "person_id"),
+)
+
+t_dose_era = Table(
+    "dose_era",
+    metadata,
+    Column("dose_era_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("drug_concept_id", Integer, nullable=False),
+    Column("unit_concept_id", Integer, nullable=False),
+    Column("dose_value", Numeric, nullable=False),
+    Column("dose_era_start_date", Date, nullable=False),
+    Column("dose_era_end_date", Date, nullable=False),
+    ForeignKeyConstraint(
+        ["drug_concept_id"], ["concept.concept_id"], name="fpk_dose_era_drug_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_dose_era_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["unit_concept_id"], ["concept.concept_id"], name="fpk_dose_era_unit_concept_id"
+    ),
+    PrimaryKeyConstraint("dose_era_id", name="xpk_dose_era"),
+    Index("idx_dose_era_concept_id_1", "drug_concept_id"),
+    Index("idx_dose_era_person_id_1", "person_id"),
+)
+
+t_drug_era = Table(
+    "drug_era",
+    metadata,
+    Column("drug_era_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("drug_concept_id", Integer, nullable=False),
+    Column("drug_era_start_date", Date, nullable=False),
+    Column("drug_era_end_date", Date, nullable=False),
+    Column("drug_exposure_count", Integer),
+    Column("gap_days", Integer),
+    ForeignKeyConstraint(
+        ["drug_concept_id"], ["concept.concept_id"], name="fpk_drug_era_drug_concept_id"
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_drug_era_person_id"
+    ),
+    PrimaryKeyConstraint("drug_era_id", name="xpk_drug_era"),
+    Index("idx_drug_era_concept_id_1", "drug_concept_id"),
+    Index("idx_drug_era_person_id_1", "person_id"),
+)
+
+t_episode = Table(
+    "episode",
+    metadata,
+    Column("episode_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("episode_concept_id", Integer, nullable=False),
+    Column("episode_start_date", Date, nullable=False),
+    Column("episode_object_concept_id", Integer, nullable=False),
+    Column("episode_type_concept_id", Integer, nullable=False),
+    Column("episode_start_datetime", DateTime),
+    Column("episode_end_date", Date),
+    Column("episode_end_datetime", DateTime),
+    Column("episode_parent_id", Integer),
+    Column("episode_number", Integer),
+    Column("episode_source_value", String(50)),
+    Column("episode_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["episode_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_episode_episode_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["episode_object_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_episode_episode_object_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["episode_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_episode_episode_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["episode_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_episode_episode_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_episode_person_id"
+    ),
+    PrimaryKeyConstraint("episode_id", name="xpk_episode"),
+)
+
+t_observation_period = Table(
+    "observation_period",
+    metadata,
+    Column("observation_period_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("observation_period_start_date", Date, nullable=False),
+    Column("observation_period_end_date", Date, nullable=False),
+    Column("period_type_concept_id", Integer, nullable=False),
+    ForeignKeyConstraint(
+        ["period_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_period_period_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_observation_period_person_id"
+    ),
+    PrimaryKeyConstraint("observation_period_id", name="xpk_observation_period"),
+    Index("idx_observation_period_id_1", "person_id"),
+)
+
+t_payer_plan_period = Table(
+    "payer_plan_period",
+    metadata,
+    Column("payer_plan_period_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("payer_plan_period_start_date", Date, nullable=False),
+    Column("payer_plan_period_end_date", Date, nullable=False),
+    Column("payer_concept_id", Integer),
+    Column("payer_source_value", String(50)),
+    Column("payer_source_concept_id", Integer),
+    Column("plan_concept_id", Integer),
+    Column("plan_source_value", String(50)),
+    Column("plan_source_concept_id", Integer),
+    Column("sponsor_concept_id", Integer),
+    Column("sponsor_source_value", String(50)),
+    Column("sponsor_source_concept_id", Integer),
+    Column("family_source_value", String(50)),
+    Column("stop_reason_concept_id", Integer),
+    Column("stop_reason_source_value", String(50)),
+    Column("stop_reason_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["payer_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_payer_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["payer_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_payer_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_payer_plan_period_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["plan_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_plan_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["plan_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_plan_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["sponsor_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_sponsor_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["sponsor_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_sponsor_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["stop_reason_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_stop_reason_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["stop_reason_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_payer_plan_period_stop_reason_source_concept_id",
+    ),
+    PrimaryKeyConstraint("payer_plan_period_id", name="xpk_payer_plan_period"),
+    Index("idx_period_person_id_1", "person_id"),
+)
+
+t_specimen = Table(
+    "specimen",
+    metadata,
+    Column("specimen_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("specimen_concept_id", Integer, nullable=False),
+    Column("specimen_type_concept_id", Integer, nullable=False),
+    Column("specimen_date", Date, nullable=False),
+    Column("specimen_datetime", DateTime),
+    Column("quantity", Numeric),
+    Column("unit_concept_id", Integer),
+    Column("anatomic_site_concept_id", Integer),
+    Column("disease_status_concept_id", Integer),
+    Column("specimen_source_id", String(50)),
+    Column("specimen_source_value", String(50)),
+    Column("unit_source_value", String(50)),
+    Column("anatomic_site_source_value", String(50)),
+    Column("disease_status_source_value", String(50)),
+    ForeignKeyConstraint(
+        ["anatomic_site_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_specimen_anatomic_site_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["disease_status_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_specimen_disease_status_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_specimen_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["specimen_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_specimen_specimen_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["specimen_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_specimen_specimen_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["unit_concept_id"], ["concept.concept_id"], name="fpk_specimen_unit_concept_id"
+    ),
+    PrimaryKeyConstraint("specimen_id", name="xpk_specimen"),
+    Index("idx_specimen_concept_id_1", "specimen_concept_id"),
+    Index("idx_specimen_person_id_1", "person_id"),
+)
+
+t_visit_occurrence = Table(
+    "visit_occurrence",
+    metadata,
+    Column("visit_occurrence_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("visit_concept_id", Integer, nullable=False),
+    Column("visit_start_date", Date, nullable=False),
+    Column("visit_end_date", Date, nullable=False),
+    Column("visit_type_concept_id", Integer, nullable=False),
+    Column("visit_start_datetime", DateTime),
+    Column("visit_end_datetime", DateTime),
+    Column("provider_id", Integer),
+    Column("care_site_id", Integer),
+    Column("visit_source_value", String(50)),
+    Column("visit_source_concept_id", Integer),
+    Column("admitted_from_concept_id", Integer),
+    Column("admitted_from_source_value", String(50)),
+    Column("discharged_to_concept_id", Integer),
+    Column("discharged_to_source_value", String(50)),
+    Column("preceding_visit_occurrence_id", Integer),
+    ForeignKeyConstraint(
+        ["admitted_from_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_occurrence_admitted_from_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["care_site_id"],
+        ["care_site.care_site_id"],
+        name="fpk_visit_occurrence_care_site_id",
+    ),
+    ForeignKeyConstraint(
+        ["discharged_to_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_occurrence_discharged_to_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_visit_occurrence_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["preceding_visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_visit_occurrence_preceding_visit_occurrence_id",
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"],
+        ["provider.provider_id"],
+        name="fpk_visit_occurrence_provider_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_occurrence_visit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_occurrence_visit_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_occurrence_visit_type_concept_id",
+    ),
+    PrimaryKeyConstraint("visit_occurrence_id", name="xpk_visit_occurrence"),
+    Index("idx_visit_concept_id_1", "visit_concept_id"),
+    Index("idx_visit_person_id_1", "person_id"),
+)
+
+t_episode_event = Table(
+    "episode_event",
+    metadata,
+    Column("episode_id", Integer, primary_key=True),
+    Column("event_id", Integer, primary_key=True),
+    Column("episode_event_field_concept_id", Integer, primary_key=True),
+    ForeignKeyConstraint(
+        ["episode_event_field_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_episode_event_episode_event_field_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["episode_id"], ["episode.episode_id"], name="fpk_episode_event_episode_id"
+    ),
+    PrimaryKeyConstraint(
+        "episode_id",
+        "event_id",
+        "episode_event_field_concept_id",
+        name="eh_composite_pk_episode_event",
+    ),
+)
+
+t_visit_detail = Table(
+    "visit_detail",
+    metadata,
+    Column("visit_detail_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("visit_detail_concept_id", Integer, nullable=False),
+    Column("visit_detail_start_date", Date, nullable=False),
+    Column("visit_detail_end_date", Date, nullable=False),
+    Column("visit_detail_type_concept_id", Integer, nullable=False),
+    Column("visit_occurrence_id", Integer, nullable=False),
+    Column("visit_detail_start_datetime", DateTime),
+    Column("visit_detail_end_datetime", DateTime),
+    Column("provider_id", Integer),
+    Column("care_site_id", Integer),
+    Column("visit_detail_source_value", String(50)),
+    Column("visit_detail_source_concept_id", Integer),
+    Column("admitted_from_concept_id", Integer),
+    Column("admitted_from_source_value", String(50)),
+    Column("discharged_to_source_value", String(50)),
+    Column("discharged_to_concept_id", Integer),
+    Column("preceding_visit_detail_id", Integer),
+    Column("parent_visit_detail_id", Integer),
+    ForeignKeyConstraint(
+        ["admitted_from_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_detail_admitted_from_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["care_site_id"],
+        ["care_site.care_site_id"],
+        name="fpk_visit_detail_care_site_id",
+    ),
+    ForeignKeyConstraint(
+        ["discharged_to_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_detail_discharged_to_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["parent_visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_visit_detail_parent_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_visit_detail_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["preceding_visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_visit_detail_preceding_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_visit_detail_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_detail_visit_detail_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_detail_visit_detail_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_visit_detail_visit_detail_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_visit_detail_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("visit_detail_id", name="xpk_visit_detail"),
+    Index("idx_visit_det_concept_id_1", "visit_detail_concept_id"),
+    Index("idx_visit_det_occ_id", "visit_occurrence_id"),
+    Index("idx_visit_det_person_id_1", "person_id"),
+)
+
+t_condition_occurrence = Table(
+    "condition_occurrence",
+    metadata,
+    Column("condition_occurrence_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("condition_concept_id", Integer, nullable=False),
+    Column("condition_start_date", Date, nullable=False),
+    Column("condition_type_concept_id", Integer, nullable=False),
+    Column("condition_start_datetime", DateTime),
+    Column("condition_end_date", Date),
+    Column("condition_end_datetime", DateTime),
+    Column("condition_status_concept_id", Integer),
+    Column("stop_reason", String(20)),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("condition_source_value", String(50)),
+    Column("condition_source_concept_id", Integer),
+    Column("condition_status_source_value", String(50)),
+    ForeignKeyConstraint(
+        ["condition_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_condition_occurrence_condition_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["condition_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_condition_occurrence_condition_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["condition_status_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_condition_occurrence_condition_status_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["condition_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_condition_occurrence_condition_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_condition_occurrence_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"],
+        ["provider.provider_id"],
+        name="fpk_condition_occurrence_provider_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_condition_occurrence_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_condition_occurrence_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("condition_occurrence_id", name="xpk_condition_occurrence"),
+    Index("idx_condition_concept_id_1", "condition_concept_id"),
+    Index("idx_condition_person_id_1", "person_id"),
+    Index("idx_condition_visit_id_1", "visit_occurrence_id"),
+)
+
+t_device_exposure = Table(
+    "device_exposure",
+    metadata,
+    Column("device_exposure_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("device_concept_id", Integer, nullable=False),
+    Column("device_exposure_start_date", Date, nullable=False),
+    Column("device_type_concept_id", Integer, nullable=False),
+    Column("device_exposure_start_datetime", DateTime),
+    Column("device_exposure_end_date", Date),
+    Column("device_exposure_end_datetime", DateTime),
+    Column("unique_device_id", String(255)),
+    Column("production_id", String(255)),
+    Column("quantity", Integer),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("device_source_value", String(50)),
+    Column("device_source_concept_id", Integer),
+    Column("unit_concept_id", Integer),
+    Column("unit_source_value", String(50)),
+    Column("unit_source_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["device_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_device_exposure_device_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["device_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_device_exposure_device_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["device_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_device_exposure_device_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_device_exposure_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"],
+        ["provider.provider_id"],
+        name="fpk_device_exposure_provider_id",
+    ),
+    ForeignKeyConstraint(
+        ["unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_device_exposure_unit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["unit_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_device_exposure_unit_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_device_exposure_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_device_exposure_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("device_exposure_id", name="xpk_device_exposure"),
+    Index("idx_device_concept_id_1", "device_concept_id"),
+    Index("idx_device_person_id_1", "person_id"),
+    Index("idx_device_visit_id_1", "visit_occurrence_id"),
+)
+
+t_drug_exposure = Table(
+    "drug_exposure",
+    metadata,
+    Column("drug_exposure_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("drug_concept_id", Integer, nullable=False),
+    Column("drug_exposure_start_date", Date, nullable=False),
+    Column("drug_exposure_end_date", Date, nullable=False),
+    Column("drug_type_concept_id", Integer, nullable=False),
+    Column("drug_exposure_start_datetime", DateTime),
+    Column("drug_exposure_end_datetime", DateTime),
+    Column("verbatim_end_date", Date),
+    Column("stop_reason", String(20)),
+    Column("refills", Integer),
+    Column("quantity", Numeric),
+    Column("days_supply", Integer),
+    Column("sig", Text),
+    Column("route_concept_id", Integer),
+    Column("lot_number", String(50)),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("drug_source_value", String(50)),
+    Column("drug_source_concept_id", Integer),
+    Column("route_source_value", String(50)),
+    Column("dose_unit_source_value", String(50)),
+    ForeignKeyConstraint(
+        ["drug_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_exposure_drug_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["drug_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_exposure_drug_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["drug_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_exposure_drug_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_drug_exposure_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_drug_exposure_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["route_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_drug_exposure_route_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_drug_exposure_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_drug_exposure_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("drug_exposure_id", name="xpk_drug_exposure"),
+    Index("idx_drug_concept_id_1", "drug_concept_id"),
+    Index("idx_drug_person_id_1", "person_id"),
+    Index("idx_drug_visit_id_1", "visit_occurrence_id"),
+)
+
+t_measurement = Table(
+    "measurement",
+    metadata,
+    Column("measurement_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("measurement_concept_id", Integer, nullable=False),
+    Column("measurement_date", Date, nullable=False),
+    Column("measurement_type_concept_id", Integer, nullable=False),
+    Column("measurement_datetime", DateTime),
+    Column("measurement_time", String(10)),
+    Column("operator_concept_id", Integer),
+    Column("value_as_number", Numeric),
+    Column("value_as_concept_id", Integer),
+    Column("unit_concept_id", Integer),
+    Column("range_low", Numeric),
+    Column("range_high", Numeric),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("measurement_source_value", String(50)),
+    Column("measurement_source_concept_id", Integer),
+    Column("unit_source_value", String(50)),
+    Column("unit_source_concept_id", Integer),
+    Column("value_source_value", String(50)),
+    Column("measurement_event_id", Integer),
+    Column("meas_event_field_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["meas_event_field_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_meas_event_field_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["measurement_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_measurement_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["measurement_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_measurement_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["measurement_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_measurement_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["operator_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_operator_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_measurement_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_measurement_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_unit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["unit_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_unit_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["value_as_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_measurement_value_as_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_measurement_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_measurement_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("measurement_id", name="xpk_measurement"),
+    Index("idx_measurement_concept_id_1", "measurement_concept_id"),
+    Index("idx_measurement_person_id_1", "person_id"),
+    Index("idx_measurement_visit_id_1", "visit_occurrence_id"),
+)
+
+t_note = Table(
+    "note",
+    metadata,
+    Column("note_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("note_date", Date, nullable=False),
+    Column("note_type_concept_id", Integer, nullable=False),
+    Column("note_class_concept_id", Integer, nullable=False),
+    Column("note_text", Text, nullable=False),
+    Column("encoding_concept_id", Integer, nullable=False),
+    Column("language_concept_id", Integer, nullable=False),
+    Column("note_datetime", DateTime),
+    Column("note_title", String(250)),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("note_source_value", String(50)),
+    Column("note_event_id", Integer),
+    Column("note_event_field_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["encoding_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_encoding_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["language_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_language_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["note_class_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_note_class_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["note_event_field_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_note_event_field_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["note_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_note_note_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_note_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_note_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_note_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_note_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("note_id", name="xpk_note"),
+    Index("idx_note_concept_id_1", "note_type_concept_id"),
+    Index("idx_note_person_id_1", "person_id"),
+    Index("idx_note_visit_id_1", "visit_occurrence_id"),
+)
+
+t_observation = Table(
+    "observation",
+    metadata,
+    Column("observation_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("observation_concept_id", Integer, nullable=False),
+    Column("observation_date", Date, nullable=False),
+    Column("observation_type_concept_id", Integer, nullable=False),
+    Column("observation_datetime", DateTime),
+    Column("value_as_number", Numeric),
+    Column("value_as_string", String(60)),
+    Column("value_as_concept_id", Integer),
+    Column("qualifier_concept_id", Integer),
+    Column("unit_concept_id", Integer),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("observation_source_value", String(50)),
+    Column("observation_source_concept_id", Integer),
+    Column("unit_source_value", String(50)),
+    Column("qualifier_source_value", String(50)),
+    Column("value_source_value", String(50)),
+    Column("observation_event_id", Integer),
+    Column("obs_event_field_concept_id", Integer),
+    ForeignKeyConstraint(
+        ["obs_event_field_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_obs_event_field_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["observation_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_observation_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["observation_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_observation_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["observation_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_observation_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_observation_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"], ["provider.provider_id"], name="fpk_observation_provider_id"
+    ),
+    ForeignKeyConstraint(
+        ["qualifier_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_qualifier_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["unit_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_unit_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["value_as_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_observation_value_as_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_observation_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_observation_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("observation_id", name="xpk_observation"),
+    Index("idx_observation_concept_id_1", "observation_concept_id"),
+    Index("idx_observation_person_id_1", "person_id"),
+    Index("idx_observation_visit_id_1", "visit_occurrence_id"),
+)
+
+t_procedure_occurrence = Table(
+    "procedure_occurrence",
+    metadata,
+    Column("procedure_occurrence_id", Integer, primary_key=True),
+    Column("person_id", Integer, nullable=False),
+    Column("procedure_concept_id", Integer, nullable=False),
+    Column("procedure_date", Date, nullable=False),
+    Column("procedure_type_concept_id", Integer, nullable=False),
+    Column("procedure_datetime", DateTime),
+    Column("procedure_end_date", Date),
+    Column("procedure_end_datetime", DateTime),
+    Column("modifier_concept_id", Integer),
+    Column("quantity", Integer),
+    Column("provider_id", Integer),
+    Column("visit_occurrence_id", Integer),
+    Column("visit_detail_id", Integer),
+    Column("procedure_source_value", String(50)),
+    Column("procedure_source_concept_id", Integer),
+    Column("modifier_source_value", String(50)),
+    ForeignKeyConstraint(
+        ["modifier_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_procedure_occurrence_modifier_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["person_id"], ["person.person_id"], name="fpk_procedure_occurrence_person_id"
+    ),
+    ForeignKeyConstraint(
+        ["procedure_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_procedure_occurrence_procedure_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["procedure_source_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_procedure_occurrence_procedure_source_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["procedure_type_concept_id"],
+        ["concept.concept_id"],
+        name="fpk_procedure_occurrence_procedure_type_concept_id",
+    ),
+    ForeignKeyConstraint(
+        ["provider_id"],
+        ["provider.provider_id"],
+        name="fpk_procedure_occurrence_provider_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_detail_id"],
+        ["visit_detail.visit_detail_id"],
+        name="fpk_procedure_occurrence_visit_detail_id",
+    ),
+    ForeignKeyConstraint(
+        ["visit_occurrence_id"],
+        ["visit_occurrence.visit_occurrence_id"],
+        name="fpk_procedure_occurrence_visit_occurrence_id",
+    ),
+    PrimaryKeyConstraint("procedure_occurrence_id", name="xpk_procedure_occurrence"),
+    Index("idx_procedure_concept_id_1", "procedure_concept_id"),
+    Index("idx_procedure_person_id_1", "person_id"),
+    Index("idx_procedure_visit_id_1", "visit_occurrence_id"),
+)
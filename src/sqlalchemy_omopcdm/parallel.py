@@ -0,0 +1,111 @@
+"""Parallel loading of OMOP CDM tables in foreign key dependency order
+
+The tables are grouped into tiers where every table only references tables in
+earlier tiers, and the tables within a tier are loaded concurrently, each by a
+worker with its own connection and transaction.
+
+The vocabulary tables concept, domain, vocabulary and concept_class reference
+each other (concept.domain_id -> domain, domain.domain_concept_id -> concept,
+etc.) so no order satisfies their foreign keys. Those references are ignored
+when computing the tiers which places the four tables in the same tier; load
+them before their foreign keys exist (see ddl.create_foreign_keys).
+"""
+
+import concurrent.futures
+import os
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+from sqlalchemy import Engine, MetaData, Table
+
+from .bulk import DEFAULT_CHUNK_SIZE, Rows, bulk_load
+from .ddl import TableSpec, resolve_tables
+
+VOCABULARY_CYCLE = frozenset({"concept", "concept_class", "domain", "vocabulary"})
+
+Source = Union[Rows, Callable[[], Rows]]
+
+
+def _dependencies(table: Table, names: set[str]) -> set[str]:
+    """the other selected tables the given table references"""
+    dependencies = set()
+    for constraint in table.foreign_key_constraints:
+        referred = constraint.referred_table.name
+        if referred == table.name or referred not in names:
+            continue
+        if table.name in VOCABULARY_CYCLE and referred in VOCABULARY_CYCLE:
+            continue
+        dependencies.add(referred)
+    return dependencies
+
+
+def dependency_tiers(
+    tables: Optional[Iterable[TableSpec]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> list[list[Table]]:
+    """
+    group the given tables (default: all) into tiers which can be loaded in
+    order, with each tier's tables loaded in parallel; references to tables
+    outside the selection and self-references are ignored
+    """
+    selected = {table.name: table for table in resolve_tables(tables, metadata)}
+    pending = {
+        name: _dependencies(table, set(selected)) for name, table in selected.items()
+    }
+    tiers = []
+    while pending:
+        ready = sorted(name for name, deps in pending.items() if not deps)
+        if not ready:
+            raise ValueError(f"circular foreign keys between tables: {sorted(pending)}")
+        tiers.append([selected[name] for name in ready])
+        for name in ready:
+            del pending[name]
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return tiers
+
+
+def _load_table(engine: Engine, table: Table, source: Source, chunk_size: int) -> int:
+    """load one table in its own connection and transaction"""
+    rows = source() if callable(source) else source
+    with engine.begin() as connection:
+        return bulk_load(connection, table, rows, chunk_size=chunk_size)
+
+
+def load_parallel(
+    engine: Engine,
+    sources: Mapping[TableSpec, Source],
+    *,
+    metadata: Optional[MetaData] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """
+    load each table in sources (keyed by model, Table or table name) using a
+    thread pool, one dependency tier at a time, returning the rows loaded per
+    table name
+
+    sources values may be anything bulk_load accepts, or a zero-argument
+    callable returning such a value (e.g. a function which opens a file) which
+    is called in the worker. Workers check connections out of the engine's
+    pool, so size the pool for max_workers (default: the CPU count). The first
+    failing table's exception is raised once the running loads have finished;
+    tiers after the failing one are not started.
+    """
+    by_name = {
+        table.name: (table, source)
+        for table, source in zip(resolve_tables(sources, metadata), sources.values())
+    }
+    workers = max_workers or os.cpu_count() or 1
+    counts: dict[str, int] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for tier in dependency_tiers(list(by_name), metadata=metadata):
+            futures = {
+                executor.submit(
+                    _load_table, engine, table, by_name[table.name][1], chunk_size
+                ): table.name
+                for table in tier
+            }
+            for future in concurrent.futures.as_completed(futures):
+                counts[futures[future]] = future.result()
+    return counts
@@ -0,0 +1,130 @@
+"""PostgreSQL declarative partitioning for the large clinical fact tables
+
+partitioned_metadata() returns a copy of the model metadata in which the
+chosen fact tables are emitted as ``PARTITION BY HASH (person_id)`` or
+``PARTITION BY RANGE (<date column>)`` parents, with their child partitions
+created right after the parent. PostgreSQL requires the partition key to be
+part of the primary key, so it is appended to the copy's primary key (e.g.
+xpk_measurement becomes (measurement_id, person_id)). The existing idx_*
+indexes are declared on the parent, which makes PostgreSQL create a
+partition-local index on every child.
+
+The ORM models are unchanged and query the partitioned parent like any other
+table. Both ddl phases and create_all() can be used with the copy; other
+dialects ignore the partitioning.
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence, Union, cast
+
+from sqlalchemy import DDL, MetaData, PrimaryKeyConstraint, Table, event
+
+from .ddl import copy_metadata
+
+# the fact tables and the date column each is range partitioned on
+FACT_TABLE_DATE_COLUMNS = {
+    "condition_occurrence": "condition_start_date",
+    "drug_exposure": "drug_exposure_start_date",
+    "measurement": "measurement_date",
+    "observation": "observation_date",
+    "procedure_occurrence": "procedure_date",
+}
+
+
+@dataclass(frozen=True)
+class HashPartitioning:
+    """hash partitioning into modulus partitions, by default on person_id"""
+
+    modulus: int = 16
+    column: str = "person_id"
+
+
+@dataclass(frozen=True)
+class RangePartitioning:
+    """
+    range partitioning on a date column (default: the FACT_TABLE_DATE_COLUMNS
+    entry) with one partition between each pair of consecutive bounds, plus a
+    default partition for rows outside them
+    """
+
+    bounds: Sequence[datetime.date]
+    column: Optional[str] = None
+    default: bool = True
+
+
+Partitioning = Union[HashPartitioning, RangePartitioning]
+
+
+def yearly_bounds(first_year: int, last_year: int) -> list[datetime.date]:
+    """range bounds for one partition per year from first_year to last_year"""
+    return [datetime.date(year, 1, 1) for year in range(first_year, last_year + 2)]
+
+
+def _partition_column(table: Table, scheme: Partitioning) -> str:
+    """the column the table is partitioned on"""
+    if isinstance(scheme, RangePartitioning):
+        return scheme.column or FACT_TABLE_DATE_COLUMNS[table.name]
+    return scheme.column
+
+
+def partition_statements(scheme: Partitioning) -> list[str]:
+    """the CREATE TABLE ... PARTITION OF statements for the child partitions"""
+    if isinstance(scheme, HashPartitioning):
+        return [
+            f"CREATE TABLE %(fullname)s_p{remainder} PARTITION OF %(fullname)s "
+            f"FOR VALUES WITH (MODULUS {scheme.modulus}, REMAINDER {remainder})"
+            for remainder in range(scheme.modulus)
+        ]
+    statements = [
+        f"CREATE TABLE %(fullname)s_{start:%Y%m%d} PARTITION OF %(fullname)s "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        for start, end in zip(scheme.bounds, scheme.bounds[1:])
+    ]
+    if scheme.default:
+        statements.append(
+            "CREATE TABLE %(fullname)s_default PARTITION OF %(fullname)s DEFAULT"
+        )
+    return statements
+
+
+def partition_table(table: Table, scheme: Partitioning) -> None:
+    """
+    make the given table a partitioned parent, in place; only use this on a
+    copy of the model metadata, as the primary key is extended
+    """
+    column = table.columns[_partition_column(table, scheme)]
+    method = "HASH" if isinstance(scheme, HashPartitioning) else "RANGE"
+    table.dialect_kwargs["postgresql_partition_by"] = f"{method} ({column.name})"
+    primary_key = table.primary_key
+    if column.name not in primary_key.columns:
+        column.primary_key = True
+        table.append_constraint(
+            PrimaryKeyConstraint(
+                *primary_key.columns,
+                column,
+                name=cast(Optional[str], primary_key.name),
+            )
+        )
+    for statement in partition_statements(scheme):
+        event.listen(
+            table, "after_create", DDL(statement).execute_if(dialect="postgresql")
+        )
+
+
+def partitioned_metadata(
+    schemes: Optional[Mapping[str, Partitioning]] = None,
+    *,
+    metadata: Optional[MetaData] = None,
+) -> MetaData:
+    """
+    return a copy of metadata (default: the model metadata) with the tables in
+    schemes partitioned; schemes defaults to 16 hash partitions on person_id
+    for each of the FACT_TABLE_DATE_COLUMNS tables
+    """
+    if schemes is None:
+        schemes = {name: HashPartitioning() for name in FACT_TABLE_DATE_COLUMNS}
+    copy = copy_metadata(metadata)
+    for name, scheme in schemes.items():
+        partition_table(copy.tables[name], scheme)
+    return copy
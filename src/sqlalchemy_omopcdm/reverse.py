@@ -0,0 +1,231 @@
+"""Optional one-to-many (reverse) relationships on Person and VisitOccurrence
+
+The generated models only declare many-to-one relationships (e.g.
+Measurement.person). add_reverse_relationships() adds the matching
+collections, e.g. Person.measurements and
+VisitOccurrence.condition_occurrences, without changing the generated code.
+The collections are read-only (viewonly; write through the many-to-one side)
+and ordered by date. They load lazily by default, as eager collections on
+Person would fetch every event of a person whenever a Person is loaded (e.g.
+through measurement.person). reverse_load_options() returns selectinload()
+options for the queries which need the collections, so loading many persons
+or visits fetches each collection with one SELECT ... IN per batch of
+parents rather than one query per parent:
+
+    from sqlalchemy_omopcdm.reverse import (
+        add_reverse_relationships,
+        reverse_load_options,
+    )
+
+    add_reverse_relationships()
+    persons = session.scalars(
+        select(Person)
+        .where(...)
+        .options(*reverse_load_options(Person, ["measurements"]))
+    ).all()
+    persons[0].measurements  # already loaded
+"""
+
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.orm import InstrumentedAttribute, relationship, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from .omopcdm54 import (
+    ConditionEra,
+    ConditionOccurrence,
+    Death,
+    DeviceExposure,
+    DoseEra,
+    DrugEra,
+    DrugExposure,
+    Episode,
+    Measurement,
+    Note,
+    Observation,
+    ObservationPeriod,
+    OMOPCDMModelBase,
+    PayerPlanPeriod,
+    Person,
+    ProcedureOccurrence,
+    Specimen,
+    VisitDetail,
+    VisitOccurrence,
+)
+
+# (attribute name, child model, foreign key column, order by column)
+ReverseSpec = tuple[
+    str, type[OMOPCDMModelBase], InstrumentedAttribute[Any], InstrumentedAttribute[Any]
+]
+
+PERSON_COLLECTIONS: tuple[ReverseSpec, ...] = (
+    (
+        "condition_eras",
+        ConditionEra,
+        ConditionEra.person_id,
+        ConditionEra.condition_era_start_date,
+    ),
+    (
+        "condition_occurrences",
+        ConditionOccurrence,
+        ConditionOccurrence.person_id,
+        ConditionOccurrence.condition_start_date,
+    ),
+    ("deaths", Death, Death.person_id, Death.death_date),
+    (
+        "device_exposures",
+        DeviceExposure,
+        DeviceExposure.person_id,
+        DeviceExposure.device_exposure_start_date,
+    ),
+    ("dose_eras", DoseEra, DoseEra.person_id, DoseEra.dose_era_start_date),
+    ("drug_eras", DrugEra, DrugEra.person_id, DrugEra.drug_era_start_date),
+    (
+        "drug_exposures",
+        DrugExposure,
+        DrugExposure.person_id,
+        DrugExposure.drug_exposure_start_date,
+    ),
+    ("episodes", Episode, Episode.person_id, Episode.episode_start_date),
+    (
+        "measurements",
+        Measurement,
+        Measurement.person_id,
+        Measurement.measurement_date,
+    ),
+    ("notes", Note, Note.person_id, Note.note_date),
+    (
+        "observation_periods",
+        ObservationPeriod,
+        ObservationPeriod.person_id,
+        ObservationPeriod.observation_period_start_date,
+    ),
+    (
+        "observations",
+        Observation,
+        Observation.person_id,
+        Observation.observation_date,
+    ),
+    (
+        "payer_plan_periods",
+        PayerPlanPeriod,
+        PayerPlanPeriod.person_id,
+        PayerPlanPeriod.payer_plan_period_start_date,
+    ),
+    (
+        "procedure_occurrences",
+        ProcedureOccurrence,
+        ProcedureOccurrence.person_id,
+        ProcedureOccurrence.procedure_date,
+    ),
+    ("specimens", Specimen, Specimen.person_id, Specimen.specimen_date),
+    (
+        "visit_details",
+        VisitDetail,
+        VisitDetail.person_id,
+        VisitDetail.visit_detail_start_date,
+    ),
+    (
+        "visit_occurrences",
+        VisitOccurrence,
+        VisitOccurrence.person_id,
+        VisitOccurrence.visit_start_date,
+    ),
+)
+
+VISIT_OCCURRENCE_COLLECTIONS: tuple[ReverseSpec, ...] = (
+    (
+        "condition_occurrences",
+        ConditionOccurrence,
+        ConditionOccurrence.visit_occurrence_id,
+        ConditionOccurrence.condition_start_date,
+    ),
+    (
+        "device_exposures",
+        DeviceExposure,
+        DeviceExposure.visit_occurrence_id,
+        DeviceExposure.device_exposure_start_date,
+    ),
+    (
+        "drug_exposures",
+        DrugExposure,
+        DrugExposure.visit_occurrence_id,
+        DrugExposure.drug_exposure_start_date,
+    ),
+    (
+        "measurements",
+        Measurement,
+        Measurement.visit_occurrence_id,
+        Measurement.measurement_date,
+    ),
+    ("notes", Note, Note.visit_occurrence_id, Note.note_date),
+    (
+        "observations",
+        Observation,
+        Observation.visit_occurrence_id,
+        Observation.observation_date,
+    ),
+    (
+        "procedure_occurrences",
+        ProcedureOccurrence,
+        ProcedureOccurrence.visit_occurrence_id,
+        ProcedureOccurrence.procedure_date,
+    ),
+    (
+        "visit_details",
+        VisitDetail,
+        VisitDetail.visit_occurrence_id,
+        VisitDetail.visit_detail_start_date,
+    ),
+)
+
+REVERSE_RELATIONSHIPS: tuple[
+    tuple[type[OMOPCDMModelBase], tuple[ReverseSpec, ...]], ...
+] = (
+    (Person, PERSON_COLLECTIONS),
+    (VisitOccurrence, VISIT_OCCURRENCE_COLLECTIONS),
+)
+
+
+def add_reverse_relationships(lazy: str = "select") -> None:
+    """
+    add the one-to-many collections to Person and VisitOccurrence using the
+    given loader strategy; calling this again has no effect
+    """
+    for parent, collections in REVERSE_RELATIONSHIPS:
+        for name, child, foreign_key, order_by in collections:
+            if name in parent.__mapper__.relationships:
+                continue
+            setattr(
+                parent,
+                name,
+                relationship(
+                    child,
+                    foreign_keys=[foreign_key],
+                    order_by=order_by,
+                    viewonly=True,
+                    lazy=lazy,  # type: ignore[arg-type]
+                ),
+            )
+
+
+def reverse_load_options(
+    parent: type[OMOPCDMModelBase] = Person,
+    names: Optional[Iterable[str]] = None,
+) -> list[ORMOption]:
+    """
+    selectinload() options for the given collections (default: all) of
+    Person or VisitOccurrence, added by add_reverse_relationships()
+    """
+    collections = dict(REVERSE_RELATIONSHIPS).get(parent)
+    if collections is None:
+        raise ValueError(f"no reverse relationships on {parent.__name__}")
+    available = [name for name, _, _, _ in collections]
+    selected = available if names is None else list(names)
+    unknown = sorted(set(selected) - set(available))
+    if unknown:
+        raise ValueError(f"unknown {parent.__name__} collections: {unknown}")
+    missing = [name for name in selected if name not in parent.__mapper__.relationships]
+    if missing:
+        raise ValueError(f"call add_reverse_relationships() first, missing: {missing}")
+    return [selectinload(getattr(parent, name)) for name in selected]
@@ -0,0 +1,415 @@
+"""Ranked concept text search over concept names and synonyms
+
+Two backends share one API, search(term, domain_ids=..., vocabulary_ids=...,
+standard_concepts=..., limit=...) returning SearchHit rows, best first:
+
+- DatabaseConceptSearch queries the database. create_search_indexes()
+  provisions the text indexes it uses: on PostgreSQL the pg_trgm extension
+  and trigram GIN indexes on concept_name and concept_synonym_name (which
+  serve one ILIKE '%token%' per term token), ranked by similarity(); on
+  SQLite an FTS5 table (concept_fts) over names and synonyms, ranked by
+  bm25. Other dialects fall back to unindexed ILIKEs, ranked by name length.
+- InvertedIndexSearch is an in-process inverted index of name and synonym
+  tokens, for offline use, with each name and synonym indexed as a document
+  of its own (as in concept_fts). Every term token matches as a prefix; hits
+  are ranked by the inverse document frequency of the matched tokens,
+  favouring names starting with the term and short names.
+
+    search = DatabaseConceptSearch(connection)
+    search.search("type 2 diab", domain_ids=["Condition"], standard_concepts=["S"])
+
+In every backend, a concept matches when all tokens of the term match its
+name or one of its synonyms, in any order ("diabetes type 2" finds "Type 2
+diabetes mellitus"; ILIKE also matches tokens inside words).
+standard_concepts filters on standard_concept values, where None selects the
+non-standard concepts.
+"""
+
+# pylint: disable=too-many-arguments
+
+import math
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Protocol, Sequence
+
+from sqlalchemy import (
+    Connection,
+    Index,
+    MetaData,
+    Select,
+    column,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    table,
+    text,
+    union_all,
+)
+from sqlalchemy.schema import CreateIndex
+
+from .cache import Bind
+from .ddl import copy_metadata
+from .omopcdm54 import Concept, ConceptSynonym
+
+FTS_TABLE = "concept_fts"
+_FTS = table(FTS_TABLE, column("concept_id"), column("name"), column("rank"))
+
+# fetch size while streaming concepts into an InvertedIndexSearch
+FETCH_SIZE = 50_000
+
+_TOKEN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """a concept matching a search, with its backend-specific score"""
+
+    concept_id: int
+    concept_name: str
+    domain_id: str
+    vocabulary_id: str
+    standard_concept: Optional[str]
+    score: float
+
+
+class ConceptSearch(Protocol):  # pylint: disable=too-few-public-methods
+    """the search API shared by the backends"""
+
+    def search(
+        self,
+        term: str,
+        *,
+        domain_ids: Optional[Sequence[str]] = None,
+        vocabulary_ids: Optional[Sequence[str]] = None,
+        standard_concepts: Optional[Sequence[Optional[str]]] = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """the best matching concepts for the term"""
+
+
+def tokenize(value: str) -> list[str]:
+    """the lowercase word tokens of a name or search term"""
+    return _TOKEN.findall(value.lower())
+
+
+def search_indexes(metadata: Optional[MetaData] = None) -> list[Index]:
+    """
+    the PostgreSQL trigram indexes on concept_name and concept_synonym_name,
+    on a copy of metadata (default: the model metadata)
+    """
+    copy = copy_metadata(metadata)
+    return [
+        Index(
+            f"idx_{name}_{column_name}_trgm",
+            copy.tables[name].columns[column_name],
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+        for name, column_name in (
+            ("concept", "concept_name"),
+            ("concept_synonym", "concept_synonym_name"),
+        )
+    ]
+
+
+def create_search_indexes(
+    connection: Connection, *, metadata: Optional[MetaData] = None
+) -> None:
+    """
+    provision the text indexes for DatabaseConceptSearch: pg_trgm and the
+    trigram indexes on PostgreSQL, or the concept_fts table on SQLite, which
+    is (re)filled from concept and concept_synonym, so run this again after
+    loading a new vocabulary
+    """
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for index in search_indexes(metadata):
+            connection.execute(CreateIndex(index, if_not_exists=True))
+    elif connection.dialect.name == "sqlite":
+        connection.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                "USING fts5(concept_id UNINDEXED, name)"
+            )
+        )
+        connection.execute(delete(_FTS))
+        connection.execute(
+            insert(_FTS).from_select(
+                ["concept_id", "name"],
+                union_all(
+                    select(Concept.concept_id, Concept.concept_name),
+                    select(
+                        ConceptSynonym.concept_id, ConceptSynonym.concept_synonym_name
+                    ),
+                ),
+            )
+        )
+
+
+def _standard_filter(standard_concepts: Sequence[Optional[str]]) -> Any:
+    """the condition for the given standard_concept values (None: NULL)"""
+    values = [value for value in standard_concepts if value is not None]
+    conditions = [Concept.standard_concept.in_(values)] if values else []
+    if None in standard_concepts:
+        conditions.append(Concept.standard_concept.is_(None))
+    return or_(*conditions)
+
+
+def _fts_query(term: str) -> str:
+    """an FTS5 query matching every token of the term as a prefix"""
+    return " ".join(f'"{token}"*' for token in tokenize(term))
+
+
+def _like_pattern(token: str) -> str:
+    """a LIKE pattern matching the token anywhere, with \\ as escape"""
+    escaped = token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _token_likes(name: Any, term: str) -> list[Any]:
+    """one ILIKE condition per token of the term, all of which must match"""
+    return [name.ilike(_like_pattern(token), escape="\\") for token in tokenize(term)]
+
+
+class DatabaseConceptSearch:
+    """concept search in the database, see create_search_indexes"""
+
+    def __init__(self, bind: Bind) -> None:
+        self.bind = bind
+
+    def _matches(self, term: str) -> tuple[Any, Any]:
+        """
+        a subquery of (concept_id, score) matches and the score aggregate per
+        concept (higher is better), for the bind's dialect
+        """
+        bind = self.bind
+        dialect = (
+            bind.dialect if isinstance(bind, Connection) else bind.get_bind().dialect
+        ).name
+        if dialect == "sqlite":
+            matches = (
+                select(_FTS.c.concept_id, _FTS.c.rank.label("score"))
+                .where(
+                    text(f"{FTS_TABLE} MATCH :query").bindparams(query=_fts_query(term))
+                )
+                .subquery()
+            )
+            # bm25 ranks are negative, lower is better
+            return matches, func.min(matches.c.score) * -1
+        names = union_all(
+            select(Concept.concept_id, Concept.concept_name.label("name")).where(
+                *_token_likes(Concept.concept_name, term)
+            ),
+            select(
+                ConceptSynonym.concept_id, ConceptSynonym.concept_synonym_name
+            ).where(*_token_likes(ConceptSynonym.concept_synonym_name, term)),
+        ).subquery()
+        if dialect == "postgresql":
+            score = func.similarity(names.c.name, term)
+            matches = select(names.c.concept_id, score.label("score")).subquery()
+            return matches, func.max(matches.c.score)
+        matches = select(
+            names.c.concept_id, func.length(names.c.name).label("score")
+        ).subquery()
+        return matches, float(len(term)) / func.min(matches.c.score)
+
+    def statement(
+        self,
+        term: str,
+        *,
+        domain_ids: Optional[Sequence[str]] = None,
+        vocabulary_ids: Optional[Sequence[str]] = None,
+        standard_concepts: Optional[Sequence[Optional[str]]] = None,
+        limit: int = 20,
+    ) -> Select[Any]:
+        """the SELECT run by search()"""
+        matches, score = self._matches(term)
+        filters = []
+        if domain_ids is not None:
+            filters.append(Concept.domain_id.in_(domain_ids))
+        if vocabulary_ids is not None:
+            filters.append(Concept.vocabulary_id.in_(vocabulary_ids))
+        if standard_concepts is not None:
+            filters.append(_standard_filter(standard_concepts))
+        score = score.label("score")
+        return (
+            select(
+                Concept.concept_id,
+                Concept.concept_name,
+                Concept.domain_id,
+                Concept.vocabulary_id,
+                Concept.standard_concept,
+                score,
+            )
+            .join(matches, matches.c.concept_id == Concept.concept_id)
+            .where(*filters)
+            .group_by(
+                Concept.concept_id,
+                Concept.concept_name,
+                Concept.domain_id,
+                Concept.vocabulary_id,
+                Concept.standard_concept,
+            )
+            .order_by(score.desc(), Concept.concept_id)
+            .limit(limit)
+        )
+
+    def search(
+        self,
+        term: str,
+        *,
+        domain_ids: Optional[Sequence[str]] = None,
+        vocabulary_ids: Optional[Sequence[str]] = None,
+        standard_concepts: Optional[Sequence[Optional[str]]] = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """the best matching concepts for the term"""
+        if not tokenize(term):
+            return []
+        statement = self.statement(
+            term,
+            domain_ids=domain_ids,
+            vocabulary_ids=vocabulary_ids,
+            standard_concepts=standard_concepts,
+            limit=limit,
+        )
+        return [SearchHit(*row) for row in self.bind.execute(statement)]
+
+
+class InvertedIndexSearch:
+    """in-process inverted index of concept names and synonyms"""
+
+    def __init__(
+        self,
+        concepts: Iterable[tuple[int, str, str, str, Optional[str]]],
+        synonyms: Iterable[tuple[int, str]] = (),
+    ) -> None:
+        """
+        index (concept_id, concept_name, domain_id, vocabulary_id,
+        standard_concept) rows and (concept_id, synonym) rows
+        """
+        self._concepts: list[tuple[int, str, str, str, Optional[str]]] = []
+        # each name and synonym is a document of its own: its concept's
+        # position in _concepts, and its text
+        self._documents: list[tuple[int, str]] = []
+        positions: dict[int, int] = {}
+        for concept in concepts:
+            positions[concept[0]] = len(self._concepts)
+            self._concepts.append(concept)
+            self._documents.append((positions[concept[0]], concept[1]))
+        for concept_id, synonym in synonyms:
+            if concept_id in positions:
+                self._documents.append((positions[concept_id], synonym))
+        postings: defaultdict[str, set[int]] = defaultdict(set)
+        for document, (_, name) in enumerate(self._documents):
+            for token in tokenize(name):
+                postings[token].add(document)
+        self._tokens = sorted(postings)
+        self._postings = [frozenset(postings[token]) for token in self._tokens]
+
+    @classmethod
+    def from_database(
+        cls,
+        bind: Bind,
+        *,
+        synonyms: bool = True,
+        fetch_size: int = FETCH_SIZE,
+    ) -> "InvertedIndexSearch":
+        """index the concept table, and concept_synonym unless not synonyms"""
+        concepts = bind.execute(
+            select(
+                Concept.concept_id,
+                Concept.concept_name,
+                Concept.domain_id,
+                Concept.vocabulary_id,
+                Concept.standard_concept,
+            ).execution_options(yield_per=fetch_size)
+        )
+        synonym_rows: Iterable[Any] = ()
+        if synonyms:
+            synonym_rows = bind.execute(
+                select(
+                    ConceptSynonym.concept_id, ConceptSynonym.concept_synonym_name
+                ).execution_options(yield_per=fetch_size)
+            )
+        return cls(
+            (tuple(row) for row in concepts),  # type: ignore[misc]
+            (tuple(row) for row in synonym_rows),  # type: ignore[misc]
+        )
+
+    def __len__(self) -> int:
+        return len(self._concepts)
+
+    def _prefixed(self, prefix: str) -> tuple[set[int], float]:
+        """the documents with a token starting with prefix, and its idf"""
+        documents: set[int] = set()
+        position = bisect_left(self._tokens, prefix)
+        while position < len(self._tokens) and self._tokens[position].startswith(
+            prefix
+        ):
+            documents |= self._postings[position]
+            position += 1
+        idf = math.log((len(self._documents) + 1) / (len(documents) + 1)) + 1
+        return documents, idf
+
+    def _candidates(self, tokens: Sequence[str]) -> tuple[set[int], float]:
+        """
+        the documents matching every token as a prefix, and the summed idf of
+        the tokens
+        """
+        candidates: set[int] = set()
+        weight = 0.0
+        for number, token in enumerate(sorted(set(tokens), key=len, reverse=True)):
+            documents, idf = self._prefixed(token)
+            candidates = documents if number == 0 else candidates & documents
+            weight += idf
+            if not candidates:
+                break
+        return candidates, weight
+
+    def _accept(
+        self,
+        concept: tuple[int, str, str, str, Optional[str]],
+        domain_ids: Optional[Sequence[str]],
+        vocabulary_ids: Optional[Sequence[str]],
+        standard_concepts: Optional[Sequence[Optional[str]]],
+    ) -> bool:
+        """true if the concept passes the filters"""
+        return (
+            (domain_ids is None or concept[2] in domain_ids)
+            and (vocabulary_ids is None or concept[3] in vocabulary_ids)
+            and (standard_concepts is None or concept[4] in standard_concepts)
+        )
+
+    def search(
+        self,
+        term: str,
+        *,
+        domain_ids: Optional[Sequence[str]] = None,
+        vocabulary_ids: Optional[Sequence[str]] = None,
+        standard_concepts: Optional[Sequence[Optional[str]]] = None,
+        limit: int = 20,
+    ) -> list[SearchHit]:
+        """the best matching concepts for the term"""
+        candidates, weight = self._candidates(tokenize(term))
+        lowered = term.lower()
+        scores: dict[int, float] = {}
+        for document in candidates:
+            position, name = self._documents[document]
+            name = name.lower()
+            score = weight * (2.0 if name.startswith(lowered) else 1.0)
+            score /= 1.0 + math.log(1 + len(tokenize(name)))
+            scores[position] = max(score, scores.get(position, 0.0))
+        hits = [
+            SearchHit(*self._concepts[position], score=score)
+            for position, score in scores.items()
+            if self._accept(
+                self._concepts[position], domain_ids, vocabulary_ids, standard_concepts
+            )
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.concept_id))
+        return hits[:limit]
@@ -0,0 +1,143 @@
+"""Bulk mapping of local source codes through source_to_concept_map
+
+source_to_concept_map only has single-column indexes, and per-row lookups
+ignore the validity window of each mapping. SourceToConceptMapper loads the
+mappings of chosen source vocabularies once and maps batches of
+(source_code, event date) pairs in memory, using only the mappings whose
+valid_start_date <= event date <= valid_end_date. Deprecated mappings are
+kept, as their valid_end_date still applies to older events:
+
+    mapper = SourceToConceptMapper.from_database(connection, ["LOCAL_LAB"])
+    concept_ids = mapper.map("LOCAL_LAB", zip(codes, dates))  # 0 if unmapped
+    mapper.unmapped.most_common(20)
+
+Per code, the mappings are kept sorted by valid_start_date and the candidate
+windows are found by bisection. Every lookup without a valid mapping, for an
+unknown code or one outside its windows, is counted in unmapped.
+"""
+
+import datetime
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Iterable, Iterator, Sequence
+
+from sqlalchemy import select
+
+from .cache import Bind
+from .omopcdm54 import SourceToConceptMap
+
+# (source_vocabulary_id, source_code, target_concept_id, valid_start_date,
+# valid_end_date)
+SourceMappingRow = tuple[str, str, int, datetime.date, datetime.date]
+
+# source_to_concept_map rows per fetch while streaming
+FETCH_SIZE = 50_000
+
+
+class _Windows:  # pylint: disable=too-few-public-methods
+    """the mappings of one source code, sorted by start"""
+
+    __slots__ = ("starts", "ends", "targets")
+
+    def __init__(self, mappings: list[tuple[int, int, int]]) -> None:
+        mappings.sort()
+        self.starts = array("l", (start for start, _, _ in mappings))
+        self.ends = array("l", (end for _, end, _ in mappings))
+        self.targets = array("i", (target for _, _, target in mappings))
+
+    def valid(self, day: int) -> Iterator[int]:
+        """the targets of the windows containing the day (an ordinal)"""
+        for position in range(bisect_right(self.starts, day) - 1, -1, -1):
+            if self.ends[position] >= day:
+                yield self.targets[position]
+
+
+class SourceToConceptMapper:
+    """interval-aware source_to_concept_map lookups by (vocabulary, code)"""
+
+    def __init__(self, rows: Iterable[SourceMappingRow]) -> None:
+        grouped: dict[tuple[str, str], list[tuple[int, int, int]]] = {}
+        for vocabulary_id, code, target, start, end in rows:
+            grouped.setdefault((vocabulary_id, code), []).append(
+                (start.toordinal(), end.toordinal(), target)
+            )
+        self._windows = {key: _Windows(value) for key, value in grouped.items()}
+        self.unmapped: Counter[tuple[str, str]] = Counter()
+
+    @classmethod
+    def from_database(
+        cls,
+        bind: Bind,
+        source_vocabulary_ids: Sequence[str],
+        *,
+        fetch_size: int = FETCH_SIZE,
+    ) -> "SourceToConceptMapper":
+        """load the mappings of the given source vocabularies"""
+        return cls(
+            tuple(row)
+            for row in bind.execute(
+                select(
+                    SourceToConceptMap.source_vocabulary_id,
+                    SourceToConceptMap.source_code,
+                    SourceToConceptMap.target_concept_id,
+                    SourceToConceptMap.valid_start_date,
+                    SourceToConceptMap.valid_end_date,
+                )
+                .where(
+                    SourceToConceptMap.source_vocabulary_id.in_(source_vocabulary_ids)
+                )
+                .execution_options(yield_per=fetch_size)
+            )
+        )
+
+    def __len__(self) -> int:
+        """the number of distinct (source_vocabulary_id, source_code)"""
+        return len(self._windows)
+
+    def _targets(self, vocabulary_id: str, code: str, date: datetime.date) -> list[int]:
+        """the valid targets of a code on a date, counting it if there are none"""
+        windows = self._windows.get((vocabulary_id, code))
+        targets = list(windows.valid(date.toordinal())) if windows else []
+        if not targets:
+            self.unmapped[(vocabulary_id, code)] += 1
+        return targets
+
+    def map(
+        self,
+        source_vocabulary_id: str,
+        codes_and_dates: Iterable[tuple[str, datetime.date]],
+        *,
+        default: int = 0,
+    ) -> "array[int]":
+        """
+        one target concept per (source_code, event date), the mapping with
+        the latest valid_start_date if several are valid; default if none
+        """
+        mapped = array("i")
+        for code, date in codes_and_dates:
+            targets = self._targets(source_vocabulary_id, code, date)
+            mapped.append(targets[0] if targets else default)
+        return mapped
+
+    def map_all(
+        self,
+        source_vocabulary_id: str,
+        codes_and_dates: Iterable[tuple[str, datetime.date]],
+        *,
+        unmapped: bool = True,
+        default: int = 0,
+    ) -> tuple["array[int]", "array[int]"]:
+        """
+        every valid target of each (source_code, event date), as parallel
+        arrays of input positions and target concepts; pairs without a valid
+        mapping get one default row, or none without unmapped
+        """
+        positions, mapped = array("Q"), array("i")
+        for position, (code, date) in enumerate(codes_and_dates):
+            targets = self._targets(source_vocabulary_id, code, date)
+            if not targets and unmapped:
+                targets = [default]
+            positions.extend([position] * len(targets))
+            mapped.extend(targets)
+        return positions, mapped
@@ -0,0 +1,229 @@
+"""Patient timelines in one round trip
+
+A patient timeline needs the events of ten clinical tables and the names of
+their concepts. timeline_select() projects each table onto the same columns
+
+    (person_id, table_name, event_id, concept_id, start_date, end_date, value)
+
+and combines them with one UNION ALL, ordered by person and date, with the
+concept names joined in the same statement. patient_timeline() streams it as
+TimelineEvent objects, for one person or a batch of persons:
+
+    for event in patient_timeline(session, person_id):
+        print(event.start_date, event.table_name, event.concept_name)
+
+With a cache.VocabularyCache, the concept join is left out and the names are
+resolved from the cache, one get_many() per fetch_size rows. value is the
+quantity of drug exposures and value_as_number of measurements and
+observations; death uses person_id as its event id.
+"""
+
+import datetime
+import decimal
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from sqlalchemy import Date, Numeric, Select, cast, literal, null, select, union_all
+
+from .cache import Bind, VocabularyCache
+from .omopcdm54 import (
+    Concept,
+    ConditionOccurrence,
+    Death,
+    DeviceExposure,
+    DrugExposure,
+    Measurement,
+    Note,
+    Observation,
+    ProcedureOccurrence,
+    VisitDetail,
+    VisitOccurrence,
+)
+
+# timeline rows per fetch while streaming
+FETCH_SIZE = 1_000
+
+# per table: the model and its event id, concept id, start date, end date
+# (or None) and value (or None) columns
+TIMELINE_TABLES: dict[str, tuple[Any, Any, Any, Any, Optional[Any], Optional[Any]]] = {
+    "visit_occurrence": (
+        VisitOccurrence,
+        VisitOccurrence.visit_occurrence_id,
+        VisitOccurrence.visit_concept_id,
+        VisitOccurrence.visit_start_date,
+        VisitOccurrence.visit_end_date,
+        None,
+    ),
+    "visit_detail": (
+        VisitDetail,
+        VisitDetail.visit_detail_id,
+        VisitDetail.visit_detail_concept_id,
+        VisitDetail.visit_detail_start_date,
+        VisitDetail.visit_detail_end_date,
+        None,
+    ),
+    "condition_occurrence": (
+        ConditionOccurrence,
+        ConditionOccurrence.condition_occurrence_id,
+        ConditionOccurrence.condition_concept_id,
+        ConditionOccurrence.condition_start_date,
+        ConditionOccurrence.condition_end_date,
+        None,
+    ),
+    "drug_exposure": (
+        DrugExposure,
+        DrugExposure.drug_exposure_id,
+        DrugExposure.drug_concept_id,
+        DrugExposure.drug_exposure_start_date,
+        DrugExposure.drug_exposure_end_date,
+        DrugExposure.quantity,
+    ),
+    "procedure_occurrence": (
+        ProcedureOccurrence,
+        ProcedureOccurrence.procedure_occurrence_id,
+        ProcedureOccurrence.procedure_concept_id,
+        ProcedureOccurrence.procedure_date,
+        ProcedureOccurrence.procedure_end_date,
+        None,
+    ),
+    "measurement": (
+        Measurement,
+        Measurement.measurement_id,
+        Measurement.measurement_concept_id,
+        Measurement.measurement_date,
+        None,
+        Measurement.value_as_number,
+    ),
+    "observation": (
+        Observation,
+        Observation.observation_id,
+        Observation.observation_concept_id,
+        Observation.observation_date,
+        None,
+        Observation.value_as_number,
+    ),
+    "device_exposure": (
+        DeviceExposure,
+        DeviceExposure.device_exposure_id,
+        DeviceExposure.device_concept_id,
+        DeviceExposure.device_exposure_start_date,
+        DeviceExposure.device_exposure_end_date,
+        None,
+    ),
+    "note": (
+        Note,
+        Note.note_id,
+        Note.note_class_concept_id,
+        Note.note_date,
+        None,
+        None,
+    ),
+    "death": (
+        Death,
+        Death.person_id,
+        Death.cause_concept_id,
+        Death.death_date,
+        None,
+        None,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class TimelineEvent:  # pylint: disable=too-many-instance-attributes
+    """one event of a patient timeline"""
+
+    person_id: int
+    table_name: str
+    event_id: int
+    concept_id: Optional[int]
+    concept_name: Optional[str]
+    start_date: datetime.date
+    end_date: Optional[datetime.date]
+    value: Optional[decimal.Decimal]
+
+
+def _person_ids(person_ids: Union[int, Iterable[int]]) -> list[int]:
+    """one person_id or several, as a list"""
+    return [person_ids] if isinstance(person_ids, int) else list(person_ids)
+
+
+def _table_select(name: str, person_ids: list[int]) -> Select[Any]:
+    """the events of one table in the timeline projection"""
+    model, event_id, concept_id, start, end, value = TIMELINE_TABLES[name]
+    return select(
+        model.person_id.label("person_id"),
+        literal(name).label("table_name"),
+        event_id.label("event_id"),
+        concept_id.label("concept_id"),
+        start.label("start_date"),
+        (cast(null(), Date) if end is None else end).label("end_date"),
+        (cast(null(), Numeric) if value is None else cast(value, Numeric)).label(
+            "value"
+        ),
+    ).where(model.person_id.in_(person_ids))
+
+
+def _event(row: Any, concept_name: Optional[str]) -> TimelineEvent:
+    """a timeline_select() row as a TimelineEvent"""
+    person_id, table_name, event_id, concept_id, start, end, value, _ = row
+    return TimelineEvent(
+        person_id, table_name, event_id, concept_id, concept_name, start, end, value
+    )
+
+
+def timeline_select(
+    person_ids: Union[int, Iterable[int]],
+    *,
+    tables: Optional[Iterable[str]] = None,
+    concept_names: bool = True,
+) -> Select[Any]:
+    """
+    one UNION ALL of the events of the given persons in the given tables
+    (default: all of TIMELINE_TABLES), ordered by person and date, with the
+    concept names joined or as NULL
+    """
+    names = list(TIMELINE_TABLES if tables is None else tables)
+    unknown = sorted(set(names) - set(TIMELINE_TABLES))
+    if unknown:
+        raise ValueError(f"no timeline projection for tables: {unknown}")
+    selected = _person_ids(person_ids)
+    events = union_all(*(_table_select(name, selected) for name in names)).subquery()
+    if concept_names:
+        statement = select(events, Concept.concept_name).outerjoin(
+            Concept, Concept.concept_id == events.c.concept_id
+        )
+    else:
+        statement = select(events, cast(null(), Concept.concept_name.type))
+    return statement.order_by(
+        events.c.person_id,
+        events.c.start_date,
+        events.c.table_name,
+        events.c.event_id,
+    )
+
+
+def patient_timeline(
+    bind: Bind,
+    person_ids: Union[int, Iterable[int]],
+    *,
+    tables: Optional[Iterable[str]] = None,
+    cache: Optional[VocabularyCache] = None,
+    fetch_size: int = FETCH_SIZE,
+) -> Iterator[TimelineEvent]:
+    """
+    stream the timeline events of one person or several, in person and date
+    order, with the concept names joined or resolved from the cache
+    """
+    statement = timeline_select(
+        person_ids, tables=tables, concept_names=cache is None
+    ).execution_options(yield_per=fetch_size)
+    for rows in bind.execute(statement).partitions(fetch_size):
+        names: dict[Any, str] = {}
+        if cache is not None:
+            concepts = cache.get_many(
+                bind, Concept, {row[3] for row in rows if row[3] is not None}
+            )
+            names = {key: concept.concept_name for key, concept in concepts.items()}
+        for row in rows:
+            yield _event(row, row[7] if cache is None else names.get(row[3]))
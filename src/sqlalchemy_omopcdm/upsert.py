@@ -0,0 +1,152 @@
+"""Bulk upsert (INSERT ... ON CONFLICT) keyed on the declared primary keys
+
+The conflict target is each table's declared primary key: the xpk_* key, or
+one of the eh_composite_pk_* keys (see the README) on tables such as
+concept_relationship, source_to_concept_map, cohort and death. Rows are only
+rewritten when at least one non-key value differs, so re-sending unchanged
+rows causes no writes. Supported on PostgreSQL and SQLite.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Column, Connection, Table, literal_column, or_, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from .bulk import (
+    DEFAULT_CHUNK_SIZE,
+    ModelOrTable,
+    Row,
+    as_row_tuple,
+    chunked,
+    resolve_columns,
+    table_for,
+)
+
+# rows per "which keys already exist" query on SQLite, which cannot report
+# whether an upserted row was inserted or updated
+KEY_LOOKUP_BATCH = 500
+
+
+@dataclass
+class UpsertResult:
+    """row counts from bulk_upsert; unchanged rows are in neither count"""
+
+    inserted: int = 0
+    updated: int = 0
+
+
+def _statement(connection: Connection, table: Table, names: list[str]) -> Any:
+    """
+    the dialect-specific INSERT ... ON CONFLICT statement, returning one row
+    per inserted or updated row
+    """
+    if connection.dialect.name == "postgresql":
+        statement: Any = postgresql.insert(table)
+    elif connection.dialect.name == "sqlite":
+        statement = sqlite.insert(table)
+    else:
+        raise ValueError(
+            f"upsert is not supported on the {connection.dialect.name} dialect"
+        )
+    keys = list(table.primary_key.columns)
+    if connection.dialect.name == "postgresql":
+        # xmax is zero for freshly inserted row versions
+        returning: Any = literal_column("(xmax = 0)")
+    else:
+        returning = keys[0]
+    updates = [name for name in names if not table.columns[name].primary_key]
+    if not updates:
+        return statement.on_conflict_do_nothing(index_elements=keys).returning(
+            returning
+        )
+    return statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={name: statement.excluded[name] for name in updates},
+        where=or_(
+            *(
+                table.columns[name].is_distinct_from(statement.excluded[name])
+                for name in updates
+            )
+        ),
+    ).returning(returning)
+
+
+def _existing_keys(
+    connection: Connection,
+    keys: list[Column[Any]],
+    values: list[tuple[Any, ...]],
+) -> int:
+    """count how many of the given primary key values are already present"""
+    count = 0
+    for batch in chunked(values, KEY_LOOKUP_BATCH):
+        count += len(
+            connection.execute(select(*keys).where(tuple_(*keys).in_(batch))).all()
+        )
+    return count
+
+
+def _keyed(
+    rows: list[Row],
+    names: list[str],
+    positions: list[int],
+) -> dict[tuple[Any, ...], tuple[Any, ...]]:
+    """key row tuples by their primary key values, the last duplicate winning"""
+    batch = {}
+    for row in rows:
+        values = as_row_tuple(row, names)
+        batch[tuple(values[position] for position in positions)] = values
+    return batch
+
+
+def _upsert_batch(
+    connection: Connection,
+    statement: Any,
+    keys: list[Column[Any]],
+    names: list[str],
+    batch: dict[tuple[Any, ...], tuple[Any, ...]],
+) -> UpsertResult:
+    """upsert one batch of rows keyed by their primary key values"""
+    postgres = connection.dialect.name == "postgresql"
+    existing = 0 if postgres else _existing_keys(connection, keys, list(batch))
+    changed = connection.execute(
+        statement, [dict(zip(names, values)) for values in batch.values()]
+    ).all()
+    if postgres:
+        inserted = sum(1 for (was_inserted,) in changed if was_inserted)
+    else:
+        inserted = len(batch) - existing
+    return UpsertResult(inserted=inserted, updated=len(changed) - inserted)
+
+
+def bulk_upsert(
+    connection: Connection,
+    model: ModelOrTable,
+    rows: Iterable[Row],
+    *,
+    columns: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """
+    insert rows into the table of the given model, updating the rows whose
+    primary key already exists, in batches of chunk_size rows
+
+    rows are tuples (in column order) or dicts, as for bulk.bulk_load, and must
+    include every primary key column. Within a batch the last row for a key
+    wins. The caller owns the transaction.
+    """
+    table = table_for(model)
+    names = resolve_columns(table, columns)
+    keys = list(table.primary_key.columns)
+    missing = [key.name for key in keys if key.name not in names]
+    if missing:
+        raise ValueError(f"upsert rows must include the primary key: {missing}")
+    positions = [names.index(key.name) for key in keys]
+    statement = _statement(connection, table, names)
+    result = UpsertResult()
+    for chunk in chunked(rows, chunk_size):
+        batch = _keyed(chunk, names, positions)
+        counts = _upsert_batch(connection, statement, keys, names, batch)
+        result.inserted += counts.inserted
+        result.updated += counts.updated
+    return result
@@ -0,0 +1,531 @@
+"""OMOP Common Data Model v5.4 Standardized Vocabulary models
+
+The vocabulary tables (concept, vocabulary, domain, concept_class,
+concept_relationship, relationship, concept_synonym, concept_ancestor,
+source_to_concept_map and drug_strength) only reference one another, so they
+can be mapped without the clinical tables. This module defines them on a
+declarative base of their own, with the same tables, keys, indexes and
+relationships as the omopcdm54 models, for services which only look up
+concepts and should not pay for defining and configuring all of the models:
+
+    from sqlalchemy_omopcdm.vocabulary import Concept
+
+These are separate classes from sqlalchemy_omopcdm.Concept etc., so they
+cannot be mixed with the omopcdm54 models in one query or passed to the
+helper modules, which use the omopcdm54 models.
+"""
+
+# pylint: disable=duplicate-code
+# pylint: disable=too-few-public-methods
+# pylint: disable=unnecessary-pass
+# pylint: disable=unsubscriptable-object
+import datetime
+import decimal
+from typing import Optional
+
+from sqlalchemy import (
+    Date,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+class VocabularyModelBase(DeclarativeBase):
+    """
+    Base for the OMOP Common Data Model v5.4 Standardized Vocabulary Models
+    https://ohdsi.github.io/CommonDataModel/cdm54.html
+    """
+
+    pass
+
+
+class Concept(VocabularyModelBase):
+    """
+    The Standardized Vocabularies contains records, or Concepts, that uniquely
+    identify each fundamental unit of meaning used to express clinical
+    information in all domain tables of the CDM. Concepts are derived from
+    vocabularies, which represent clinical information across a domain (e.g.
+    conditions, drugs, procedures) through the use of codes and associated
+    descriptions. Some Concepts are designated Standard Concepts, meaning these
+    Concepts can be used as normative expressions of a clinical entity within
+    the OMOP Common Data Model and within standardized analytics. Each Standard
+    Concept belongs to one domain, which defines the location where the Concept
+    would be expected to occur within data tables of the CDM.
+
+    Concepts can represent broad categories (like 'Cardiovascular disease'),
+    detailed clinical elements ('Myocardial infarction of the anterolateral
+    wall') or modifying characteristics and attributes that define Concepts at
+    various levels of detail (severity of a disease, associated morphology,
+    etc.).
+
+    Records in the Standardized Vocabularies tables are derived from national
+    or international vocabularies such as SNOMED-CT, RxNorm, and LOINC, or
+    custom Concepts defined to cover various aspects of observational data
+    analysis.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#CONCEPT
+    """
+
+    __tablename__ = "concept"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["concept_class_id"],
+            ["concept_class.concept_class_id"],
+            name="fpk_concept_concept_class_id",
+        ),
+        ForeignKeyConstraint(
+            ["domain_id"], ["domain.domain_id"], name="fpk_concept_domain_id"
+        ),
+        ForeignKeyConstraint(
+            ["vocabulary_id"],
+            ["vocabulary.vocabulary_id"],
+            name="fpk_concept_vocabulary_id",
+        ),
+        PrimaryKeyConstraint("concept_id", name="xpk_concept"),
+        Index("idx_concept_class_id", "concept_class_id"),
+        Index("idx_concept_code", "concept_code"),
+        Index("idx_concept_concept_id", "concept_id"),
+        Index("idx_concept_domain_id", "domain_id"),
+        Index("idx_concept_vocabluary_id", "vocabulary_id"),
+    )
+
+    concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    concept_name: Mapped[str] = mapped_column(String(255))
+    domain_id: Mapped[str] = mapped_column(String(20))
+    vocabulary_id: Mapped[str] = mapped_column(String(20))
+    concept_class_id: Mapped[str] = mapped_column(String(20))
+    concept_code: Mapped[str] = mapped_column(String(50))
+    valid_start_date: Mapped[datetime.date] = mapped_column(Date)
+    valid_end_date: Mapped[datetime.date] = mapped_column(Date)
+    standard_concept: Mapped[Optional[str]] = mapped_column(String(1))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1))
+
+    concept_class: Mapped["ConceptClass"] = relationship(
+        "ConceptClass", foreign_keys=[concept_class_id]
+    )
+    domain: Mapped["Domain"] = relationship("Domain", foreign_keys=[domain_id])
+    vocabulary: Mapped["Vocabulary"] = relationship(
+        "Vocabulary", foreign_keys=[vocabulary_id]
+    )
+
+
+class ConceptClass(VocabularyModelBase):
+    """
+    The CONCEPT_CLASS table is a reference table, which includes a list of the
+    classifications used to differentiate Concepts within a given Vocabulary.
+    This reference table is populated with a single record for each Concept
+    Class.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#CONCEPT_CLASS
+    """
+
+    __tablename__ = "concept_class"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["concept_class_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_concept_class_concept_class_concept_id",
+        ),
+        PrimaryKeyConstraint("concept_class_id", name="xpk_concept_class"),
+        Index("idx_concept_class_class_id", "concept_class_id"),
+    )
+
+    concept_class_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    concept_class_name: Mapped[str] = mapped_column(String(255))
+    concept_class_concept_id: Mapped[int] = mapped_column(Integer)
+
+    concept_class_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[concept_class_concept_id]
+    )
+
+
+class Domain(VocabularyModelBase):
+    """
+    The DOMAIN table includes a list of OMOP-defined Domains the Concepts of
+    the Standardized Vocabularies can belong to. A Domain defines the set of
+    allowable Concepts for the standardized fields in the CDM tables. For
+    example, the "Condition" Domain contains Concepts that describe a condition
+    of a patient, and these Concepts can only be stored in the
+    condition_concept_id field of the CONDITION_OCCURRENCE and CONDITION_ERA
+    tables. This reference table is populated with a single record for each
+    Domain and includes a descriptive name for the Domain.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#DOMAIN
+    """
+
+    __tablename__ = "domain"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["domain_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_domain_domain_concept_id",
+        ),
+        PrimaryKeyConstraint("domain_id", name="xpk_domain"),
+        Index("idx_domain_domain_id", "domain_id"),
+    )
+
+    domain_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    domain_name: Mapped[str] = mapped_column(String(255))
+    domain_concept_id: Mapped[int] = mapped_column(Integer)
+
+    domain_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[domain_concept_id]
+    )
+
+
+class Vocabulary(VocabularyModelBase):
+    """
+    The VOCABULARY table includes a list of the Vocabularies collected from
+    various sources or created de novo by the OMOP community. This reference
+    table is populated with a single record for each Vocabulary source and
+    includes a descriptive name and other associated attributes for the
+    Vocabulary.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#VOCABULARY
+    """
+
+    __tablename__ = "vocabulary"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["vocabulary_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_vocabulary_vocabulary_concept_id",
+        ),
+        PrimaryKeyConstraint("vocabulary_id", name="xpk_vocabulary"),
+        Index("idx_vocabulary_vocabulary_id", "vocabulary_id"),
+    )
+
+    vocabulary_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    vocabulary_name: Mapped[str] = mapped_column(String(255))
+    vocabulary_concept_id: Mapped[int] = mapped_column(Integer)
+    vocabulary_reference: Mapped[Optional[str]] = mapped_column(String(255))
+    vocabulary_version: Mapped[Optional[str]] = mapped_column(String(255))
+
+    vocabulary_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[vocabulary_concept_id]
+    )
+
+
+class ConceptAncestor(VocabularyModelBase):
+    """
+    The CONCEPT_ANCESTOR table is designed to simplify observational analysis
+    by providing the complete hierarchical relationships between Concepts. Only
+    direct parent-child relationships between Concepts are stored in the
+    CONCEPT_RELATIONSHIP table. To determine higher level ancestry connections,
+    all individual direct relationships would have to be navigated at analysis
+    time. The CONCEPT_ANCESTOR table includes records for all parent-child
+    relationships, as well as grandparent-grandchild relationships and those of
+    any other level of lineage. Using the CONCEPT_ANCESTOR table allows for
+    querying for all descendants of a hierarchical concept. For example, drug
+    ingredients and drug products are all descendants of a drug class ancestor.
+
+    This table is entirely derived from the CONCEPT, CONCEPT_RELATIONSHIP and
+    RELATIONSHIP tables.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#CONCEPT_ANCESTOR
+    """
+
+    __tablename__ = "concept_ancestor"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["ancestor_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_concept_ancestor_ancestor_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["descendant_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_concept_ancestor_descendant_concept_id",
+        ),
+        PrimaryKeyConstraint(
+            "ancestor_concept_id",
+            "descendant_concept_id",
+            "min_levels_of_separation",
+            "max_levels_of_separation",
+            name="eh_composite_pk_concept_ancestor",
+        ),
+        Index("idx_concept_ancestor_id_1", "ancestor_concept_id"),
+        Index("idx_concept_ancestor_id_2", "descendant_concept_id"),
+    )
+
+    ancestor_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    descendant_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    min_levels_of_separation: Mapped[int] = mapped_column(Integer, primary_key=True)
+    max_levels_of_separation: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    ancestor_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[ancestor_concept_id]
+    )
+    descendant_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[descendant_concept_id]
+    )
+
+
+class ConceptSynonym(VocabularyModelBase):
+    """
+    The CONCEPT_SYNONYM table is used to store alternate names and descriptions
+    for Concepts.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#CONCEPT_SYNONYM
+    """
+
+    __tablename__ = "concept_synonym"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["concept_id"],
+            ["concept.concept_id"],
+            name="fpk_concept_synonym_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["language_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_concept_synonym_language_concept_id",
+        ),
+        PrimaryKeyConstraint(
+            "concept_id",
+            "concept_synonym_name",
+            "language_concept_id",
+            name="eh_composite_pk_concept_synonym",
+        ),
+        Index("idx_concept_synonym_id", "concept_id"),
+    )
+
+    concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    concept_synonym_name: Mapped[str] = mapped_column(String(1000), primary_key=True)
+    language_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    concept: Mapped["Concept"] = relationship("Concept", foreign_keys=[concept_id])
+    language_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[language_concept_id]
+    )
+
+
+class DrugStrength(VocabularyModelBase):
+    """
+    The DRUG_STRENGTH table contains structured content about the amount or
+    concentration and associated units of a specific ingredient contained
+    within a particular drug product. This table is supplemental information to
+    support standardized analysis of drug utilization.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#DRUG_STRENGTH
+    """
+
+    __tablename__ = "drug_strength"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["amount_unit_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_drug_strength_amount_unit_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["denominator_unit_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_drug_strength_denominator_unit_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["drug_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_drug_strength_drug_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["ingredient_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_drug_strength_ingredient_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["numerator_unit_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_drug_strength_numerator_unit_concept_id",
+        ),
+        PrimaryKeyConstraint(
+            "drug_concept_id",
+            "ingredient_concept_id",
+            "valid_start_date",
+            "valid_end_date",
+            name="eh_composite_pk_drug_strength",
+        ),
+        Index("idx_drug_strength_id_1", "drug_concept_id"),
+        Index("idx_drug_strength_id_2", "ingredient_concept_id"),
+    )
+
+    drug_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    ingredient_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    valid_start_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    valid_end_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    amount_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
+    amount_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
+    numerator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
+    numerator_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
+    denominator_value: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric)
+    denominator_unit_concept_id: Mapped[Optional[int]] = mapped_column(Integer)
+    box_size: Mapped[Optional[int]] = mapped_column(Integer)
+    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1))
+
+    amount_unit_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[amount_unit_concept_id]
+    )
+    denominator_unit_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[denominator_unit_concept_id]
+    )
+    drug_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[drug_concept_id]
+    )
+    ingredient_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[ingredient_concept_id]
+    )
+    numerator_unit_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[numerator_unit_concept_id]
+    )
+
+
+class Relationship(VocabularyModelBase):
+    """
+    The RELATIONSHIP table provides a reference list of all types of
+    relationships that can be used to associate any two concepts in the
+    CONCEPT_RELATIONSHP table.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#RELATIONSHIP
+    """
+
+    __tablename__ = "relationship"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["relationship_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_relationship_relationship_concept_id",
+        ),
+        PrimaryKeyConstraint("relationship_id", name="xpk_relationship"),
+        Index("idx_relationship_rel_id", "relationship_id"),
+    )
+
+    relationship_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    relationship_name: Mapped[str] = mapped_column(String(255))
+    is_hierarchical: Mapped[str] = mapped_column(String(1))
+    defines_ancestry: Mapped[str] = mapped_column(String(1))
+    reverse_relationship_id: Mapped[str] = mapped_column(String(20))
+    relationship_concept_id: Mapped[int] = mapped_column(Integer)
+
+    relationship_concept: Mapped["Concept"] = relationship("Concept")
+
+
+class SourceToConceptMap(VocabularyModelBase):
+    """
+    The source to concept map table is a legacy data structure within the OMOP
+    Common Data Model, recommended for use in ETL processes to maintain local
+    source codes which are not available as Concepts in the Standardized
+    Vocabularies, and to establish mappings for each source code into a
+    Standard Concept as target_concept_ids that can be used to populate the
+    Common Data Model tables. The SOURCE_TO_CONCEPT_MAP table is no longer
+    populated with content within the Standardized Vocabularies published to
+    the OMOP community.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#SOURCE_TO_CONCEPT_MAP
+    """
+
+    __tablename__ = "source_to_concept_map"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["source_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_source_to_concept_map_source_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["target_concept_id"],
+            ["concept.concept_id"],
+            name="fpk_source_to_concept_map_target_concept_id",
+        ),
+        ForeignKeyConstraint(
+            ["target_vocabulary_id"],
+            ["vocabulary.vocabulary_id"],
+            name="fpk_source_to_concept_map_target_vocabulary_id",
+        ),
+        PrimaryKeyConstraint(
+            "source_code",
+            "source_concept_id",
+            "source_vocabulary_id",
+            "target_concept_id",
+            "target_vocabulary_id",
+            "valid_start_date",
+            "valid_end_date",
+            name="eh_composite_pk_source_to_concept_map",
+        ),
+        Index("idx_source_to_concept_map_1", "source_vocabulary_id"),
+        Index("idx_source_to_concept_map_2", "target_vocabulary_id"),
+        Index("idx_source_to_concept_map_3", "target_concept_id"),
+        Index("idx_source_to_concept_map_c", "source_code"),
+    )
+
+    source_code: Mapped[str] = mapped_column(String(50), primary_key=True)
+    source_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    source_vocabulary_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    target_concept_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    target_vocabulary_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    valid_start_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    valid_end_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    source_code_description: Mapped[Optional[str]] = mapped_column(String(255))
+    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1))
+
+    source_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[source_concept_id]
+    )
+    target_concept: Mapped["Concept"] = relationship(
+        "Concept", foreign_keys=[target_concept_id]
+    )
+    target_vocabulary: Mapped["Vocabulary"] = relationship("Vocabulary")
+
+
+class ConceptRelationship(VocabularyModelBase):
+    """
+    The CONCEPT_RELATIONSHIP table contains records that define direct
+    relationships between any two Concepts and the nature or type of the
+    relationship. Each type of a relationship is defined in the RELATIONSHIP
+    table.
+
+    https://ohdsi.github.io/CommonDataModel/cdm54.html#CONCEPT_RELATIONSHIP
+    """
+
+    __tablename__ = "concept_relationship"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["concept_id_1"],
+            ["concept.concept_id"],
+            name="fpk_concept_relationship_concept_id_1",
+        ),
+        ForeignKeyConstraint(
+            ["concept_id_2"],
+            ["concept.concept_id"],
+            name="fpk_concept_relationship_concept_id_2",
+        ),
+        ForeignKeyConstraint(
+            ["relationship_id"],
+            ["relationship.relationship_id"],
+            name="fpk_concept_relationship_relationship_id",
+        ),
+        PrimaryKeyConstraint(
+            "concept_id_1",
+            "concept_id_2",
+            "relationship_id",
+            "valid_start_date",
+            "valid_end_date",
+            name="eh_composite_pk_concept_relationship",
+        ),
+        Index("idx_concept_relationship_id_1", "concept_id_1"),
+        Index("idx_concept_relationship_id_2", "concept_id_2"),
+        Index("idx_concept_relationship_id_3", "relationship_id"),
+    )
+
+    concept_id_1: Mapped[int] = mapped_column(Integer, primary_key=True)
+    concept_id_2: Mapped[int] = mapped_column(Integer, primary_key=True)
+    relationship_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    valid_start_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    valid_end_date: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    invalid_reason: Mapped[Optional[str]] = mapped_column(String(1))
+
+    concept: Mapped["Concept"] = relationship("Concept", foreign_keys=[concept_id_1])
+    concept_: Mapped["Concept"] = relationship("Concept", foreign_keys=[concept_id_2])
+    relationship_: Mapped["Relationship"] = relationship("Relationship")
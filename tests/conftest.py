@@ -0,0 +1,77 @@
+"""shared SQLite fixtures"""
+
+import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from sqlalchemy_omopcdm import Concept, Measurement, Note, OMOPCDMModelBase, Person
+
+DAY = datetime.date(2020, 1, 1)
+
+
+def person(person_id: int) -> Person:
+    """a person with only the required columns"""
+    return Person(
+        person_id=person_id,
+        gender_concept_id=0,
+        year_of_birth=1970,
+        race_concept_id=0,
+        ethnicity_concept_id=0,
+    )
+
+
+def concept(concept_id: int, name: str, **columns) -> Concept:
+    """a concept with only the required columns, and any others given"""
+    values = {
+        "domain_id": "Condition",
+        "vocabulary_id": "SNOMED",
+        "concept_class_id": "Clinical Finding",
+        "concept_code": str(concept_id),
+        "valid_start_date": DAY,
+        "valid_end_date": datetime.date(2099, 12, 31),
+        "standard_concept": "S",
+        **columns,
+    }
+    return Concept(concept_id=concept_id, concept_name=name, **values)
+
+
+@pytest.fixture(name="engine")
+def engine_fixture():
+    """an in-memory SQLite engine with every table created"""
+    engine = create_engine("sqlite://")
+    OMOPCDMModelBase.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """a session with one person, one measurement and one note"""
+    with Session(engine) as session:
+        session.add(person(1))
+        session.add(
+            Measurement(
+                measurement_id=1,
+                person_id=1,
+                measurement_concept_id=0,
+                measurement_date=DAY,
+                measurement_type_concept_id=0,
+            )
+        )
+        session.add(
+            Note(
+                note_id=1,
+                person_id=1,
+                note_date=DAY,
+                note_type_concept_id=0,
+                note_class_concept_id=0,
+                note_text="text",
+                encoding_concept_id=0,
+                language_concept_id=0,
+            )
+        )
+        session.commit()
+        session.expunge_all()
+        yield session
@@ -0,0 +1,52 @@
+"""bulk loading and phase-1 DDL honour schema_translate_map"""
+
+import datetime
+
+from sqlalchemy import create_engine, event, inspect, select, text
+
+from sqlalchemy_omopcdm import Concept
+from sqlalchemy_omopcdm.bulk import _copy_statement, bulk_load, table_for
+from sqlalchemy_omopcdm.ddl import create_tables
+
+DAY = datetime.date(2020, 1, 1)
+CONCEPT = (
+    1,
+    "name",
+    "Condition",
+    "SNOMED",
+    "Clinical Finding",
+    "1",
+    DAY,
+    DAY,
+    None,
+    None,
+)
+
+
+def test_copy_statement_translates_schema():
+    """the COPY target is qualified with the translated schema"""
+    engine = create_engine("sqlite://")
+    translated = engine.execution_options(schema_translate_map={None: "bench"})
+    for bind, target in ((engine, "concept"), (translated, "bench.concept")):
+        with bind.connect() as connection:
+            statement = _copy_statement(connection, table_for(Concept), ["x"], "")
+            assert statement == f"COPY {target} (x) FROM STDIN "
+
+
+def test_create_tables_translates_schema():
+    """create_tables checks and creates the tables in the translated schema"""
+    engine = create_engine("sqlite://")
+    event.listen(
+        engine,
+        "connect",
+        lambda dbapi_connection, _: dbapi_connection.execute(
+            "ATTACH DATABASE ':memory:' AS bench"
+        ),
+    )
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE main.concept (concept_id INTEGER)"))
+        connection.execution_options(schema_translate_map={None: "bench"})
+        create_tables(connection, [Concept])
+        bulk_load(connection, Concept, [CONCEPT])
+        assert inspect(connection).has_table("concept", schema="bench")
+        assert connection.scalars(select(Concept.concept_name)).all() == ["name"]
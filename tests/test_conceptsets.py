@@ -0,0 +1,112 @@
+"""concept set expressions resolve the same in SQL and in memory"""
+
+import pytest
+from conftest import DAY, concept
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from sqlalchemy_omopcdm import ConceptAncestor, ConceptRelationship
+from sqlalchemy_omopcdm.ancestry import ConceptAncestorGraph
+from sqlalchemy_omopcdm.conceptsets import (
+    ConceptSetCompiler,
+    ConceptSetExpression,
+    ConceptSetItem,
+)
+from sqlalchemy_omopcdm.mapsto import MAPPED_FROM, MAPS_TO, MapsToResolver
+
+# concept 1 has the descendants 2, 3 and 4, and 2 has 4; the source concepts
+# 10 and 11 map to 1 and 2
+ANCESTORS = {1: (1, 2, 3, 4), 2: (2, 4), 3: (3,), 4: (4,)}
+MAPPINGS = {10: 1, 11: 2}
+
+EXPRESSIONS = {
+    "concept": ([ConceptSetItem(3)], {3}),
+    "descendants": ([ConceptSetItem(1, include_descendants=True)], {1, 2, 3, 4}),
+    "excluded": (
+        [
+            ConceptSetItem(1, include_descendants=True),
+            ConceptSetItem(2, is_excluded=True, include_descendants=True),
+        ],
+        {1, 3},
+    ),
+    "mapped": (
+        [ConceptSetItem(1, include_descendants=True, include_mapped=True)],
+        {1, 2, 3, 4, 10, 11},
+    ),
+    "excluded mapped": (
+        [
+            ConceptSetItem(1, include_descendants=True, include_mapped=True),
+            ConceptSetItem(2, is_excluded=True, include_mapped=True),
+        ],
+        {1, 3, 4, 10},
+    ),
+}
+
+
+@pytest.fixture(name="connection")
+def connection_fixture(engine):
+    """the concepts, ancestry and mappings above"""
+    with Session(engine) as session:
+        session.add_all(
+            concept(concept_id, f"concept {concept_id}")
+            for concept_id in (*ANCESTORS, *MAPPINGS)
+        )
+        session.add_all(
+            ConceptAncestor(
+                ancestor_concept_id=ancestor,
+                descendant_concept_id=descendant,
+                min_levels_of_separation=0,
+                max_levels_of_separation=0,
+            )
+            for ancestor, descendants in ANCESTORS.items()
+            for descendant in descendants
+        )
+        session.add_all(
+            ConceptRelationship(
+                concept_id_1=concept_id_1,
+                concept_id_2=concept_id_2,
+                relationship_id=relationship_id,
+                valid_start_date=DAY,
+                valid_end_date=DAY,
+            )
+            for source, target in MAPPINGS.items()
+            for concept_id_1, concept_id_2, relationship_id in (
+                (source, target, MAPS_TO),
+                (target, source, MAPPED_FROM),
+            )
+        )
+        session.commit()
+    with engine.connect() as connection:
+        yield connection
+
+
+@pytest.fixture(name="compiler")
+def compiler_fixture(connection):
+    """a compiler with the graph and resolver loaded from the fixture"""
+    return ConceptSetCompiler(
+        ConceptAncestorGraph.from_database(connection),
+        MapsToResolver.from_database(connection, [MAPPED_FROM]),
+    )
+
+
+@pytest.mark.parametrize("name", sorted(EXPRESSIONS))
+def test_sql_and_memory_agree(connection, compiler, name):
+    """resolve() and evaluate() give the expected concepts"""
+    items, expected = EXPRESSIONS[name]
+    expression = ConceptSetExpression(tuple(items))
+    assert compiler.resolve(connection, expression) == expected
+    assert compiler.evaluate(expression) == expected
+
+
+def test_memoized_by_backend(engine, connection, compiler):
+    """results are memoized per backend, and a cache hit runs no query"""
+    # concept 99 is not in the concept table, so only the query drops it
+    expression = ConceptSetExpression((ConceptSetItem(99),))
+    assert compiler.resolve(connection, expression) == set()
+    assert compiler.evaluate(expression) == {99}
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    assert compiler.resolve(connection, expression) == set()
+    assert not statements
@@ -0,0 +1,23 @@
+"""the phased DDL leaves the model metadata usable for create_all()"""
+
+from sqlalchemy import create_engine, create_mock_engine, inspect
+
+from sqlalchemy_omopcdm import OMOPCDMModelBase
+from sqlalchemy_omopcdm.ddl import create_foreign_keys, create_primary_keys
+
+
+def test_create_all_after_constraint_phases():
+    """create_all() still creates the keys added by the ALTER TABLE phases"""
+    statements = []
+    postgresql = create_mock_engine(
+        "postgresql://", lambda statement, *_: statements.append(statement)
+    )
+    create_primary_keys(postgresql)
+    create_foreign_keys(postgresql)
+    assert statements
+
+    engine = create_engine("sqlite://")
+    OMOPCDMModelBase.metadata.create_all(engine)
+    inspector = inspect(engine)
+    assert inspector.get_pk_constraint("person")["constrained_columns"] == ["person_id"]
+    assert inspector.get_foreign_keys("measurement")
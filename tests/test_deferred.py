@@ -0,0 +1,38 @@
+"""deferred groups on column-only, aggregate and mixed selects"""
+
+# pylint: disable=not-callable
+import pytest
+from sqlalchemy import func, inspect, select
+
+from sqlalchemy_omopcdm import Note, Person
+from sqlalchemy_omopcdm.deferred import defer_groups, remove_deferred_groups
+
+STATEMENTS = {
+    "columns": select(Note.note_id),
+    "aggregate": select(func.count(Note.note_id)),
+    "mixed": select(Note.note_id, Person).join(
+        Person, Person.person_id == Note.person_id
+    ),
+    "text": select(Note.note_text),
+}
+
+
+@pytest.fixture(name="deferred_session")
+def deferred_session_fixture(session):
+    """the shared session, with defer_groups"""
+    listener = defer_groups(session)
+    yield session
+    remove_deferred_groups(session, listener)
+
+
+@pytest.mark.parametrize("name", sorted(STATEMENTS))
+def test_column_statements(deferred_session, name):
+    """selects without the Note entity are left alone"""
+    assert len(deferred_session.execute(STATEMENTS[name]).all()) == 1
+
+
+def test_entity_is_deferred(deferred_session):
+    """select(Note) leaves note_text unloaded"""
+    note = deferred_session.scalars(select(Note)).one()
+    assert "note_text" in inspect(note).unloaded
+    assert note.note_text == "text"
@@ -0,0 +1,165 @@
+"""condition_era and drug_era builds on a small SQLite fixture"""
+
+import datetime
+
+import pytest
+from conftest import concept, person
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from sqlalchemy_omopcdm import (
+    ConceptAncestor,
+    ConditionEra,
+    ConditionOccurrence,
+    DrugEra,
+    DrugExposure,
+)
+from sqlalchemy_omopcdm.eras import build_condition_eras, build_drug_eras
+
+# the ingredient and two of its products
+INGREDIENT, TABLET, SOLUTION = 100, 101, 102
+RXNORM = {"domain_id": "Drug", "vocabulary_id": "RxNorm"}
+
+
+def day(month: int, day_: int) -> datetime.date:
+    """a date in 2020"""
+    return datetime.date(2020, month, day_)
+
+
+def condition(occurrence_id, person_id, start, end=None, concept_id=200):
+    """a condition_occurrence row"""
+    return ConditionOccurrence(
+        condition_occurrence_id=occurrence_id,
+        person_id=person_id,
+        condition_concept_id=concept_id,
+        condition_start_date=start,
+        condition_end_date=end,
+        condition_type_concept_id=0,
+    )
+
+
+def exposure(exposure_id, person_id, drug_concept_id, start, end):
+    """a drug_exposure row"""
+    return DrugExposure(
+        drug_exposure_id=exposure_id,
+        person_id=person_id,
+        drug_concept_id=drug_concept_id,
+        drug_exposure_start_date=start,
+        drug_exposure_end_date=end,
+        drug_type_concept_id=0,
+    )
+
+
+@pytest.fixture(name="connection")
+def connection_fixture(engine):
+    """
+    person 1: conditions 20 days apart, then two months later; exposures to two
+    products of one ingredient, overlapping, then 10 days apart
+    person 2: one condition and one exposure
+    """
+    with Session(engine) as session:
+        session.add_all([person(1), person(2)])
+        session.add_all(
+            [
+                concept(
+                    INGREDIENT, "ingredient", **RXNORM, concept_class_id="Ingredient"
+                ),
+                concept(TABLET, "tablet", **RXNORM, concept_class_id="Clinical Drug"),
+                concept(
+                    SOLUTION, "solution", **RXNORM, concept_class_id="Clinical Drug"
+                ),
+            ]
+        )
+        session.add_all(
+            ConceptAncestor(
+                ancestor_concept_id=INGREDIENT,
+                descendant_concept_id=descendant,
+                min_levels_of_separation=0,
+                max_levels_of_separation=0,
+            )
+            for descendant in (INGREDIENT, TABLET, SOLUTION)
+        )
+        session.add_all(
+            [
+                condition(1, 1, day(1, 1), day(1, 10)),
+                condition(2, 1, day(1, 30), day(2, 5)),
+                condition(3, 1, day(4, 6)),
+                condition(4, 2, day(1, 1), day(1, 2)),
+                exposure(1, 1, TABLET, day(1, 1), day(1, 31)),
+                exposure(2, 1, SOLUTION, day(1, 21), day(2, 10)),
+                exposure(3, 1, TABLET, day(2, 20), day(3, 1)),
+                exposure(4, 2, TABLET, day(1, 1), day(1, 11)),
+            ]
+        )
+        session.commit()
+    with engine.begin() as connection:
+        yield connection
+
+
+def condition_eras(connection):
+    """the condition_era rows, by id"""
+    return connection.execute(
+        select(ConditionEra.__table__).order_by(ConditionEra.condition_era_id)
+    ).all()
+
+
+def drug_eras(connection):
+    """the drug_era rows, by id"""
+    return connection.execute(
+        select(DrugEra.__table__).order_by(DrugEra.drug_era_id)
+    ).all()
+
+
+def test_condition_eras(connection):
+    """occurrences within the persistence window merge into one era"""
+    assert build_condition_eras(connection) == 3
+    assert condition_eras(connection) == [
+        (1, 1, 200, day(1, 1), day(2, 5), 2),
+        (2, 1, 200, day(4, 6), day(4, 7), 1),
+        (3, 2, 200, day(1, 1), day(1, 2), 1),
+    ]
+
+
+def test_condition_gap_days(connection):
+    """a shorter persistence window splits the first era"""
+    assert build_condition_eras(connection, gap_days=10) == 4
+    assert [row[3:5] for row in condition_eras(connection)][:2] == [
+        (day(1, 1), day(1, 10)),
+        (day(1, 30), day(2, 5)),
+    ]
+
+
+def test_drug_eras(connection):
+    """
+    overlapping exposures to products of one ingredient merge before the
+    persistence window is applied, and gap_days counts the unexposed days
+    """
+    assert build_drug_eras(connection) == 2
+    assert drug_eras(connection) == [
+        (1, 1, INGREDIENT, day(1, 1), day(3, 1), 3, 10),
+        (2, 2, INGREDIENT, day(1, 1), day(1, 11), 1, 0),
+    ]
+
+
+def test_drug_gap_days(connection):
+    """a persistence window shorter than the gap splits the era"""
+    assert build_drug_eras(connection, gap_days=5) == 3
+    assert [row[3:] for row in drug_eras(connection)][:2] == [
+        (day(1, 1), day(2, 10), 2, 0),
+        (day(2, 20), day(3, 1), 1, 0),
+    ]
+
+
+def test_incremental_rebuild(connection):
+    """person_ids rebuilds only those persons, numbering new eras after the last"""
+    build_condition_eras(connection)
+    connection.execute(
+        delete(ConditionOccurrence).where(
+            ConditionOccurrence.condition_occurrence_id == 3
+        )
+    )
+    assert build_condition_eras(connection, person_ids=[1], batch_size=1) == 1
+    assert condition_eras(connection) == [
+        (3, 2, 200, day(1, 1), day(1, 2), 1),
+        (4, 1, 200, day(1, 1), day(2, 5), 2),
+    ]
@@ -0,0 +1,77 @@
+"""loading profiles on entity, column-only, aggregate and mixed selects"""
+
+# pylint: disable=not-callable
+
+import pytest
+from conftest import DAY, concept
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import InvalidRequestError
+
+from sqlalchemy_omopcdm import Measurement, Person
+from sqlalchemy_omopcdm.loading import (
+    PROFILES,
+    apply_loading_profile,
+    remove_loading_profile,
+)
+
+STATEMENTS = {
+    "columns": select(Measurement.measurement_id),
+    "aggregate": select(func.count(Measurement.measurement_id)),
+    "mixed": select(Measurement.person_id, Person).join(
+        Person, Person.person_id == Measurement.person_id
+    ),
+    "entity": select(Measurement),
+}
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+@pytest.mark.parametrize("name", sorted(STATEMENTS))
+def test_profile_statements(session, profile, name):
+    """every profile leaves every kind of select runnable"""
+    listener = apply_loading_profile(session, profile)
+    try:
+        assert len(session.execute(STATEMENTS[name]).all()) == 1
+    finally:
+        remove_loading_profile(session, listener)
+
+
+def test_raise(session):
+    """the raise profile raises on a lazy load"""
+    apply_loading_profile(session, "raise")
+    measurement = session.scalars(select(Measurement)).one()
+    with pytest.raises(InvalidRequestError):
+        _ = measurement.person
+
+
+def test_selectin_concepts(engine, session):
+    """selectin_concepts loads the concepts of N rows in a fixed number of SELECTs"""
+    for number in range(2, 22):
+        session.add(concept(number, f"concept {number}"))
+        session.add(
+            Measurement(
+                measurement_id=number,
+                person_id=1,
+                measurement_concept_id=number,
+                measurement_date=DAY,
+                measurement_type_concept_id=0,
+            )
+        )
+    session.commit()
+    apply_loading_profile(session, "selectin_concepts")
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    counts = []
+    for rows in (2, 20):
+        session.expunge_all()
+        statements.clear()
+        measurements = session.scalars(
+            select(Measurement).where(Measurement.measurement_id > 1).limit(rows)
+        ).all()
+        names = {
+            measurement.measurement_concept.concept_name for measurement in measurements
+        }
+        assert len(names) == rows
+        counts.append(len(statements))
+    assert counts[0] == counts[1] < 10
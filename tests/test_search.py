@@ -0,0 +1,62 @@
+"""the database and in-memory search backends agree"""
+
+import pytest
+from conftest import concept
+from sqlalchemy.orm import Session
+
+from sqlalchemy_omopcdm import ConceptSynonym
+from sqlalchemy_omopcdm.search import (
+    DatabaseConceptSearch,
+    InvertedIndexSearch,
+    create_search_indexes,
+)
+
+CONCEPTS = {
+    1: ("Hypertension", ["High blood pressure"]),
+    2: ("Type 2 diabetes mellitus", ["Diabetes mellitus type II"]),
+    3: ("Type 1 diabetes mellitus", []),
+    4: ("Blood pressure taking", []),
+}
+
+QUERIES = {
+    "hypertension": [1],
+    "high blood": [1],
+    "hypertension blood": [],
+    "diabetes type 2": [2],
+    "diab mell": [2, 3],
+    "type ii": [2],
+    "blood pressure": [1, 4],
+    "pressure hyper": [],
+}
+
+
+@pytest.fixture(name="backends")
+def backends_fixture(engine):
+    """a DatabaseConceptSearch (FTS5) and an InvertedIndexSearch of CONCEPTS"""
+    with Session(engine) as session:
+        for concept_id, (name, synonyms) in CONCEPTS.items():
+            session.add(concept(concept_id, name))
+            session.add_all(
+                ConceptSynonym(
+                    concept_id=concept_id,
+                    concept_synonym_name=synonym,
+                    language_concept_id=0,
+                )
+                for synonym in synonyms
+            )
+        session.commit()
+    with engine.begin() as connection:
+        create_search_indexes(connection)
+    with engine.connect() as connection:
+        yield (
+            DatabaseConceptSearch(connection),
+            InvertedIndexSearch.from_database(connection),
+        )
+
+
+@pytest.mark.parametrize("term", sorted(QUERIES))
+def test_backends_agree(backends, term):
+    """both backends find the concepts with a name or synonym matching the term"""
+    for backend in backends:
+        hits = backend.search(term)
+        assert sorted(hit.concept_id for hit in hits) == QUERIES[term]
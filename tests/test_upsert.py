@@ -0,0 +1,65 @@
+"""bulk_upsert inserted and updated counts on SQLite"""
+
+import pytest
+from conftest import DAY
+from sqlalchemy import create_mock_engine, select
+
+from sqlalchemy_omopcdm import ConceptRelationship, Vocabulary
+from sqlalchemy_omopcdm.upsert import UpsertResult, bulk_upsert
+
+VOCABULARIES = [("SNOMED", "SNOMED CT", 44819097), ("RxNorm", "RxNorm", 44819104)]
+
+
+def test_counts(engine):
+    """new rows are inserted, changed rows updated and unchanged rows skipped"""
+    with engine.begin() as connection:
+        columns = ["vocabulary_id", "vocabulary_name", "vocabulary_concept_id"]
+        assert bulk_upsert(
+            connection, Vocabulary, VOCABULARIES, columns=columns
+        ) == UpsertResult(inserted=2)
+        rows = [
+            ("SNOMED", "SNOMED CT", 44819097),
+            ("RxNorm", "RxNorm (NLM)", 44819104),
+            ("LOINC", "LOINC", 44819102),
+        ]
+        assert bulk_upsert(
+            connection, Vocabulary, rows, columns=columns, chunk_size=2
+        ) == UpsertResult(inserted=1, updated=1)
+        assert connection.execute(
+            select(Vocabulary.vocabulary_id, Vocabulary.vocabulary_name).order_by(
+                Vocabulary.vocabulary_id
+            )
+        ).all() == [
+            ("LOINC", "LOINC"),
+            ("RxNorm", "RxNorm (NLM)"),
+            ("SNOMED", "SNOMED CT"),
+        ]
+
+
+def test_composite_key(engine):
+    """tables with a composite primary key upsert on all of its columns"""
+    row = {
+        "concept_id_1": 1,
+        "concept_id_2": 2,
+        "relationship_id": "Maps to",
+        "valid_start_date": DAY,
+        "valid_end_date": DAY,
+    }
+    with engine.begin() as connection:
+        assert bulk_upsert(connection, ConceptRelationship, [row]) == UpsertResult(1, 0)
+        assert bulk_upsert(
+            connection, ConceptRelationship, [{**row, "invalid_reason": "D"}]
+        ) == UpsertResult(0, 1)
+
+
+def test_missing_key(engine):
+    """rows without the primary key columns are rejected"""
+    with engine.begin() as connection, pytest.raises(ValueError):
+        bulk_upsert(connection, Vocabulary, [("SNOMED",)], columns=["vocabulary_name"])
+
+
+def test_unsupported_dialect():
+    """dialects without INSERT ... ON CONFLICT raise ValueError"""
+    mssql = create_mock_engine("mssql://", lambda *_: None)
+    with pytest.raises(ValueError):
+        bulk_upsert(mssql, Vocabulary, VOCABULARIES)
@@ -0,0 +1,58 @@
+"""the standalone vocabulary models match the omopcdm54 models"""
+
+import os
+import pathlib
+import subprocess  # nosec B404
+import sys
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from sqlalchemy_omopcdm import OMOPCDMModelBase
+from sqlalchemy_omopcdm.groups import VOCABULARY_TABLES
+from sqlalchemy_omopcdm.vocabulary import VocabularyModelBase
+
+SRC = pathlib.Path(__file__).parent.parent / "src"
+
+
+def test_vocabulary_tables():
+    """the vocabulary module maps exactly the vocabulary tables"""
+    assert set(VocabularyModelBase.metadata.tables) == set(VOCABULARY_TABLES)
+
+
+@pytest.mark.parametrize("name", VOCABULARY_TABLES)
+def test_same_ddl(name):
+    """each vocabulary table has the same DDL as its omopcdm54 model"""
+    dialect = postgresql.dialect()
+    tables = (
+        VocabularyModelBase.metadata.tables[name],
+        OMOPCDMModelBase.metadata.tables[name],
+    )
+    vocabulary, model = (
+        (
+            str(CreateTable(table).compile(dialect=dialect)),
+            sorted(
+                (index.name, tuple(index.columns.keys())) for index in table.indexes
+            ),
+        )
+        for table in tables
+    )
+    assert vocabulary == model
+
+
+def test_does_not_import_the_models():
+    """importing the vocabulary models leaves omopcdm54 unloaded"""
+    snippet = (
+        "import sys; from sqlalchemy.orm import configure_mappers; "
+        "from sqlalchemy_omopcdm.vocabulary import Concept; configure_mappers(); "
+        "print('sqlalchemy_omopcdm.omopcdm54' in sys.modules)"
+    )
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", snippet],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+    )
+    assert result.stdout.strip() == "False"